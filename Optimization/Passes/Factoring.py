@@ -0,0 +1,177 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ OPTIMIZATION :: Left-Factoring Pass -------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Definition    import Definition
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Negative      import Negative
+from ... Preparsing.Nodes.Node          import Node
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Sequence      import Sequence
+from ... Preparsing.Nodes.Star          import Star
+
+from  . Pass import Pass
+
+from typing import Any
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------- CLASS :: Left-Factoring Pass ----------------------------------
+# --------------------------------------------------------------------------------------------------
+class Factoring(Pass):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Split an Item into its Binding Name and Expression --------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def binding(item: Expression) -> tuple[str | None, Expression]:
+
+        if isinstance(item, Assignment):
+            return item.identifier.token.literal, item.expression
+
+        return None, item
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Structural Key of the Leading Item of an Alternative -------------
+    # ------------------------------------------------------------------------------------------
+    def head(self, expression: Expression) -> Any:
+
+        if not (items := self.items(expression)):
+            return None
+
+        name, leading = self.binding(items[0])
+        body = leading
+
+        while isinstance(body, Parenthetical) and body.output is None:
+            body = body.expression
+
+        if name is None and isinstance(body, (Star, Plus)):
+            return None   # unbound repetitions may bind their captures, so leave them in place
+
+        if isinstance(body, Cut):
+            return None   # a shared cut would commit the merged choice rather than each alternative
+
+        return self.interner.key(leading)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ HELPER :: Names Bound by a List of Items ------------------------
+    # ------------------------------------------------------------------------------------------
+    def bound(self, items: list[Expression]) -> set[str]:
+        return { name for item in items if (name := self.binding(item)[0]) }
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Allocate a Name Unused by a Set of Alternatives ----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def fresh(base: str, used: set[str]) -> str:
+
+        name, suffix = base, 0
+
+        while name in used:
+            name, suffix = f"{base}_{suffix + 1}", suffix + 1
+
+        used.add(name)
+        return name
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- METHOD :: Factor Runs of Alternatives Sharing a Leading Item --------------
+    # ------------------------------------------------------------------------------------------
+    def factor(self,
+        alternatives: list[tuple[Expression, Output | None]]
+    ) -> list[tuple[Expression, Output | None]]:
+
+        factored, start = [], 0
+
+        while start < len(alternatives):
+
+            head, end = self.head(alternatives[start][0]), start + 1
+
+            while head is not None and end < len(alternatives) and (
+                self.head(alternatives[end][0]) == head
+            ):
+                end += 1
+
+            if end - start > 1:
+                factored.append(self.merge(alternatives[start:end]))
+
+            else:
+                factored.append(alternatives[start])
+
+            start = end
+
+        return factored
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------- METHOD :: Merge a Run of Alternatives into a Prefix and a Nested Choice ---------
+    # ------------------------------------------------------------------------------------------
+    def merge(self,
+        alternatives: list[tuple[Expression, Output | None]]
+    ) -> tuple[Expression, None]:
+
+        splits = [ (self.items(e), o) for e, o in alternatives ]
+        used   = set().union(*(self.bound(items) | self.references(o) for items, o in splits))
+
+        names  = { self.binding(items[0])[0] for items, _ in splits } - { None }
+        clash  = any(self.bound(items[1:]) & names for items, _ in splits)
+
+        first  = self.binding(splits[0][0][0])[1]
+        shared = names.pop() if len(names) == 1 and not clash else self.fresh('prefix', used)
+
+        branches = []
+
+        for items, output in splits:
+
+            name, rest = self.binding(items[0])[0], items[1:]
+
+            if output is not None:
+
+                if name is not None and name != shared:
+                    output = self.rename(output, name, shared)
+
+                branches.append((Concatenation(tuple(rest)), output))
+                continue
+
+            like, values = items[0].start, [ shared ]
+
+            for index, item in enumerate(rest):
+
+                if isinstance(item, (Cut, Negative)):    # a lookahead consumes nothing, so binds nothing
+                    continue
+
+                if (bound := self.binding(item)[0]) is None:
+                    bound = self.fresh('item', used)
+                    rest[index] = Assignment(self.identifier(bound, item.start), item)
+
+                values.append(bound)
+
+            if len(values) == 1:
+                output = Output(self.identifier(shared, like))
+
+            else:
+                output = Output(Sequence(*(self.identifier(v, like) for v in values)))
+
+            branches.append((Concatenation(tuple(rest)), output))
+
+        prefix = Assignment(self.identifier(shared, first.start), first)
+        choice = Alternation(tuple(Production(e, o) for e, o in self.factor(branches)))
+
+        return Concatenation((prefix, choice)), None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Definition -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_definition(self, node: Definition) -> Node:
+
+        return self.productions(node, self.factor(self.alternatives(node.productions)))
\ No newline at end of file
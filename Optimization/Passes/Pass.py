@@ -0,0 +1,294 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- OPTIMIZATION :: Abstract-Base Grammar Pass ---------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Visitors.Transformer import Transformer
+from ... Preparsing.Visitors.Interner    import Interner
+from ... Preparsing.Visitors.Shape       import Shape
+from ... Preparsing.Lexer.Tokentype      import Tokentype
+from ... Preparsing.Lexer.Token          import Token
+
+from ... Preparsing.Nodes.Alternation    import Alternation
+from ... Preparsing.Nodes.Assignment     import Assignment
+from ... Preparsing.Nodes.Call           import Call
+from ... Preparsing.Nodes.Concatenation  import Concatenation
+from ... Preparsing.Nodes.Cut            import Cut
+from ... Preparsing.Nodes.Definition     import Definition
+from ... Preparsing.Nodes.Expression     import Expression
+from ... Preparsing.Nodes.Gather         import Gather
+from ... Preparsing.Nodes.Identifier     import Identifier
+from ... Preparsing.Nodes.Negative       import Negative
+from ... Preparsing.Nodes.Node           import Node
+from ... Preparsing.Nodes.Number         import Number
+from ... Preparsing.Nodes.Optional       import Optional
+from ... Preparsing.Nodes.Output         import Output
+from ... Preparsing.Nodes.Parenthetical  import Parenthetical
+from ... Preparsing.Nodes.Plus           import Plus
+from ... Preparsing.Nodes.Production     import Production
+from ... Preparsing.Nodes.Root           import Root
+from ... Preparsing.Nodes.Sequence       import Sequence
+from ... Preparsing.Nodes.Star           import Star
+from ... Preparsing.Nodes.String         import String
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ CLASS :: Abstract-Base Grammar Pass -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Pass(Shape, Transformer):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    rules    : dict[str, Definition]
+    interner : Interner
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+
+        self.rules    = {}
+        self.interner = Interner()    # structural keys, so equal subexpressions compare equal
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- METHOD :: Run the Pass over a Grammar --------------------------
+    # ------------------------------------------------------------------------------------------
+    def run(self, root: Root) -> Root:
+
+        self.rules, self.interner = root.rules(), Interner()
+        return root.accept(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- HELPER :: Synthesize an Identifier ---------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def identifier(literal: str, like: Token) -> Identifier:
+        return Identifier(Token(Tokentype.IDENTIFIER, literal, *like.context, like.origin))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- HELPER :: Names Referenced by an Output Expression -------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def references(node: Node | None) -> set[str]:
+
+        match node:
+
+            case Identifier():
+                return { node.token.literal }
+
+            case Output() | Star():
+                return Pass.references(node.expression)
+
+            case Call():
+                return Pass.references(node.identifier) | Pass.references(node.parameters)
+
+            case Sequence():
+                return set().union(*map(Pass.references, node.elements))
+
+        return set()
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- HELPER :: Rename a Reference within an Output Expression ----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def rename(node: Node | None, old: str, new: str) -> Node | None:
+
+        match node:
+
+            case Identifier() if node.token.literal == old:
+                return Pass.identifier(new, node.token)
+
+            case Output():
+                return Output(Pass.rename(node.expression, old, new))
+
+            case Star():
+                return Star(Pass.rename(node.expression, old, new))
+
+            case Call():
+                return Call(node.identifier, Pass.rename(node.parameters, old, new))
+
+            case Sequence():
+                return Sequence(*(Pass.rename(e, old, new) for e in node.elements))
+
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------ HELPER :: Definition over Rewritten Alternatives, Kept when they are its Own ------
+    # ------------------------------------------------------------------------------------------
+    def productions(self,
+        node: Definition, alternatives: list[tuple[Expression, Output | None]]
+    ) -> Definition:
+
+        rewritten = [ (expression.accept(self), output) for expression, output in alternatives ]
+        original  = node.productions.elements
+
+        if len(rewritten) == len(original) and all(
+            p.expression is expression and p.output is output for p, (expression, output) in zip(original, rewritten)
+        ):
+            return node    # neither regrouped nor changed below, so shared whole
+
+        return Definition(node.signature, Sequence(*(Production(e, o) for e, o in rewritten)))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: Alternation) -> Node:
+
+        expressions = self.transform(node.expressions)
+        return node if expressions is node.expressions else Alternation(expressions)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Assignment -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_assignment(self, node: Assignment) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Assignment(node.identifier, expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_concatenation(self, node: Concatenation) -> Node:
+
+        expressions = self.transform(node.expressions)
+        return node if expressions is node.expressions else Concatenation(expressions)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------------- VISITOR :: Visit Cut ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_cut(self, node: Cut) -> Node:
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Definition -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_definition(self, node: Definition) -> Node:
+
+        productions = node.productions.accept(self)
+        return node if productions is node.productions else Definition(node.signature, productions)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Gather ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_gather(self, node: Gather) -> Node:
+
+        expression, separator = node.expression.accept(self), node.separator.accept(self)
+
+        if expression is node.expression and separator is node.separator:
+            return node
+
+        return Gather(expression, separator)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_identifier(self, node: Identifier) -> Node:
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Negative --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_negative(self, node: Negative) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Negative(expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Number ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_number(self, node: Number) -> Node:
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_optional(self, node: Optional) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Optional(expression, node.output)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: Parenthetical) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Parenthetical(expression, node.output)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_plus(self, node: Plus) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Plus(expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_production(self, node: Production) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Production(expression, node.output)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Root ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_root(self, node: Root) -> Node:
+
+        definitions = node.definitions.accept(self)
+        return node if definitions is node.definitions else Root(node.origin, definitions)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Sequence --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_sequence(self, node: Sequence) -> Node:
+
+        elements = self.transform(node.elements)
+        return node if elements is node.elements else Sequence(*elements)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_star(self, node: Star) -> Node:
+
+        expression = node.expression.accept(self)
+        return node if expression is node.expression else Star(expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit String ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_string(self, node: String) -> Node:
+        return node
\ No newline at end of file
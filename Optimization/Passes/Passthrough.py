@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- OPTIMIZATION :: Passthrough-Collapse Pass ----------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Node          import Node
+from ... Preparsing.Nodes.Optional      import Optional
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Root          import Root
+
+from  . Pass import Pass
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Passthrough-Collapse Pass -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Passthrough(Pass):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    aliases : dict[str, Expression]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+
+        super().__init__()
+        self.aliases = {}
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- METHOD :: Run the Pass over a Grammar --------------------------
+    # ------------------------------------------------------------------------------------------
+    def run(self, root: Root) -> Root:
+
+        self.rules   = root.rules()
+        self.aliases = {}
+
+        for name in self.rules:
+
+            if (target := self.resolve(name, set())) is not None:
+                self.aliases[name] = target
+
+        return root.accept(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Resolve a Rule to the Atom it Passes Through To ----------------
+    # ------------------------------------------------------------------------------------------
+    def resolve(self, name: str, seen: set[str]) -> Expression | None:
+
+        if name in seen or len(alternatives := self.alternatives(self.rules[name].productions)) != 1:
+            return None
+
+        expression, output = alternatives[0]
+
+        if output is not None:
+            return None
+
+        if isinstance(expression, Identifier) and expression.token.literal in self.rules:
+            return self.resolve(expression.token.literal, seen | { name }) or expression
+
+        if self.terminal(expression):
+            return expression
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- HELPER :: Whether an Expression is an Atom -----------------------
+    # ------------------------------------------------------------------------------------------
+    def atomic(self, node: Expression) -> bool:
+        return isinstance(node, Identifier) or self.terminal(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- HELPER :: Flatten Unbound Output-less Groups into a Concatenation ------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def flatten(node: Expression) -> Expression:
+
+        if not isinstance(node, Concatenation):
+            return node
+
+        expressions, flattened = [], False
+
+        for expression in node.expressions:
+
+            if isinstance(expression, Parenthetical) and expression.output is None and (
+                isinstance(expression.expression, Concatenation)
+            ) and not any(isinstance(e, (Assignment, Cut)) for e in expression.expression.expressions):
+                expressions.extend(expression.expression.expressions)
+                flattened = True
+
+            else:
+                expressions.append(expression)
+
+        return Concatenation(tuple(expressions)) if flattened else node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_identifier(self, node: Identifier) -> Node:
+
+        if (alias := self.aliases.get(node.token.literal)) is None:
+            return node
+
+        if isinstance(alias, Identifier):
+            return self.identifier(alias.token.literal, node.token)
+
+        return alias
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_optional(self, node: Optional) -> Node:
+
+        expression = node.expression.accept(self)
+
+        if node.output is not None:
+            expression = self.flatten(expression)
+
+        return node if expression is node.expression else Optional(expression, node.output)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: Parenthetical) -> Node:
+
+        expression = node.expression.accept(self)
+
+        if node.output is None and self.atomic(expression):
+            return expression
+
+        if node.output is not None:
+            expression = self.flatten(expression)
+
+        return node if expression is node.expression else Parenthetical(expression, node.output)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_production(self, node: Production) -> Node:
+
+        expression = node.expression.accept(self)
+
+        if node.output is not None:
+            expression = self.flatten(expression)
+
+        return node if expression is node.expression else Production(expression, node.output)
\ No newline at end of file
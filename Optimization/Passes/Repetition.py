@@ -0,0 +1,59 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- OPTIMIZATION :: Repetition-Unwrapping Pass ---------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Node          import Node
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Star          import Star
+from ... Preparsing.Nodes.Identifier    import Identifier
+
+from  . Pass import Pass
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ CLASS :: Repetition-Unwrapping Pass -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Repetition(Pass):
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- HELPER :: Strip Output-less Parentheses from a Repetition or Atom ------------
+    # ------------------------------------------------------------------------------------------
+    def unwrap(self, node: Expression) -> Expression:
+
+        if isinstance(node, Parenthetical) and node.output is None and (
+            isinstance(node.expression, (Star, Plus, Gather, Identifier)) or self.terminal(node.expression)
+        ):
+            return self.unwrap(node.expression)
+
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: Parenthetical) -> Node:
+
+        if (expression := node.expression.accept(self)) is not node.expression:
+            node = Parenthetical(expression, node.output)
+
+        return self.unwrap(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_plus(self, node: Plus) -> Node:
+
+        expression = self.unwrap(node.expression.accept(self))
+        return node if expression is node.expression else Plus(expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_star(self, node: Star) -> Node:
+
+        expression = self.unwrap(node.expression.accept(self))
+        return node if expression is node.expression else Star(expression)
\ No newline at end of file
@@ -0,0 +1,35 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- TESTS :: Left-Factoring Pass, End to End ----------------------------
+# --------------------------------------------------------------------------------------------------
+from .... Parsing.Parser.Generator import Generator
+from ...  Pipeline                 import Pipeline
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------- TEST :: A Factored Lookahead is not Bound into the Default Output ----------------
+# --------------------------------------------------------------------------------------------------
+def test_negative_in_factored_alternatives(grammar, tokens, tokentype):
+
+    text = "r :=\n    | IDENTIFIER !STRING\n    | IDENTIFIER NUMBER\n"
+
+    plain     = Generator(grammar(text), tokentype).load()
+    optimized = Generator(Pipeline.default().run(grammar(text)), tokentype).load()
+
+    for source in ('x', 'x 1', "x 'y'"):
+        assert optimized(tokens(source)).parse() == plain(tokens(source)).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TEST :: Factoring Keeps what each Branch Returns ------------------------
+# --------------------------------------------------------------------------------------------------
+def test_factored_outputs(grammar, tokens, tokentype):
+
+    text = "r :=\n    | a=IDENTIFIER '+' b=NUMBER { Pair(a, b) }\n    | a=IDENTIFIER '-' { a }\n"
+
+    namespace = { 'Pair': lambda a, b: (a.literal, b.literal) }
+
+    plain     = Generator(grammar(text), tokentype).load(namespace)
+    optimized = Generator(Pipeline.default().run(grammar(text)), tokentype).load(namespace)
+
+    for source in ('x + 1', 'x -', 'x *'):
+        assert optimized(tokens(source)).parse() == plain(tokens(source)).parse()
\ No newline at end of file
@@ -0,0 +1,31 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TESTS :: Passes Share what they Leave Untouched -------------------------
+# --------------------------------------------------------------------------------------------------
+from ...  Pipeline import Pipeline
+
+from .... Preparsing.Parser.Parser import Parser as Preparser
+
+
+# --------------------------------------------------------------------------------------------------
+# ----- TEST :: The Pipeline Rewrites only what Changes, and Returns a Settled Grammar Itself ------
+# --------------------------------------------------------------------------------------------------
+def test_settled(shipped, grammar):
+
+    for root in (*(Preparser(origin).parse() for origin in shipped), grammar("a :=\n    | b\nb :=\n    | 'x'\n")):
+
+        optimized = Pipeline.default().run(root)
+
+        assert Pipeline.default().run(optimized) is optimized
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: An Alias is Replaced where it is Used, and Nowhere Else -----------------
+# --------------------------------------------------------------------------------------------------
+def test_aliased(grammar):
+
+    root = grammar("a :=\n    | b 'y'\nb :=\n    | 'x'\nc :=\n    | 'q' 'r'\n")
+    a, b, c = root.definitions.elements
+
+    first, second, third = Pipeline.default().run(root).definitions.elements
+
+    assert first is not a and second is b and third is c
\ No newline at end of file
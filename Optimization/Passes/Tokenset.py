@@ -0,0 +1,73 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- OPTIMIZATION :: Token-Set Merging Pass -----------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Definition    import Definition
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Node          import Node
+from ... Preparsing.Nodes.Output        import Output
+
+from  . Pass import Pass
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Token-Set Merging Pass ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Tokenset(Pass):
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Merge Runs of Adjacent Single-Token Alternatives ---------------
+    # ------------------------------------------------------------------------------------------
+    def merge(self,
+        alternatives: list[tuple[Expression, Output | None]]
+    ) -> list[tuple[Expression, Output | None]]:
+
+        merged, run = [], []
+
+        for expression, output in alternatives + [ (None, None) ]:
+
+            if expression is not None and output is None and self.terminal(expression):
+                run.append(expression); continue
+
+            if len(run) > 1:
+                merged.append((Alternation(tuple(run)), None))
+
+            elif run:
+                merged.append((run[0], None))
+
+            if expression is not None:
+                merged.append((expression, output))
+
+            run = []
+
+        return merged
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: Alternation) -> Node:
+
+        if self.terminal(node):
+            return node
+
+        expressions = []
+
+        for expression, output in self.merge([ (e, None) for e in node.expressions ]):
+            expressions.append(expression.accept(self))
+
+        if len(expressions) == 1:
+            return expressions[0]
+
+        if len(expressions) == len(node.expressions) and all(e is o for e, o in zip(expressions, node.expressions)):
+            return node
+
+        return Alternation(tuple(expressions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Definition -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_definition(self, node: Definition) -> Node:
+
+        return self.productions(node, self.merge(self.alternatives(node.productions)))
\ No newline at end of file
@@ -0,0 +1,57 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------- OPTIMIZATION :: Grammar Optimization Pipeline --------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Preparsing.Nodes.Root import Root
+
+from  . Passes.Factoring   import Factoring
+from  . Passes.Pass        import Pass
+from  . Passes.Passthrough import Passthrough
+from  . Passes.Repetition  import Repetition
+from  . Passes.Tokenset    import Tokenset
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- CLASS :: Grammar Optimization Pipeline -----------------------------
+# --------------------------------------------------------------------------------------------------
+class Pipeline(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    passes : list[Pass]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, *passes: Pass) -> None:
+        self.passes = list(passes)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Pipeline({', '.join(map(repr, self.passes))})"
+
+    def __str__(self)  -> str:
+        return f"Pipeline({', '.join(map(str, self.passes))})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- METHOD :: Default Pipeline -------------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def default() -> 'Pipeline':
+        return Pipeline(Passthrough(), Tokenset(), Passthrough(), Factoring(), Repetition())
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- METHOD :: Run Every Pass over a Grammar in Order --------------------
+    # ------------------------------------------------------------------------------------------
+    def run(self, root: Root) -> Root:
+
+        for stage in self.passes:
+            root = stage.run(root)
+
+        return root
\ No newline at end of file
@@ -0,0 +1,34 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: Disambiguation Filter --------------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Forest import Forest
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Disambiguation Filter ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Filter(object):
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- METHOD :: Pick one Packed Alternative of an Ambiguous Node ---------------
+    # ------------------------------------------------------------------------------------------
+    def choose(self,
+        forest: 'Forest', node: tuple[Any, int, int], candidates: list[tuple[Any, ...]]
+    ) -> tuple[Any, ...]:
+
+        # earliest production first, then the longest leading part, as an ordered choice would
+        return min(candidates, key=lambda packed: (packed[0][0], -packed[1]))
\ No newline at end of file
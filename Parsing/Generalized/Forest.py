@@ -0,0 +1,223 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PARSING :: Shared Packed Parse Forest ------------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Filter import Filter
+
+from typing import Any
+from typing import Callable
+
+Key    = tuple[Any, int, int]
+Packed = tuple[tuple[int, int], int, Key | None, Key]
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ CLASS :: Shared Packed Parse Forest -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Forest(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    productions : list[tuple[str, tuple[Any, ...], str]]
+    functions   : list[Callable[..., Any] | None]
+    tokens      : list[Any]
+
+    nodes       : dict[Key, dict[tuple[tuple[int, int], int], tuple[Key | None, Key]]]
+    root        : Key | None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self,
+        productions: list[tuple[str, tuple[Any, ...], str]],
+        functions: list[Callable[..., Any] | None], tokens: list[Any]
+    ) -> None:
+
+        self.productions = productions
+        self.functions   = functions
+        self.tokens      = tokens
+
+        self.nodes       = {}
+        self.root        = None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Forest({self.root}, {len(self.nodes)} nodes)"
+
+    def __str__(self)  -> str:
+        return f"Forest({self.root}, {len(self.nodes)} nodes)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- HELPER :: Whether a Node is an Intermediate (Partial Production) Node ----------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def intermediate(key: Key) -> bool:
+        return isinstance(key[0], tuple) and isinstance(key[0][0], int)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ HELPER :: Packed Alternatives of a Node -------------------------
+    # ------------------------------------------------------------------------------------------
+    def packed(self, key: Key) -> list[Packed]:
+        return [ (slot, pivot, left, right) for (slot, pivot), (left, right) in self.nodes[key].items() ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ HELPER :: Production a Packed Alternative Belongs To ------------------
+    # ------------------------------------------------------------------------------------------
+    def production(self, packed: Packed) -> tuple[str, tuple[Any, ...], str]:
+        return self.productions[packed[0][0]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Packed Alternative of a Node Selected by a Filter ---------------
+    # ------------------------------------------------------------------------------------------
+    def choose(self, key: Key, filter: Filter) -> Packed:
+
+        if len(candidates := self.packed(key)) == 1:
+            return candidates[0]
+
+        return filter.choose(self, key, candidates)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Chosen Production and Children of a Symbol Node ----------------
+    # ------------------------------------------------------------------------------------------
+    def children(self, key: Key, filter: Filter) -> tuple[int, list[Key]]:
+
+        slot, _, left, right = self.choose(key, filter)
+        children = []
+
+        while True:
+
+            if right[0] is not None:
+                children.append(right)
+
+            if left is None:
+                break
+
+            if not self.intermediate(left):
+                children.append(left)
+                break
+
+            _, _, left, right = self.choose(left, filter)
+
+        children.reverse()
+        return slot[0], children
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----- METHOD :: Nodes with More than one Packed Alternative Reachable from the Root ------
+    # ------------------------------------------------------------------------------------------
+    def ambiguities(self) -> list[Key]:
+
+        found, seen, pending = [], set(), [ self.root ] if self.root else []
+
+        while pending:
+
+            if (key := pending.pop()) in seen or key not in self.nodes:
+                continue
+
+            seen.add(key)
+
+            if len(self.nodes[key]) > 1 and not self.intermediate(key):
+                found.append(key)
+
+            for left, right in self.nodes[key].values():
+                pending += [ child for child in (left, right) if child is not None ]
+
+        return found
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ METHOD :: Number of Distinct Derivations Packed into the Forest -------------
+    # ------------------------------------------------------------------------------------------
+    def count(self) -> int:
+
+        if self.root is None:
+            return 0
+
+        counts, active, stack = {}, set(), [ self.root ]
+
+        while stack:
+
+            if (key := stack[-1]) in counts:
+                stack.pop()
+                continue
+
+            children = [ c for pair in self.nodes.get(key, {}).values() for c in pair if c is not None ]
+
+            if waiting := [ c for c in children if c not in counts and self.nodes.get(c) ]:
+
+                if active & set(waiting):
+                    raise ValueError(f"cyclic derivation in parse forest at {key}")
+
+                active.add(key)
+                stack += waiting
+                continue
+
+            stack.pop()
+            active.discard(key)
+
+            if not self.nodes.get(key):
+                counts[key] = 1
+                continue
+
+            counts[key] = sum(
+                (counts.get(left, 1) if left is not None else 1) * counts.get(right, 1)
+                for left, right in self.nodes[key].values()
+            )
+
+        return counts[self.root]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- METHOD :: Build the Value of the Tree a Filter Selects -----------------
+    # ------------------------------------------------------------------------------------------
+    def tree(self, filter: Filter | None = None) -> Any:
+
+        if self.root is None:
+            return None
+
+        filter = filter or Filter()
+        values, active, stack = {}, set(), [ (self.root, None, None) ]
+
+        while stack:
+
+            key, production, children = stack[-1]
+
+            if key in values:
+                stack.pop()
+                continue
+
+            if children is None:
+
+                production, children = self.children(key, filter)
+                stack[-1] = (key, production, children)
+                active.add(key)
+
+                for child in reversed(children):
+
+                    if isinstance(child[0], str) and child not in values:
+
+                        if child in active:
+                            raise ValueError(f"cyclic derivation of '{child[0]}' in parse forest")
+
+                        stack.append((child, None, None))
+
+                continue
+
+            stack.pop()
+            active.discard(key)
+
+            arguments = [ values[c] if isinstance(c[0], str) else self.tokens[c[1]] for c in children ]
+            function  = self.functions[production]
+
+            values[key] = function(*arguments) if function is not None else arguments[0]
+
+        return values[self.root]
\ No newline at end of file
@@ -0,0 +1,205 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: Generalized LL Parser --------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Root import Root
+
+from ..  Parser.Generator import Generator
+from ..  Parser.Grammar   import Grammar
+from ..  Parser.Grammar   import IDENTITY
+
+from  . Forest import Forest
+from  . Forest import Key
+
+from enum   import IntFlag
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+Slot = tuple[int, int]
+Node = tuple[Slot | None, int]
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Generalized LL Parser ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Gll(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    root         : Root
+    generator    : Generator
+    grammar      : Grammar
+
+    productions  : list[tuple[str, tuple[Any, ...], str]]
+    alternatives : dict[str, list[int]]
+    masks        : dict[str, int]
+    functions    : list[Callable[..., Any] | None]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, root: Root, tokentype: type[IntFlag]) -> None:
+
+        self.root      = root
+        self.generator = Generator(root, tokentype)
+        self.grammar   = Grammar(self.generator)
+
+        if self.grammar.unsupported:
+            rules = ', '.join(sorted(self.grammar.unsupported))
+            raise SyntaxError(f"lookaheads or cuts in {rules} of '{root.origin}' are not context-free")
+
+        self.productions  = [
+            (name, rhs, action) for name, rules in self.grammar.rules.items() for rhs, action in rules
+        ]
+        self.alternatives = { name: [] for name in self.grammar.rules }
+        self.masks        = {}
+        self.functions    = []
+
+        for index, (name, rhs, _) in enumerate(self.productions):
+
+            self.alternatives[name].append(index)
+
+            for symbol in rhs:
+
+                if not isinstance(symbol, str) and symbol[0] == 'type':
+                    self.masks[symbol[1]] = self.generator.mask(symbol[1])
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Gll('{self.root.origin}', {len(self.productions)} productions)"
+
+    def __str__(self)  -> str:
+        return f"Gll('{self.root.origin}', {len(self.productions)} productions)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- METHOD :: Compile Action Sources against a Namespace of Constructors ----------
+    # ------------------------------------------------------------------------------------------
+    def link(self, namespace: dict[str, Any] | None = None) -> 'Gll':
+
+        scope = dict(namespace or {})
+
+        self.functions = [
+            eval(action, scope) if action != IDENTITY else None for _, _, action in self.productions
+        ]
+
+        return self
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- PARSER :: Parse Tokens into a Forest of Every Derivation from a Start Rule -------
+    # ------------------------------------------------------------------------------------------
+    def parse(self, tokens: Iterable[Any], start: str = '') -> Forest | None:
+
+        tokens   = [ token for token in tokens if token is not None ]
+        types    = [ int(token.type) for token in tokens ] + [ 0 ]
+        literals = [ token.literal   for token in tokens ] + [ None ]
+
+        productions, alternatives, masks = self.productions, self.alternatives, self.masks
+
+        start  = start or next(iter(self.generator.rules), '')
+        forest = Forest(self.productions, self.functions, tokens)
+        nodes  = forest.nodes
+
+        base   = (None, 0)
+        edges  = {}    # stack node -> { (caller stack node, forest node so far) }
+        popped = {}    # stack node -> { forest nodes it has returned }
+        seen   = set()
+        work   = []
+
+        def add(slot: Slot, node: Node, offset: int, forest: Key | None) -> None:
+
+            if (descriptor := (slot, node, offset, forest)) not in seen:
+                seen.add(descriptor)
+                work.append(descriptor)
+
+        def pack(slot: Slot, left: Key | None, right: Key) -> Key:
+
+            production, dot = slot
+            name, rhs, _ = productions[production]
+
+            if dot == 1 and len(rhs) > 1:
+                return right
+
+            key = (name if dot == len(rhs) else slot, right[1] if left is None else left[1], right[2])
+            nodes.setdefault(key, {}).setdefault((slot, right[1]), (left, right))
+
+            return key
+
+        def leaf(symbol: Any, offset: int, end: int) -> Key:
+
+            nodes.setdefault(key := (symbol, offset, end), {})
+            return key
+
+        def create(slot: Slot, caller: Node, offset: int, forest: Key | None) -> Node:
+
+            node = (slot, offset)
+
+            if (edge := (caller, forest)) not in (callers := edges.setdefault(node, set())):
+
+                callers.add(edge)
+
+                for returned in list(popped.get(node, ())):
+                    add(slot, caller, returned[2], pack(slot, forest, returned))
+
+            return node
+
+        def pop(node: Node, offset: int, forest: Key) -> None:
+
+            if node is base:
+                return
+
+            popped.setdefault(node, set()).add(forest)
+
+            for caller, left in list(edges[node]):
+                add(node[0], caller, offset, pack(node[0], left, forest))
+
+        for production in alternatives[start]:
+            add((production, 0), base, 0, None)
+
+        while work:
+
+            (production, dot), node, offset, current = work.pop()
+            rhs = productions[production][1]
+
+            if not rhs:
+                pop(node, offset, pack((production, 0), None, leaf(None, offset, offset)))
+                continue
+
+            while dot < len(rhs):
+
+                if isinstance(symbol := rhs[dot], str):
+
+                    node = create((production, dot + 1), node, offset, current)
+
+                    for alternative in alternatives[symbol]:
+                        add((alternative, 0), node, offset, None)
+
+                    break
+
+                if symbol[0] == 'type':
+
+                    if not types[offset] & masks[symbol[1]]:
+                        break
+
+                elif literals[offset] != symbol[1]:
+                    break
+
+                dot, offset = dot + 1, offset + 1
+                current = pack((production, dot), current, leaf(symbol, offset - 1, offset))
+
+            else:
+                pop(node, offset, current)
+
+        for end in range(len(tokens), -1, -1):
+
+            if (start, 0, end) in nodes:
+                forest.root = (start, 0, end)
+                return forest
+
+        return None
\ No newline at end of file
@@ -0,0 +1,41 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- TESTS :: Generalized LL Parsing ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Gll import Gll
+
+import pytest
+
+GRAMMAR = "e :=\n    | a=e '+' b=e { Add(a, b) }\n    | a=NUMBER { Num(a) }\n"
+
+NAMESPACE = { 'Add': lambda a, b: ('+', a, b), 'Num': lambda a: int(a.literal) }
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------- TEST :: Every Derivation of an Ambiguous Input is Kept ---------------------
+# --------------------------------------------------------------------------------------------------
+def test_ambiguous(grammar, tokens, tokentype):
+
+    gll    = Gll(grammar(GRAMMAR), tokentype).link(NAMESPACE)
+    forest = gll.parse(tokens('1 + 2 + 3 + 4'))
+
+    assert forest.count() == 5    # the fourth Catalan number
+    assert forest.ambiguities()
+    assert forest.tree() in (
+        ('+', ('+', ('+', 1, 2), 3), 4),
+        ('+', ('+', 1, ('+', 2, 3)), 4),
+        ('+', ('+', 1, 2), ('+', 3, 4)),
+        ('+', 1, ('+', ('+', 2, 3), 4)),
+        ('+', 1, ('+', 2, ('+', 3, 4))),
+    )
+
+    assert gll.parse(tokens('1')).count() == 1
+    assert gll.parse(tokens('+ 1')) is None
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- TEST :: Lookaheads are Rejected ---------------------------------
+# --------------------------------------------------------------------------------------------------
+def test_lookahead(grammar, tokentype):
+
+    with pytest.raises(SyntaxError):
+        Gll(grammar("e :=\n    | NUMBER !'+'\n"), tokentype)
\ No newline at end of file
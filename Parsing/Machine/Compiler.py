@@ -0,0 +1,453 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ PARSING :: Parsing-Machine Compiler -------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Visitors.Visitor    import Visitor
+
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Definition    import Definition
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Negative      import Negative
+from ... Preparsing.Nodes.Number        import Number
+from ... Preparsing.Nodes.Optional      import Optional
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Root          import Root
+from ... Preparsing.Nodes.Star          import Star
+from ... Preparsing.Nodes.String        import String
+
+from ..  Parser.Generator import Generator
+from ..  Parser.Tower     import Tower
+
+from  . Opcode  import Opcode
+from  . Program import Program
+
+from enum   import IntFlag
+from typing import Any
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Parsing-Machine Compiler --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Compiler(Visitor[None]):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    root      : Root
+    generator : Generator
+
+    code      : list[list[Any]]
+    actions   : list[str]
+    calls     : list[tuple[int, str]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, root: Root, tokentype: type[IntFlag]) -> None:
+
+        self.root      = root
+        self.generator = Generator(root, tokentype)
+
+        self.code      = []
+        self.actions   = []
+        self.calls     = []
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Compiler('{self.root.origin}')"
+
+    def __str__(self)  -> str:
+        return f"Compiler('{self.root.origin}')"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- HELPER :: Append an Instruction and Return its Address -----------------
+    # ------------------------------------------------------------------------------------------
+    def emit(self, opcode: Opcode, a: Any = None, b: Any = None) -> int:
+
+        self.code.append([ int(opcode), a, b ])
+        return len(self.code) - 1
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Point an Instruction's Target at the Next Address ---------------
+    # ------------------------------------------------------------------------------------------
+    def patch(self, address: int) -> None:
+        self.code[address][1] = len(self.code)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- HELPER :: Terminal Test Operands of an Expression --------------------
+    # ------------------------------------------------------------------------------------------
+    def operands(self, node: Expression) -> tuple[int, frozenset[str] | None]:
+
+        mask, literals = self.generator.terminals(node)
+        return mask, frozenset(literals) if literals else None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- EMITTER :: Call a Rule by Name -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def call(self, name: str) -> None:
+        self.calls.append((self.emit(Opcode.CALL, None, name), name))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- EMITTER :: Compile an Action over the Values of an Alternative -------------
+    # ------------------------------------------------------------------------------------------
+    def action(self, output: Output | None, names: list[str | None], own: int) -> None:
+
+        parameters = [ f"v{index}" for index in range(len(names)) ]
+        scope = { name: parameter for name, parameter in zip(names, parameters) if name }
+
+        value = self.generator.value(output, parameters[len(names) - own:], scope)
+
+        if value in parameters:    # a bare capture is kept as it is, even None, where an action's None fails
+
+            if len(names) > 1:
+                self.emit(Opcode.PICK, parameters.index(value), len(names))
+
+            return
+
+        self.actions.append(f"lambda {', '.join(parameters)}: {value}")
+        self.emit(Opcode.ACTION, len(self.actions) - 1, len(names))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ EMITTER :: Compile a Negative Lookahead -------------------------
+    # ------------------------------------------------------------------------------------------
+    def negative(self, node: Negative) -> None:
+
+        expression = node.expression
+
+        while isinstance(expression, Parenthetical) and expression.output is None:
+            expression = expression.expression
+
+        if self.generator.terminal(expression):
+            self.emit(Opcode.REJECT, *self.operands(expression))
+            return
+
+        choice = self.emit(Opcode.CHOICE)
+        expression.accept(self)
+        self.emit(Opcode.FAIL)
+        self.patch(choice)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- EMITTER :: Compile one Alternative, Leaving its Value on the Stack -----------
+    # ------------------------------------------------------------------------------------------
+    def alternative(self,
+        expression: Expression, output: Output | None, prefix: list[str | None], depth: int = 0
+    ) -> None:
+
+        items = self.generator.items(expression)
+        tail  = items.pop() if items and self.generator.factored(items[-1]) else None
+        names = list(prefix)
+
+        for item in items:
+
+            name, expression = self.generator.binding(item)
+
+            if isinstance(expression, Cut):
+
+                if depth:    # past a cut a failure skips the other alternatives of every enclosing choice
+                    self.emit(Opcode.CUT, depth)
+                    depth = 0
+
+                continue
+
+            if isinstance(expression, Negative):
+                self.negative(expression)
+                continue
+
+            expression.accept(self)
+            names.append(name)
+
+        if tail is not None:
+            self.choice(self.generator.alternatives(self.generator.binding(tail)[1]), names, depth)
+
+        else:
+            self.action(output, names, len(names) - len(prefix))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- EMITTER :: Compile an Ordered Choice, Leaving One Value on the Stack ----------
+    # ------------------------------------------------------------------------------------------
+    def choice(self,
+        alternatives: list[tuple[Expression, Output | None]], prefix: list[str | None], depth: int = 0
+    ) -> None:
+
+        commits = []
+
+        for index, (expression, output) in enumerate(alternatives):
+
+            if index == len(alternatives) - 1:
+                self.alternative(expression, output, prefix, depth)
+                break
+
+            choice = self.emit(Opcode.CHOICE)
+            self.alternative(expression, output, prefix, depth + 1)
+            commits.append(self.emit(Opcode.COMMIT))
+            self.patch(choice)
+
+        for commit in commits:
+            self.patch(commit)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- EMITTER :: Compile a Repetition onto the List Beneath it ----------------
+    # ------------------------------------------------------------------------------------------
+    def loop(self, body: Expression, separator: Expression | None = None) -> None:
+
+        start  = len(self.code)
+        choice = self.emit(Opcode.CHOICE)
+
+        if separator is not None:
+            separator.accept(self)
+            self.emit(Opcode.POP)
+
+        body.accept(self)
+        self.emit(Opcode.APPEND)
+        self.emit(Opcode.PARTIAL, start + 1)
+        self.patch(choice)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- EMITTER :: Compile one Level of a Precedence Tower as an Operator Loop ---------
+    # ------------------------------------------------------------------------------------------
+    def pratt(self, tower: Tower, index: int) -> None:
+
+        levels  = range(index, len(tower.levels))
+        below   = lambda level: tower.levels[level + 1] if level + 1 < len(tower.levels) else tower.base
+
+        options = [
+            (level, prefix) for level in levels for prefix in tower.prefixes[level]
+        ]
+
+        commits = []
+
+        for level, (operator, op, operand, output) in options:
+
+            choice = self.emit(Opcode.CHOICE)
+            self.emit(Opcode.MATCH, *self.operands(operator))
+            self.call(tower.levels[level])
+            self.action(output, [ op, operand ], 2)
+            commits.append(self.emit(Opcode.COMMIT))
+            self.patch(choice)
+
+        self.call(tower.base)
+
+        for commit in commits:
+            self.patch(commit)
+
+        options = [
+            (level, binary) for level in levels for binary in tower.binaries[level]
+        ]
+
+        if not options:
+            return
+
+        start, commits = len(self.code), []
+        loop = self.emit(Opcode.CHOICE)
+
+        for position, (level, (a, operator, op, b, rightward, output)) in enumerate(options):
+
+            last   = position == len(options) - 1
+            choice = None if last else self.emit(Opcode.CHOICE)
+
+            self.emit(Opcode.MATCH, *self.operands(operator))
+            self.call(tower.levels[level] if rightward else below(level))
+            self.action(output, [ a, op, b ], 3)
+
+            if not last:
+                commits.append(self.emit(Opcode.COMMIT))
+                self.patch(choice)
+
+        for commit in commits:
+            self.patch(commit)
+
+        self.emit(Opcode.PARTIAL, start + 1)
+        self.patch(loop)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: Alternation) -> None:
+
+        if self.generator.terminal(node):
+            self.emit(Opcode.MATCH, *self.operands(node))
+
+        else:
+            self.choice(self.generator.alternatives(node), [])
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Assignment -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_assignment(self, node: Assignment) -> None:
+        node.expression.accept(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_concatenation(self, node: Concatenation) -> None:
+        self.choice([ (node, None) ], [])
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------------- VISITOR :: Visit Cut ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_cut(self, node: Cut) -> None:
+        self.emit(Opcode.PUSH, True)    # a cut outside a sequence of items has no choice left to commit
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Gather ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_gather(self, node: Gather) -> None:
+
+        self.emit(Opcode.LIST)
+        node.expression.accept(self)
+        self.emit(Opcode.APPEND)
+        self.loop(node.expression, node.separator)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_identifier(self, node: Identifier) -> None:
+
+        if (name := node.token.literal) in self.generator.rules:
+            self.call(name)
+
+        else:
+            self.emit(Opcode.MATCH, *self.operands(node))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Negative --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_negative(self, node: Negative) -> None:
+
+        self.negative(node)
+        self.emit(Opcode.PUSH, True)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Number ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_number(self, node: Number) -> None:
+        self.emit(Opcode.MATCH, *self.operands(node))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_optional(self, node: Optional) -> None:
+
+        choice = self.emit(Opcode.CHOICE)
+
+        if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+            node.expression.accept(self)
+
+        else:
+            self.choice(self.generator.alternatives(node.expression, node.output), [])
+
+        commit = self.emit(Opcode.COMMIT)
+        self.patch(choice)
+        self.emit(Opcode.PUSH, None)
+        self.patch(commit)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: Parenthetical) -> None:
+
+        if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+            node.expression.accept(self)
+
+        else:
+            self.choice(self.generator.alternatives(node.expression, node.output), [])
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_plus(self, node: Plus) -> None:
+
+        self.emit(Opcode.LIST)
+        node.expression.accept(self)
+        self.emit(Opcode.APPEND)
+        self.loop(node.expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_production(self, node: Production) -> None:
+        self.choice([ (node.expression, node.output) ], [])
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_star(self, node: Star) -> None:
+
+        self.emit(Opcode.LIST)
+        self.loop(node.expression)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit String ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_string(self, node: String) -> None:
+        self.emit(Opcode.MATCH, *self.operands(node))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- COMPILER :: Compile a Definition into a Rule Body --------------------
+    # ------------------------------------------------------------------------------------------
+    def definition(self, definition: Definition) -> int:
+
+        entry = len(self.code)
+
+        if (level := self.generator.towers.get(definition.signature.identifier.token.literal)):
+            self.pratt(*level)
+
+        else:
+            self.choice(self.generator.alternatives(definition.productions), [])
+        self.emit(Opcode.RETURN)
+
+        return entry
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- COMPILER :: Compile the Grammar into a Program ---------------------
+    # ------------------------------------------------------------------------------------------
+    def compile(self) -> Program:
+
+        self.code, self.actions, self.calls = [], [], []
+
+        rules = { name: self.definition(d) for name, d in self.generator.rules.items() }
+
+        for address, name in self.calls:
+            self.code[address][1] = rules[name]
+
+        code  = [ tuple(instruction) for instruction in self.code ]
+        start = next(iter(rules), '')
+
+        return Program(self.root.origin, start, code, rules, self.actions)
\ No newline at end of file
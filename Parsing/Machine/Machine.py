@@ -0,0 +1,199 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- PARSING :: Parsing Machine -----------------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Opcode  import Opcode
+from  . Program import Program
+
+from typing import Any
+from typing import Iterable
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ CLASS :: Parsing Machine ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Machine(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    program  : Program
+
+    tokens   : list[Any]
+    types    : list[int]
+    literals : list[str | None]
+
+    offset   : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, program: Program, tokens: Iterable[Any]) -> None:
+
+        self.program  = program
+
+        self.tokens   = [ token for token in tokens if token is not None ]
+        self.types    = [ int(token.type) for token in self.tokens ]
+        self.literals = [ token.literal   for token in self.tokens ]
+
+        self.tokens.append(None)    # sentinel, never matched by any mask or literal
+        self.types.append(0)
+        self.literals.append(None)
+
+        self.offset   = 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Machine('{self.program.origin}', offset={self.offset})"
+
+    def __str__(self)  -> str:
+        return f"Machine('{self.program.origin}', offset={self.offset})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- INTERPRETER :: Run the Program from a Start Rule --------------------
+    # ------------------------------------------------------------------------------------------
+    def parse(self, start: str = '') -> Any:
+
+        MATCH, REJECT, CALL, RETURN, JUMP  = Opcode.MATCH, Opcode.REJECT, Opcode.CALL, Opcode.RETURN, Opcode.JUMP
+        CHOICE, COMMIT, PARTIAL, FAIL, CUT = Opcode.CHOICE, Opcode.COMMIT, Opcode.PARTIAL, Opcode.FAIL, Opcode.CUT
+        PUSH, POP, LIST, APPEND, ACTION    = Opcode.PUSH, Opcode.POP, Opcode.LIST, Opcode.APPEND, Opcode.ACTION
+        PICK                               = Opcode.PICK
+
+        code, functions = self.program.code, self.program.functions
+        tokens, types, literals = self.tokens, self.types, self.literals
+
+        name   = start or self.program.start
+        pc     = self.program.rules[name]
+        offset = self.offset
+
+        values, backtrack, frames, memo = [], [], [ (-1, name, offset) ], {}
+
+        while True:
+
+            opcode, a, b = code[pc]
+            failed = False
+
+            if opcode == MATCH:
+
+                if types[offset] & a or (b is not None and literals[offset] in b):
+                    values.append(tokens[offset])
+                    offset += 1
+                    pc += 1
+
+                else:
+                    failed = True
+
+            elif opcode == CALL:
+
+                if (key := (b, offset)) in memo:
+
+                    if (entry := memo[key]) is None:
+                        failed = True
+
+                    else:
+                        values.append(entry[0])
+                        offset = entry[1]
+                        pc += 1
+
+                else:
+                    frames.append((pc + 1, b, offset))
+                    pc = a
+
+            elif opcode == RETURN:
+
+                pc, rule, begin = frames.pop()
+                memo[(rule, begin)] = (values[-1], offset)
+
+                if pc < 0:
+                    self.offset = offset
+                    return values.pop()
+
+            elif opcode == CHOICE:
+                backtrack.append((a, offset, len(values), len(frames)))
+                pc += 1
+
+            elif opcode == COMMIT:
+                backtrack.pop()
+                pc = a
+
+            elif opcode == PARTIAL:
+                backtrack[-1] = (backtrack[-1][0], offset, len(values), len(frames))
+                pc = a
+
+            elif opcode == APPEND:
+                value = values.pop()
+                values[-1].append(value)
+                pc += 1
+
+            elif opcode == LIST:
+                values.append([])
+                pc += 1
+
+            elif opcode == ACTION:
+
+                if (value := functions[a](*values[len(values) - b:])) is None:
+                    failed = True
+
+                else:
+                    del values[len(values) - b:]
+                    values.append(value)
+                    pc += 1
+
+            elif opcode == PICK:
+                value = values[len(values) - b + a]
+                del values[len(values) - b:]
+                values.append(value)
+                pc += 1
+
+            elif opcode == REJECT:
+
+                if types[offset] & a or (b is not None and literals[offset] in b):
+                    failed = True
+
+                else:
+                    pc += 1
+
+            elif opcode == POP:
+                values.pop()
+                pc += 1
+
+            elif opcode == PUSH:
+                values.append(a)
+                pc += 1
+
+            elif opcode == FAIL:
+                backtrack.pop()
+                failed = True
+
+            elif opcode == JUMP:
+                pc = a
+
+            elif opcode == CUT:
+
+                for index in range(len(backtrack) - a, len(backtrack)):
+                    backtrack[index] = (-1, *backtrack[index][1:])
+
+                pc += 1
+
+            while failed:
+
+                if not backtrack:
+
+                    for _, rule, begin in frames:
+                        memo[(rule, begin)] = None
+
+                    return None
+
+                pc, offset, height, depth = backtrack.pop()
+
+                while len(frames) > depth:
+                    _, rule, begin = frames.pop()
+                    memo[(rule, begin)] = None
+
+                failed = pc < 0    # a disarmed entry only unwinds, then the failure goes on
+
+                del values[height:]
\ No newline at end of file
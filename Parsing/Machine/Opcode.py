@@ -0,0 +1,31 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PARSING :: Parsing-Machine Opcode Enum -----------------------------
+# --------------------------------------------------------------------------------------------------
+from enum import IntEnum
+from enum import auto
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ ENUM :: Parsing-Machine Opcode Enum -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Opcode(IntEnum):
+
+    MATCH   = auto()    # consume a token in mask 'a' or literal set 'b', pushing it
+    REJECT  = auto()    # fail if the next token is in mask 'a' or literal set 'b'
+
+    CALL    = auto()    # call the rule at 'a', named 'b'
+    RETURN  = auto()    # return from the current rule, memoizing its value
+    JUMP    = auto()    # jump to 'a'
+
+    CHOICE  = auto()    # push a backtrack entry resuming at 'a'
+    COMMIT  = auto()    # pop the top backtrack entry and jump to 'a'
+    PARTIAL = auto()    # move the top backtrack entry to the current state and jump to 'a'
+    FAIL    = auto()    # pop the top backtrack entry, then fail
+    CUT     = auto()    # disarm the top 'a' backtrack entries, so a failure falls through them
+
+    PUSH    = auto()    # push the constant 'a'
+    POP     = auto()    # discard the top value
+    LIST    = auto()    # push an empty list
+    APPEND  = auto()    # pop a value onto the list beneath it
+    ACTION  = auto()    # replace the top 'b' values with action 'a' applied to them
+    PICK    = auto()    # replace the top 'b' values with the one at 'a' among them
\ No newline at end of file
@@ -0,0 +1,84 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- PARSING :: Parsing-Machine Program -------------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import Callable
+
+import marshal
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Parsing-Machine Program --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Program(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    origin    : str
+    start     : str
+
+    code      : list[tuple[int, Any, Any]]
+    rules     : dict[str, int]
+    actions   : list[str]
+    functions : list[Callable[..., Any]]
+
+    VERSION = 2
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self,
+        origin: str, start: str, code: list[tuple[int, Any, Any]], rules: dict[str, int], actions: list[str]
+    ) -> None:
+
+        self.origin    = origin
+        self.start     = start
+
+        self.code      = code
+        self.rules     = rules
+        self.actions   = actions
+        self.functions = []
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Program('{self.origin}', {len(self.code)} instructions)"
+
+    def __str__(self)  -> str:
+        return f"Program('{self.origin}', {len(self.code)} instructions)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- METHOD :: Compile Action Sources against a Namespace of Constructors ----------
+    # ------------------------------------------------------------------------------------------
+    def link(self, namespace: dict[str, Any] | None = None) -> 'Program':
+
+        scope = dict(namespace or {})
+        self.functions = [ eval(action, scope) for action in self.actions ]
+
+        return self
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ METHOD :: Serialize to Bytes ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def dumps(self) -> bytes:
+        return marshal.dumps((Program.VERSION, self.origin, self.start, self.code, self.rules, self.actions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------- METHOD :: Deserialize from Bytes ----------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def loads(data: bytes) -> 'Program':
+
+        version, origin, start, code, rules, actions = marshal.loads(data)
+
+        if version != Program.VERSION:
+            raise ValueError(f"unsupported program version {version}")
+
+        return Program(origin, start, code, rules, actions)
\ No newline at end of file
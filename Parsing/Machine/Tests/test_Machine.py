@@ -0,0 +1,76 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ TESTS :: Parsing Machine ------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Parser.Generator import Generator
+
+from  .. Compiler import Compiler
+from  .. Machine  import Machine
+from  .. Program  import Program
+
+from itertools import product
+
+SOURCES = ('1 + 2 * 3', '1 * 2 * 3', '( 1 + 2 ) * 3', '1 +', '+')
+
+OPTIONAL = (
+    "s :=\n"
+    "    | '[' a=[NUMBER] ':' b=[NUMBER] c=[ ':' d=[NUMBER] { d } ] ']' { Slice(a, b, c) }\n"
+    "    | 'g' x=( y=[NUMBER] '!' { y } ) ';' { One(x) }\n"
+    "    | 'l' xs=( y=[NUMBER] ';' { y } )* '.' { Many(xs) }\n"
+    "    | 'r' x=opt '.' { One(x) }\n"
+    "opt :=\n    | a=[IDENTIFIER] { a }\n"
+)
+
+LITERAL = lambda token: token and token.literal
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ TEST :: The Machine Builds what the Generated Parser Builds -------------------
+# --------------------------------------------------------------------------------------------------
+def test_same_as_generated(grammar, arithmetic, constructors, tokens, tokentype):
+
+    program = Compiler(grammar(arithmetic), tokentype).compile().link(constructors)
+    plain   = Generator(grammar(arithmetic), tokentype).load(constructors)
+
+    for source in SOURCES:
+        assert Machine(program, tokens(source)).parse() == plain(tokens(source)).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- TEST :: A Program Survives Serialization ----------------------------
+# --------------------------------------------------------------------------------------------------
+def test_serialized(grammar, arithmetic, constructors, tokens, tokentype):
+
+    program = Compiler(grammar(arithmetic), tokentype).compile()
+    loaded  = Program.loads(program.dumps())
+
+    program.link(constructors)
+    loaded.link(constructors)
+
+    for source in SOURCES:
+        assert Machine(loaded, tokens(source)).parse() == Machine(program, tokens(source)).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------ TEST :: Optional Captures Agree with the Generated Parser, None Included ------------
+# --------------------------------------------------------------------------------------------------
+def test_optional_captures(grammar, tokens, tokentype):
+
+    namespace = {
+        'Slice' : lambda a, b, c: ('slice', LITERAL(a), LITERAL(b), LITERAL(c)),
+        'One'   : lambda x: ('one', LITERAL(x)),
+        'Many'  : lambda xs: ('many', [ LITERAL(x) for x in xs ]),
+    }
+
+    program = Compiler(grammar(OPTIONAL), tokentype).compile().link(namespace)
+    plain   = Generator(grammar(OPTIONAL), tokentype).load(namespace)
+
+    assert Machine(program, tokens('[ 1 : 2 : ]')).parse() == ('slice', '1', '2', None)
+
+    for first, *rest in product('[glr', *[ ('1', 'x', ':', '!', ';', '.', ']') ] * 4):
+
+        source = ' '.join((first, *rest))
+
+        machine, parser = Machine(program, tokens(source)), plain(tokens(source))
+
+        assert machine.parse() == parser.parse(), source
+        assert machine.offset == parser.offset, source
\ No newline at end of file
@@ -0,0 +1,246 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------- PARSING :: Node Arena --------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ..  Visitors.Visitor import method
+
+from  .  View import View
+from  .  View import LIST
+from  .  View import NONE
+from  .  View import TOKEN
+from  .  View import VALUE
+
+from array  import array
+from typing import Any
+from typing import Iterable
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------------- CLASS :: Node Arena ---------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Arena(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    origin   : str
+
+    kinds    : array
+    firsts   : array
+    nexts    : array
+    starts   : array
+    ends     : array
+    values   : dict[int, Any]
+    parents  : array | None
+
+    names    : list[str]
+    fields   : list[tuple[str, ...]]
+    methods  : list[str]
+    indexes  : dict[type, int]
+
+    types    : array
+    literals : list[str]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, tree: Any, tokens: Iterable[Any], origin: str = '') -> None:
+
+        self.origin   = origin
+
+        self.kinds    = array('i')
+        self.firsts   = array('i')
+        self.nexts    = array('i')
+        self.starts   = array('i')
+        self.ends     = array('i')
+        self.values   = {}
+        self.parents  = None
+
+        self.names    = [ 'None', 'Token', 'List', 'Value' ]
+        self.fields   = [ (), (), (), () ]
+        self.methods  = [ method(name) for name in self.names ]
+        self.indexes  = {}
+
+        tokens = [ token for token in tokens if token is not None ]
+
+        self.types    = array('q', (int(token.type) for token in tokens))
+        self.literals = [ token.literal for token in tokens ]
+
+        self.build(tree, { id(token): index for index, token in enumerate(tokens) })
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Arena('{self.origin}', {len(self.kinds)} rows, {len(self.literals)} tokens)"
+
+    def __str__(self)  -> str:
+        return f"Arena('{self.origin}', {len(self.kinds)} rows, {len(self.literals)} tokens)"
+
+    def __len__(self)  -> int:
+        return len(self.kinds)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- HELPER :: Kind of a Node Class, Registered Once ---------------------
+    # ------------------------------------------------------------------------------------------
+    def kind(self, cls: type) -> int:
+
+        if (kind := self.indexes.get(cls)) is None:
+
+            kind = self.indexes[cls] = len(self.names)
+
+            self.names.append(cls.__name__)
+            self.fields.append(tuple(cls.__match_args__))
+            self.methods.append(method(cls.__name__))
+
+        return kind
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- BUILDER :: Append a Row for a Value, with its Children -----------------
+    # ------------------------------------------------------------------------------------------
+    def row(self, value: Any, tokens: dict[int, int]) -> tuple[int, Any]:
+
+        row, start, children = len(self.kinds), -1, ()
+
+        if value is None:
+            kind = NONE
+
+        elif (index := tokens.get(id(value))) is not None:
+            kind, start = TOKEN, index
+
+        elif isinstance(value, (list, tuple)):
+            kind, children = LIST, value
+
+        elif hasattr(type(value), '__match_args__'):
+            kind = self.kind(type(value))
+            children = [ getattr(value, field) for field in self.fields[kind] ]
+
+        else:
+            kind = VALUE
+            self.values[row] = value
+
+        self.kinds.append(kind)
+        self.firsts.append(-1)
+        self.nexts.append(-1)
+        self.starts.append(start)
+        self.ends.append(start)
+
+        return row, children
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- BUILDER :: Lay a Tree out in Pre-Order, Linking its Rows ----------------
+    # ------------------------------------------------------------------------------------------
+    def build(self, tree: Any, tokens: dict[int, int]) -> None:
+
+        firsts, nexts, starts, ends = self.firsts, self.nexts, self.starts, self.ends
+
+        row, children = self.row(tree, tokens)
+        pending = [ [ row, iter(children), -1 ] ]
+
+        while pending:
+
+            frame = pending[-1]
+
+            if (child := next(frame[1], pending)) is pending:    # every child is laid out, so span them
+
+                pending.pop()
+                child = firsts[parent := frame[0]]
+
+                while child >= 0:
+
+                    if starts[child] >= 0:
+                        starts[parent] = starts[child] if starts[parent] < 0 else starts[parent]
+                        ends[parent] = ends[child]
+
+                    child = nexts[child]
+
+                continue
+
+            row, children = self.row(child, tokens)
+
+            if frame[2] < 0:
+                firsts[frame[0]] = row
+
+            else:
+                nexts[frame[2]] = row
+
+            frame[2] = row
+
+            if children:
+                pending.append([ row, iter(children), -1 ])
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- QUERY :: Parent of a Row, Linked in One Lazy Pass --------------------
+    # ------------------------------------------------------------------------------------------
+    def parent(self, row: int) -> int:
+
+        if self.parents is None:
+
+            parents, firsts, nexts = array('i', [ -1 ]) * len(self.kinds), self.firsts, self.nexts
+
+            for parent in range(len(self.kinds)):
+
+                child = firsts[parent]
+
+                while child >= 0:
+                    parents[child] = parent
+                    child = nexts[child]
+
+            self.parents = parents
+
+        return self.parents[row]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- QUERY :: Node Owning a Row, Looking Through Lists --------------------
+    # ------------------------------------------------------------------------------------------
+    def owner(self, row: int) -> int:
+
+        while (row := self.parent(row)) >= 0 and self.kinds[row] == LIST:
+            pass
+
+        return row
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ QUERY :: Child Rows of a Row ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def children(self, row: int) -> list[int]:
+
+        rows, child = [], self.firsts[row]
+
+        while child >= 0:
+            rows.append(child)
+            child = self.nexts[child]
+
+        return rows
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- QUERY :: Python Value of a Row, Viewing Nodes and Tokens ----------------
+    # ------------------------------------------------------------------------------------------
+    def resolve(self, row: int) -> Any:
+
+        if (kind := self.kinds[row]) == NONE:
+            return None
+
+        if kind == VALUE:
+            return self.values[row]
+
+        if kind == LIST:
+            return [ self.resolve(child) for child in self.children(row) ]
+
+        return View(self, row)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- QUERY :: View of the Root Node -----------------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def root(self) -> Any:
+        return self.resolve(0)
\ No newline at end of file
@@ -0,0 +1,49 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------------- TESTS :: Node Arena ---------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ..  Arena            import Arena
+from ... Parser.Generator import Generator
+from ... Visitors.Visitor import Visitor
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------- CLASS :: Visitor Evaluating an Arithmetic Tree -------------------------
+# --------------------------------------------------------------------------------------------------
+class Evaluator(Visitor[object]):
+
+    def visit_bin(self, node):
+        return (node.a.accept(self), node.op.literal, node.b.accept(self))
+
+    def visit_num(self, node):
+        return int(node.a.literal)
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- TEST :: Views Read Fields, Spans and Tokens off the Rows --------------------
+# --------------------------------------------------------------------------------------------------
+def test_views(grammar, arithmetic, tokens, tokentype):
+
+    parser = Generator(grammar(arithmetic), tokentype, nodes=True).load()
+    arena  = Arena(parser(source := tokens('1 + 2 * 3')).parse(), source)
+    root   = arena.root
+
+    assert (root.kind, root.fields, len(arena)) == ('Bin', ('a', 'op', 'b'), 10)
+    assert (root.start, root.end, root.b.start, root.b.end) == (0, 4, 2, 4)
+    assert (root.op.literal, root.op.type) == ('+', tokentype.OPERATOR)
+    assert root.children == [ root.a, root.op, root.b ] and root.a.sibling == root.op
+
+    three = root.b.b.a
+
+    assert (three.literal, three.parent, three.parent.parent) == ('3', root.b.b, root.b)
+    assert three.enclosing('Bin') == root.b and root.enclosing('Bin') is None
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: One Visitor Runs over Both the Arena and the Object Tree ----------------
+# --------------------------------------------------------------------------------------------------
+def test_visited(grammar, arithmetic, tokens, tokentype):
+
+    parser = Generator(grammar(arithmetic), tokentype, nodes=True).load()
+    tree   = parser(source := tokens('( 1 + 2 ) * 3 + 4')).parse()
+
+    assert Arena(tree, source).root.accept(Evaluator()) == tree.accept(Evaluator()) == (((1, '+', 2), '*', 3), '+', 4)
\ No newline at end of file
@@ -0,0 +1,148 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- PARSING :: Arena Node View -----------------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from .. Visitors.Visitor import Visitor
+    from .  Arena            import Arena
+
+R = TypeVar('R')
+
+NONE, TOKEN, LIST, VALUE = 0, 1, 2, 3    # kinds of the arena rows that are not nodes
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ CLASS :: Arena Node View ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class View(object):
+
+    __slots__ = ('arena', 'row')
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    arena : 'Arena'
+    row   : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, arena: 'Arena', row: int) -> None:
+
+        self.arena = arena
+        self.row   = row
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"View('{self.kind}', {self.row})"
+
+    def __str__(self)  -> str:
+        return f"View('{self.kind}', {self.row})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- COMPARISON :: Row Identity -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, View) and other.arena is self.arena and other.row == self.row
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.row))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- ACCESSOR :: Field Values by Name, like a Node ----------------------
+    # ------------------------------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Any:
+
+        arena = self.arena
+        fields = arena.fields[arena.kinds[self.row]]
+
+        if name not in fields:
+            raise AttributeError(f"'{self.kind}' has no field '{name}'")
+
+        child = arena.firsts[self.row]
+
+        for _ in range(fields.index(name)):
+            child = arena.nexts[child]
+
+        return arena.resolve(child)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITATION :: Accept Visitor ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def accept(self, visitor: 'Visitor[R]') -> R:
+        return getattr(visitor, self.arena.methods[self.arena.kinds[self.row]], visitor.visit_generic)(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- PROPERTIES :: Kind and Fields ------------------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def kind(self) -> str:
+        return self.arena.names[self.arena.kinds[self.row]]
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return self.arena.fields[self.arena.kinds[self.row]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- PROPERTIES :: Parent, Children and Siblings -----------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def parent(self) -> 'View | None':
+        return None if (row := self.arena.owner(self.row)) < 0 else View(self.arena, row)
+
+    @property
+    def children(self) -> list[Any]:
+        return [ self.arena.resolve(child) for child in self.arena.children(self.row) ]
+
+    @property
+    def sibling(self) -> Any:
+        return None if (row := self.arena.nexts[self.row]) < 0 else self.arena.resolve(row)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- PROPERTIES :: Token Table Entry of a Token -----------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def literal(self) -> str | None:
+        return self.arena.literals[self.start] if self.arena.kinds[self.row] == TOKEN else None
+
+    @property
+    def type(self) -> int:
+        return self.arena.types[self.start] if self.arena.kinds[self.row] == TOKEN else 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- PROPERTIES :: Bounds of Node as Token Indices ----------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def start(self) -> int:
+        return self.arena.starts[self.row]
+
+    @property
+    def end(self) -> int:
+        return self.arena.ends[self.row]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- QUERY :: Nearest Ancestor of a Given Kind ------------------------
+    # ------------------------------------------------------------------------------------------
+    def enclosing(self, kind: str) -> 'View | None':
+
+        arena, row = self.arena, self.arena.owner(self.row)
+
+        while row >= 0 and arena.names[arena.kinds[row]] != kind:
+            row = arena.owner(row)
+
+        return None if row < 0 else View(arena, row)
\ No newline at end of file
@@ -0,0 +1,225 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- PARSING :: Content-Addressed Cache -------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Parser.Parser import Parser as Preparser
+from ... Preparsing.Nodes.Root    import Root
+
+from  . Generator import Generator
+from  . Parser    import Parser
+
+from enum   import IntFlag
+from typing import Any
+
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Content-Addressed Cache --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Cache(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    directory : str
+    limit     : int
+
+    hits      : int
+    misses    : int
+
+    VERSION = 5    # bump whenever the nodes or the generated source change shape
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, directory: str, limit: int = 64 << 20) -> None:
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.limit     = limit
+
+        self.hits      = 0
+        self.misses    = 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Cache('{self.directory}', {self.hits} hits, {self.misses} misses)"
+
+    def __str__(self)  -> str:
+        return f"Cache('{self.directory}', {self.hits} hits, {self.misses} misses)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Key from the Grammar Bytes, the Tool and the Options -------------
+    # ------------------------------------------------------------------------------------------
+    def key(self, source: bytes, *salt: Any) -> str:
+
+        digest = hashlib.sha256(source)    # marshalled bytecode only loads on the Python that wrote it
+        digest.update(repr((Cache.VERSION, sys.implementation.cache_tag, *salt)).encode())
+
+        return digest.hexdigest()
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- HELPER :: Canonical Spelling of Generator Options --------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def options(tokentype: type[IntFlag], options: dict[str, Any]) -> tuple[Any, ...]:
+
+        spelled = [
+            (name, f"{value.__module__}.{value.__qualname__}" if isinstance(value, type) else value)
+            for name, value in sorted(options.items())
+        ]
+
+        return tuple((member.name, int(member)) for member in tokentype), tuple(spelled)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- STORAGE :: Read an Entry, Marking it Recently Used -------------------
+    # ------------------------------------------------------------------------------------------
+    def read(self, name: str) -> bytes | None:
+
+        path = os.path.join(self.directory, name)
+
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+
+            os.utime(path)    # the modification time orders eviction
+
+        except FileNotFoundError:    # never written, or evicted by another process meanwhile
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------- STORAGE :: Write an Entry Atomically --------------------------
+    # ------------------------------------------------------------------------------------------
+    def write(self, name: str, data: bytes) -> None:
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+
+            os.replace(temporary, os.path.join(self.directory, name))    # readers see all of it or none
+
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- STORAGE :: Remove Least Recently Used Entries over Limit ----------------
+    # ------------------------------------------------------------------------------------------
+    def evict(self) -> None:
+
+        entries = []
+
+        for entry in os.scandir(self.directory):
+
+            if entry.name.endswith('.tmp'):    # another writer's, not yet in place
+                continue
+
+            try:
+                status = entry.stat()
+
+            except FileNotFoundError:
+                continue
+
+            entries.append((status.st_mtime, status.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+
+            if total <= self.limit:
+                break
+
+            try:
+                os.unlink(path)
+
+            except FileNotFoundError:
+                pass
+
+            total -= size
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- CACHE :: Parsed Grammar, Parsing on a Miss -----------------------
+    # ------------------------------------------------------------------------------------------
+    def root(self, origin: str) -> Root:
+
+        with open(origin, 'rb') as file:
+            name = f"{self.key(file.read(), origin)}.root"
+
+        if (data := self.read(name)) is not None:
+            return pickle.loads(data)
+
+        parser = Preparser(origin)
+        root   = parser.parse()
+
+        if not parser.fallback.errors:    # a grammar with errors is reported afresh each time
+
+            try:
+                self.write(name, pickle.dumps(root, pickle.HIGHEST_PROTOCOL))
+                self.evict()
+
+            except RecursionError:    # nesting too deep to serialize, so it is just not kept
+                pass
+
+        return root
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- CACHE :: Generated Parser, Generating on a Miss ---------------------
+    # ------------------------------------------------------------------------------------------
+    def parser(self,
+        origin: str, tokentype: type[IntFlag], namespace: dict[str, Any] | None = None, **options: Any
+    ) -> type[Parser]:
+
+        with open(origin, 'rb') as file:
+            name = f"{self.key(file.read(), origin, self.options(tokentype, options))}.parser"
+
+        if (data := self.read(name)) is not None:
+            shell, units, stepped = marshal.loads(data)
+
+        else:
+
+            generator = Generator(self.root(origin), tokentype, **options)
+            context   = generator.context()
+
+            shell, units, stepped = generator.compile_shell(), [], []
+
+            for rule, definition in generator.rules.items():    # compiled only if its fingerprint is new
+
+                unit = f"{self.key(generator.fingerprint(rule).encode(), origin, context)}.unit"
+
+                if (data := self.read(unit)) is not None:
+                    code, names = marshal.loads(data)
+
+                else:
+                    code, names = generator.compile_unit(definition)
+                    self.write(unit, marshal.dumps((code, names)))
+
+                units.append(code)
+                stepped += names
+
+            self.write(name, marshal.dumps((shell, units, stepped)))
+            self.evict()
+
+        return Generator.assemble(shell, units, stepped, namespace)
\ No newline at end of file
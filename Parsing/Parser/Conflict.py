@@ -0,0 +1,41 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------- PARSING :: LALR(1) Conflict -----------------------------------
+# --------------------------------------------------------------------------------------------------
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- CLASS :: LALR(1) Conflict ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Conflict(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    kind      : str
+    state     : int
+    lookahead : str
+    rules     : list[str]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, kind: str, state: int, lookahead: str, rules: list[str]) -> None:
+
+        self.kind      = kind
+        self.state     = state
+        self.lookahead = lookahead
+        self.rules     = rules
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Conflict('{self.kind}', {self.state}, {self.lookahead})"
+
+    def __str__(self)  -> str:
+        return (
+            f"{self.kind} conflict in state {self.state} on {self.lookahead}: "
+            f"falling back to PEG for {', '.join(self.rules)}"
+        )
\ No newline at end of file
@@ -0,0 +1,107 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- PARSING :: Event-Reporting Runtime -------------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Handler import Handler
+from  . Parser  import Parser
+
+from typing import Callable
+from typing import Iterable
+from typing import Any
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------- FUNCTION :: Report Entering and Exiting a Rule Method ----------------------
+# --------------------------------------------------------------------------------------------------
+def notify(method: Callable[['Handled'], Any]) -> Callable[['Handled'], Any]:
+
+    name = method.__name__
+    rule = name.removeprefix('rule_')
+
+    def notified(self: 'Handled') -> Any:
+
+        handler, offset = self.handler, self.offset
+        handler.enter_rule(rule, offset)
+
+        result = method(self)
+        handler.exit_rule(rule, self.offset, result is not None)
+
+        return result
+
+    notified.__name__ = name
+    return notified
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Handler-Holding Runtime --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Handled(Parser):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    handler : Handler
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, tokens: Iterable[Any], handler: Handler | None = None) -> None:
+
+        super().__init__(tokens)
+
+        self.handler = handler if handler is not None else Handler()
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Event-Reporting Runtime --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Events(Handled):    # only when tokens are reported, as its matchers cost a call each
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- MATCHERS :: Match Tokens, Reporting each Match ---------------------
+    # ------------------------------------------------------------------------------------------
+    def expect(self, mask: int) -> Any:
+
+        if self.types[offset := self.offset] & mask:
+
+            self.offset = offset + 1
+            self.handler.token(token := self.tokens[offset])
+
+            return token
+
+        return None
+
+    def expect_literal(self, literal: str) -> Any:
+
+        if self.literals[offset := self.offset] == literal:
+
+            self.offset = offset + 1
+            self.handler.token(token := self.tokens[offset])
+
+            return token
+
+        return None
+
+    def expect_literals(self, literals: frozenset[str]) -> Any:
+
+        if self.literals[offset := self.offset] in literals:
+
+            self.offset = offset + 1
+            self.handler.token(token := self.tokens[offset])
+
+            return token
+
+        return None
+
+    def expect_any(self, mask: int, literals: frozenset[str]) -> Any:
+
+        offset = self.offset
+
+        if self.types[offset] & mask or self.literals[offset] in literals:
+
+            self.offset = offset + 1
+            self.handler.token(token := self.tokens[offset])
+
+            return token
+
+        return None
\ No newline at end of file
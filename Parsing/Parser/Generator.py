@@ -0,0 +1,1322 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: PEG Parser Generator ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Visitors.Visitor       import Visitor
+from ... Preparsing.Visitors.Fingerprinter import Fingerprinter
+from ... Preparsing.Visitors.Interner      import Interner
+from ... Preparsing.Visitors.Shape         import Shape
+
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Call          import Call
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Definition    import Definition
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Negative      import Negative
+from ... Preparsing.Nodes.Number        import Number
+from ... Preparsing.Nodes.Optional      import Optional
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Root          import Root
+from ... Preparsing.Nodes.Sequence      import Sequence
+from ... Preparsing.Nodes.Star          import Star
+from ... Preparsing.Nodes.String        import String
+
+from  . Events      import Events
+from  . Events      import Handled
+from  . Events      import notify
+from  . Handler     import Handler
+from  . Incremental import Incremental
+from  . Incremental import track
+from  . Parser      import NOTHING
+from  . Parser      import Parser
+from  . Parser      import frame
+from  . Parser      import memoize
+from  . Regular     import Regular
+from  . Schema      import Schema
+from  . Table       import Table
+from  . Tower       import Tower
+
+from array  import array
+from enum   import IntFlag
+from types  import CodeType
+from typing import Any
+
+import keyword
+import re
+
+CALL = re.compile(    # a method call as invoke() compiles it, recursive or stepped
+    r"self\.(\w+)\(\)|\(\(yield (?:'(\w+)'|self\.(\w+)_stepped\(\))\) or self\.returned\)"
+)
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: PEG Parser Generator ----------------------------------
+# --------------------------------------------------------------------------------------------------
+class Generator(Shape, Visitor[str]):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    root      : Root
+    tokentype : type[IntFlag]
+    rules     : dict[str, Definition]
+    towers    : dict[str, tuple[Tower, int]]
+    table     : Table | None
+    regular   : Regular | None
+    schema    : Schema | None
+    deferred  : bool
+    tracked   : bool
+    handler   : type[Handler] | None
+    reported  : set[str]
+    blocks    : tuple[int, int] | None
+    stackless : bool
+    stepped   : list[str]
+    cuts      : bool
+    nones     : set[str]
+
+    constants    : list[str]
+    helpers      : list[list[str]]
+    locals       : set[str]
+    voids        : set[str]
+    digests      : dict[str, str]
+    fingerprints : dict[str, str]
+    interner     : Interner
+    emitted      : set[tuple[str, bool]]
+
+    rule      : str
+    counter   : int
+    declared  : int
+    framed    : bool
+    ratchet   : bool
+    stepping  : bool
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self,
+        root: Root, tokentype: type[IntFlag],
+        lalr: bool = False, regular: bool = False, deferred: bool = False, nodes: bool = False,
+        incremental: bool = False, handler: type[Handler] | None = None, lazy: bool = False,
+        stackless: bool = False
+    ) -> None:
+
+        if lalr and deferred:
+            raise ValueError("deferred actions need a parser instance, which LALR(1) reductions do not have")
+
+        if incremental and (lalr or regular or deferred):    # their reads and logs are not per-token spans
+            raise ValueError("incremental parsing reuses memo entries, so it excludes LALR(1), regular and deferred")
+
+        if handler is not None and (lalr or regular or deferred or incremental):    # only rule methods report
+            raise ValueError("a handler replaces the actions of rule methods, so it excludes every other mode")
+
+        if lazy and handler is not None:    # a body parsed later would report to no handler
+            raise ValueError("lazy block bodies are parsed apart from the parse reporting to the handler")
+
+        if lazy and incremental:    # an edit shifts the memo entries, but not the spans their bodies hold
+            raise ValueError("lazy block bodies keep their token spans, which incremental edits would shift")
+
+        self.root      = root
+        self.tokentype = tokentype
+        self.rules     = root.rules()
+        self.deferred  = deferred
+        self.tracked   = incremental
+        self.handler   = handler
+        self.reported  = {    # a hook left as the no-op default costs nothing, so is never called
+            event for event in ('enter_rule', 'exit_rule', 'token', 'action_result')
+            if handler is not None and getattr(handler, event) is not getattr(Handler, event)
+        }
+        self.blocks    = None
+        self.stackless = stackless
+        self.stepped   = []
+        self.cuts      = any(map(self.cutting, self.rules.values()))
+
+        if stackless and (incremental or self.reported & { 'enter_rule', 'exit_rule' }):
+            raise ValueError("stepped rules are run by a driver, so they cannot be wrapped by decorators")
+
+        self.constants    = []
+        self.helpers      = []
+        self.locals       = set()
+        self.voids        = set()
+        self.digests, self.fingerprints = Fingerprinter.fingerprint(root)
+        self.interner     = Interner()
+        self.emitted      = set()
+
+        if lazy:
+            self.blocks = (self.mask('INDENT'), self.mask('DEDENT'))
+
+        self.rule      = ''
+        self.counter   = 0
+        self.declared  = 0
+        self.framed    = False
+        self.ratchet   = False
+        self.stepping  = False
+
+        self.nones     = set()
+
+        while grown := {    # returning another rule's None output makes a rule one too, so to a fixpoint
+            name for name, definition in self.rules.items()
+            if name not in self.nones and self.vacant(self.alternatives(definition.productions))
+        }:
+            self.nones |= grown
+
+        self.towers    = Tower.detect(self)    # last, as the analyses compile actions with the modes above
+        self.table     = Table(self) if lalr else None
+        self.regular   = Regular(self) if regular else None
+        self.schema    = Schema(self) if nodes else None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Generator('{self.root.origin}')"
+
+    def __str__(self)  -> str:
+        return f"Generator('{self.root.origin}')"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- HELPER :: Banner Comment for Generated Source ----------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def banner(title: str, indent: int = 0) -> list[str]:
+
+        inner = 100 - 2 * indent - 2
+        text  = f" {title} "
+        left  = (inner - len(text)) // 2
+
+        rule  = f"{' ' * indent}# {'-' * inner}"
+        title = f"{' ' * indent}# {'-' * left}{text}{'-' * (inner - len(text) - left)}"
+
+        return [rule, title, rule]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- HELPER :: Allocate a Unique Local Name -------------------------
+    # ------------------------------------------------------------------------------------------
+    def local(self, name: str = 'item') -> str:
+
+        base = f"{name}_" if keyword.iskeyword(name) or name == 'self' else name
+        local, suffix = base, 0
+
+        while local in self.locals:
+            local, suffix = f"{base}_{suffix + 1}", suffix + 1
+
+        self.locals.add(local)
+        return local
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- HELPER :: Allocate a Unique Helper-Method Name ---------------------
+    # ------------------------------------------------------------------------------------------
+    def helper(self) -> str:
+
+        self.counter += 1
+        return f"_{self.rule}_{self.counter}"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ HELPER :: Name a Helper for its Structure, and Whether it is New ------------
+    # ------------------------------------------------------------------------------------------
+    def shared(self, kind: str, node: Expression) -> tuple[str, bool]:
+
+        name = f"_{kind}_{self.interner.key(node).hex()[:12]}"    # equal subexpressions, one method
+
+        if fresh := (name, self.stepping) not in self.emitted:
+            self.emitted.add((name, self.stepping))
+
+        return name, fresh
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ HELPER :: Compile a Call to a Rule or Helper Method -------------------
+    # ------------------------------------------------------------------------------------------
+    def invoke(self, method: str, arguments: str = '') -> str:
+
+        if not self.stepping:
+            return f"self.{method}({arguments})"
+
+        if method.startswith('rule_'):    # named, so the driver memoizes it
+            return f"((yield {method!r}) or self.returned)"
+
+        return f"((yield self.{method}_stepped({arguments})) or self.returned)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ HELPER :: Type Mask of a Token-Type Name ------------------------
+    # ------------------------------------------------------------------------------------------
+    def mask(self, name: str) -> int:
+
+        for candidate in (name, name.upper()):
+
+            if candidate in self.tokentype.__members__:
+                return int(self.tokentype[candidate])
+
+        raise NameError(f"undefined rule or tokentype '{name}' in '{self.root.origin}'")
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ HELPER :: Whether a Node Contains a Cut -------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def cutting(node: Any) -> bool:
+
+        pending = [ node ]
+
+        while pending:
+
+            if isinstance(node := pending.pop(), Cut):
+                return True
+
+            pending += node.children()
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Split an Item into its Binding Name and Expression --------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def binding(item: Expression) -> tuple[str | None, Expression]:
+
+        if isinstance(item, Assignment):
+            return item.identifier.token.literal, item.expression
+
+        body = item
+
+        while isinstance(body, Parenthetical) and body.output is None:
+            body = body.expression
+
+        if isinstance(body, (Star, Plus)) and isinstance(inner := body.expression, Assignment):
+            return inner.identifier.token.literal, body.__class__(inner.expression)   # 'a=x*' binds the list
+
+        if isinstance(body, (Star, Plus)) and isinstance(group := body.expression, Parenthetical):
+
+            if group.output and isinstance(capture := group.output.expression, Identifier):
+                return capture.token.literal, item   # repetition of '{a}' captures binds 'a'
+
+        return None, item
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- HELPER :: Whether an Item Ends an Alternative with a Nested Choice -----------
+    # ------------------------------------------------------------------------------------------
+    def factored(self, item: Expression) -> bool:
+
+        expression = self.binding(item)[1]
+
+        return isinstance(expression, Alternation) and any(
+            isinstance(e, Production) for e in expression.expressions
+        )
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- HELPER :: Whether an Item Ends an Alternative with an Inline Loop ------------
+    # ------------------------------------------------------------------------------------------
+    def repeated(self, item: Expression) -> bool:
+        return isinstance(self.binding(item)[1], (Star, Plus, Gather))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- HELPER :: Whether the Item at an Index is Between INDENT and DEDENT -----------
+    # ------------------------------------------------------------------------------------------
+    def enclosed(self, items: list[Expression], index: int) -> bool:
+
+        if self.blocks is None or not 0 < index < len(items) - 1:
+            return False
+
+        before, after = self.binding(items[index - 1])[1], self.binding(items[index + 1])[1]
+
+        return all(
+            isinstance(node, Identifier) and self.terminal(node) and self.mask(node.token.literal) == mask
+            for node, mask in zip((before, after), self.blocks)
+        )
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Whether some Alternative can have None as its Value --------------
+    # ------------------------------------------------------------------------------------------
+    def vacant(self,
+        alternatives: list[tuple[Expression, Output | None]], bound: dict[str, Expression] | None = None
+    ) -> bool:
+
+        for expression, output in alternatives:
+
+            items  = [ item for item in self.items(expression) if not isinstance(item, Cut) ]
+            names  = dict(bound or {})
+            values = []
+
+            for item in items:
+
+                name, body = self.binding(item)
+
+                if name:
+                    names[name] = body
+
+                if not isinstance(body, Negative):
+                    values.append(body)
+
+            if items and self.factored(items[-1]):    # the nested alternatives return in its place
+
+                if self.vacant(self.alternatives(self.binding(items[-1])[1]), names):
+                    return True
+
+                continue
+
+            if output is None:
+                value = values[0] if len(values) == 1 else None
+
+            elif isinstance(capture := output.expression, Identifier):
+                value = names.get(capture.token.literal)
+
+            else:
+                value = None    # an action builds its node, so is never None
+
+            if value is not None and (isinstance(value, Optional) or self.hollow(value)):
+                return True
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- HELPER :: Whether the Method Compiled for an Expression can Return NOTHING -------
+    # ------------------------------------------------------------------------------------------
+    def hollow(self, node: Expression) -> bool:
+
+        if isinstance(node, Identifier):
+            return node.token.literal in self.nones
+
+        if isinstance(node, Assignment):
+            return self.hollow(node.expression)
+
+        if isinstance(node, (Optional, Parenthetical)):
+
+            if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+                return self.hollow(node.expression)
+
+            return self.vacant(self.alternatives(node.expression, node.output))
+
+        if isinstance(node, Alternation):
+            return not self.terminal(node) and self.vacant(self.alternatives(node))
+
+        if isinstance(node, Concatenation):
+            return self.vacant([ (node, None) ])
+
+        if isinstance(node, Production):
+            return self.vacant([ (node.expression, node.output) ])
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- HELPER :: Whether Statements End in a Return at their Own Indentation ----------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def exhausted(lines: list[str], indent: int) -> bool:
+        return bool(lines) and lines[-1].startswith(f"{' ' * indent}return ")
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ EMITTER :: Compile an Output Expression into a Python Expression ------------
+    # ------------------------------------------------------------------------------------------
+    def action(self, node: Expression, scope: dict[str, str], nested: bool = False) -> str:
+
+        if isinstance(node, Output):
+            return self.action(node.expression, scope)
+
+        if isinstance(node, Identifier):
+            return scope.get(node.token.literal, node.token.literal)
+
+        if isinstance(node, Star):
+            return f"*{self.action(node.expression, scope, True)}"
+
+        if isinstance(node, Call):
+
+            if isinstance(node.parameters, Sequence):
+                parameters = list(node.parameters.elements)
+
+            else:
+                parameters = [ node.parameters ]
+
+            if self.handler is not None and 'action_result' not in self.reported:
+                return "True"    # recognition only, so no node is built
+
+            if self.handler is not None:
+
+                action    = node.identifier.token.literal
+                arguments = ''.join(f"{self.action(p, scope, True)}, " for p in parameters)
+
+                return f"self.handler.action_result({action!r}, ({arguments.rstrip()}))"
+
+            function = self.action(node.identifier, scope)
+
+            if self.deferred:   # logged with its captures, and only called once the parse commits
+
+                stars = sum(1 << index for index, p in enumerate(parameters) if isinstance(p, Star))
+                plain = [ p.expression if isinstance(p, Star) else p for p in parameters ]
+                arguments = [ self.action(p, scope, True) for p in plain ]
+
+                return f"self.defer({function}, {stars}, {', '.join(arguments)})"
+
+            return f"{function}({', '.join(self.action(p, scope, True) for p in parameters)})"
+
+        if isinstance(node, Sequence):
+
+            elements = ', '.join(self.action(e, scope, True) for e in node.elements)
+            return f"{elements}" if nested else f"({elements},)"
+
+        raise SyntaxError(f"unsupported output expression '{node.__class__.__name__}'")
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- EMITTER :: Compile the Value of an Alternative ---------------------
+    # ------------------------------------------------------------------------------------------
+    def value(self, output: Output | None, names: list[str], scope: dict[str, str]) -> str:
+
+        if output is not None:
+            return self.action(output, scope)
+
+        if len(names) == 1:
+            return names[0]
+
+        return f"({', '.join(names)},)" if names else "()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- EMITTER :: Compile the Value an Alternative Returns, None as NOTHING ----------
+    # ------------------------------------------------------------------------------------------
+    def outcome(self, value: str) -> str:
+        return f"NOTHING if {value} is None else {value}" if value in self.voids else value
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- EMITTER :: Compile an Item into a Condition -----------------------
+    # ------------------------------------------------------------------------------------------
+    def condition(self,
+        item: Expression, scope: dict[str, str], bind: bool, lazy: bool = False
+    ) -> tuple[str, str]:
+
+        name, expression = self.binding(item)
+
+        if isinstance(expression, Negative):
+            return self.negative(expression), ''
+
+        call = expression.accept(self)
+
+        if lazy and (method := CALL.fullmatch(call)):
+            call = f"self.skip({self.blocks[0]}, {self.blocks[1]}, {next(filter(None, method.groups()))!r})"
+
+        local = self.local(name or 'item') if name or bind else ''
+
+        if name:
+            scope[name] = local
+
+        hollow = bool(local) and self.hollow(expression)
+
+        if local and (hollow or isinstance(expression, Optional)):    # it may be bound to None
+            self.voids.add(local)
+
+        if hollow:    # a None output comes back as NOTHING, and is bound as None again
+
+            if isinstance(expression, Optional):
+                return f"(({local} := {call}) is not NOTHING or ({local} := None) is None)", local
+
+            unwrap = f"({local} is not NOTHING or ({local} := None) is None)"
+            return f"({local} := {call}) is not None and {unwrap}", local
+
+        if isinstance(expression, Optional):
+            return (f"(({local} := {call}) or True)" if local else f"({call} or True)"), local
+
+        return (f"({local} := {call}) is not None" if local else f"{call} is not None"), local
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- EMITTER :: Compile a Sequence of Items into Conditions -----------------
+    # ------------------------------------------------------------------------------------------
+    def conditions(self,
+        items: list[Expression], scope: dict[str, str], bind: bool
+    ) -> tuple[list[str], list[str]]:
+
+        conditions, names = [], []
+
+        for index, item in enumerate(items):
+
+            condition, name = self.condition(item, scope, bind, self.enclosed(items, index))
+            conditions.append(condition)
+
+            if name or not bind:
+                names.append(name)
+
+        return conditions, names
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- EMITTER :: Compile Conditions into an If-Statement Header ----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def header(conditions: list[str], indent: int) -> list[str]:
+
+        pad = ' ' * indent
+
+        if len(conditions) == 1:
+            return [ f"{pad}if {conditions[0]}:" ]
+
+        return [
+            f"{pad}if (",
+            *(f"{pad}    {c}{' and' if i < len(conditions) - 1 else ''}"
+              for i, c in enumerate(conditions)),
+            f"{pad}):",
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ EMITTER :: Compile a Repetition into an Inline Loop -------------------
+    # ------------------------------------------------------------------------------------------
+    def repetition(self,
+        node: Star | Plus | Gather, local: str, indent: int, scope: dict[str, str]
+    ) -> list[str]:
+
+        pad    = ' ' * indent
+        cursor = self.local('cursor')
+        inner  = dict(scope)
+
+        ratchet, self.ratchet = self.ratchet, False    # the body may rewind, the loop only to its cursor
+        advance = [ f"self.marks[-1] = {cursor}" ] if ratchet else []
+
+        if isinstance(node, Gather):
+
+            value = self.local()
+            item  = f"None if {value} is NOTHING else {value}" if self.hollow(node.expression) else value
+            lines = [
+                f"{pad}{local} = []",
+                f"{pad}{cursor} = self.offset",
+                *(f"{pad}{line}" for line in advance),
+                f"{pad}while ({value} := {node.expression.accept(self)}) is not None:",
+                f"{pad}    {local}.append({item})",
+                f"{pad}    {cursor} = self.offset",
+                *(f"{pad}    {line}" for line in advance),
+                f"{pad}    if {node.separator.accept(self)} is None:",
+                f"{pad}        break",
+                f"{pad}self.offset = {cursor}",
+            ]
+
+            self.ratchet = ratchet
+            return lines
+
+        if len(alternatives := self.alternatives(node.expression)) == 1 and (
+            isinstance(node.expression, (Parenthetical, Concatenation))
+        ):
+
+            expression, output = alternatives[0]
+            items = [ item for item in self.items(expression) if not isinstance(item, Cut) ]
+
+            conditions, names = self.conditions(items, inner, output is None)
+            value = self.value(output, names, inner)
+
+        else:
+
+            value = self.local()
+            conditions = [ f"({value} := {node.expression.accept(self)}) is not None" ]
+
+            if self.hollow(node.expression):
+                value = f"None if {value} is NOTHING else {value}"
+
+        condition = ' and '.join(conditions)
+        self.ratchet = ratchet
+
+        return [
+            f"{pad}{local} = []",
+            f"{pad}{cursor} = self.offset",
+            *(f"{pad}{line}" for line in advance),
+            f"{pad}while {condition}:",
+            f"{pad}    {local}.append({value})",
+            f"{pad}    {cursor} = self.offset",
+            *(f"{pad}    {line}" for line in advance),
+            f"{pad}self.offset = {cursor}",
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- EMITTER :: Compile one Alternative into Statements -------------------
+    # ------------------------------------------------------------------------------------------
+    def alternative(self,
+        expression: Expression, output: Output | None, indent: int, scope: dict[str, str], entry: str
+    ) -> list[str]:
+
+        scope = dict(scope)
+        items = self.items(expression)
+        tail  = items.pop() if items and (self.factored(items[-1]) or self.repeated(items[-1])) else None
+
+        segments, ratchet = [ [] ], self.ratchet
+
+        for item in items:
+
+            if isinstance(item, Cut):
+                segments.append([])
+
+            else:
+                segments[-1].append(item)
+
+        lines, names, inner, commit = [], [], indent, None
+
+        for index, segment in enumerate(segments):
+
+            if index:    # past a cut the choice is committed, so a later failure skips its other alternatives
+
+                commit = inner if commit is None else commit
+
+                if self.framed:
+                    lines.append(f"{' ' * inner}self.cut()")
+                    self.ratchet = True
+
+            conditions, bound = self.conditions(segment, scope, output is None)
+            names += bound
+
+            if conditions:
+                lines += self.header(conditions, inner)
+                inner += 4
+
+        pad = ' ' * inner
+
+        if tail is not None and self.factored(tail):
+            lines += self.choice(self.alternatives(self.binding(tail)[1]), inner, scope, entry)
+
+        elif tail is not None:
+
+            name, repetition = self.binding(tail)
+            local = self.local(name or 'items')
+
+            if name:
+                scope[name] = local
+
+            lines += self.repetition(repetition, local, inner, scope)
+            names.append(local)
+            value = self.outcome(self.value(output, names, scope))
+
+            if isinstance(repetition, (Plus, Gather)):
+                lines += [ f"{pad}if {local}:", f"{pad}    return {value}" ]
+
+            else:
+                lines.append(f"{pad}return {value}")
+
+        else:
+            lines.append(f"{pad}return {self.outcome(self.value(output, names, scope))}")
+
+        if commit is not None and not self.exhausted(lines, commit):    # past a return it is unreachable
+            lines += [ f"{' ' * commit}self.offset = {entry}", f"{' ' * commit}return None" ]
+
+        self.ratchet = ratchet
+        return lines
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ EMITTER :: Compile an Ordered Choice into Statements ------------------
+    # ------------------------------------------------------------------------------------------
+    def choice(self,
+        alternatives: list[tuple[Expression, Output | None]], indent: int, scope: dict[str, str],
+        entry: str | None = None
+    ) -> list[str]:
+
+        pad  = ' ' * indent
+        mark = self.local('mark')
+
+        lines, ratchet = [ f"{pad}{mark} = self.offset" ], self.ratchet
+
+        for index, (expression, output) in enumerate(alternatives):
+
+            self.ratchet = ratchet and index == len(alternatives) - 1    # the last never rewinds to mark
+
+            lines += self.alternative(expression, output, indent, scope, entry or mark)
+
+            if self.exhausted(lines, indent):    # it cannot fail, so no later alternative is ever tried
+                break
+
+            lines.append(f"{pad}self.offset = {mark}")
+
+        self.ratchet = ratchet
+        return lines
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- EMITTER :: Compile a Group into a Helper Method ---------------------
+    # ------------------------------------------------------------------------------------------
+    def group(self, node: Expression, alternatives: list[tuple[Expression, Output | None]]) -> str:
+
+        name, fresh = self.shared('group', node)
+
+        if not fresh:
+            return self.invoke(name)
+
+        saved = (self.locals, self.voids, self.framed, self.ratchet)
+        self.locals, self.voids, self.framed, self.ratchet = set(), set(), False, False
+
+        body = self.choice(alternatives, 8, {})
+
+        if not self.exhausted(body, 8):
+            body.append("        return None")
+
+        self.locals, self.voids, self.framed, self.ratchet = saved
+        self.helpers.append(self.method(f"    def {name}(self):", body))
+
+        return self.invoke(name)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ EMITTER :: Compile a Repetition into a Helper Method ------------------
+    # ------------------------------------------------------------------------------------------
+    def loop(self, node: Star | Plus | Gather) -> str:
+
+        name, fresh = self.shared('loop', node)
+
+        if not fresh:
+            return self.invoke(name)
+
+        saved = (self.locals, self.voids, self.framed, self.ratchet)
+        self.locals, self.voids, self.framed, self.ratchet = set(), set(), False, False    # shared, so the same for any caller
+
+        children = self.local('children')
+        body = self.repetition(node, children, 8, {})
+        result = f"{children} or None" if isinstance(node, (Plus, Gather)) else children
+
+        self.locals, self.voids, self.framed, self.ratchet = saved
+        self.helpers.append(self.method(f"    def {name}(self):", [ *body, f"        return {result}" ]))
+
+        return self.invoke(name)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ EMITTER :: Compile a Precedence Tower into a Pratt Helper Method ------------
+    # ------------------------------------------------------------------------------------------
+    def pratt(self, tower: Tower) -> None:
+
+        saved, self.locals = self.locals, set()
+
+        level, left, cursor = self.local('level'), self.local('left'), self.local('cursor')
+        lines = [ f"    def _{tower.levels[0]}_pratt(self, {level}):" ]
+
+        if any(tower.prefixes):
+
+            mark = self.local('mark')
+            lines += [ f"        {mark} = self.offset", f"        {left} = None" ]
+
+            for index, prefixes in enumerate(tower.prefixes):
+
+                for operator, op, operand, output in prefixes:
+
+                    call = self.invoke(f"rule_{tower.levels[index]}")
+                    op_local, operand_local = self.local(op or 'operator'), self.local(operand or 'operand')
+                    scope = { k: v for k, v in ((op, op_local), (operand, operand_local)) if k }
+                    value = self.value(output, [ op_local, operand_local ], scope)
+
+                    lines += [
+                        f"        if {left} is None and {level} <= {index} and "
+                        f"({op_local} := {operator.accept(self)}) is not None:",
+                        f"            if ({operand_local} := {call}) is not None:",
+                        f"                {left} = {value}",
+                        f"            else:",
+                        f"                self.offset = {mark}",
+                    ]
+
+            lines.append(f"        if {left} is None and ({left} := {self.invoke(f'rule_{tower.base}')}) is None:")
+
+        else:
+            lines.append(f"        if ({left} := {self.invoke(f'rule_{tower.base}')}) is None:")
+
+        lines += [ f"            return None", f"        while True:", f"            {cursor} = self.offset" ]
+
+        for index, binaries in enumerate(tower.binaries):
+
+            below = tower.levels[index + 1] if index + 1 < len(tower.levels) else tower.base
+
+            for a, operator, op, b, rightward, output in binaries:
+
+                right = self.invoke(f"rule_{tower.levels[index] if rightward else below}")
+                op_local, right_local = self.local(op or 'operator'), self.local(b or 'right')
+                scope = { k: v for k, v in ((a, left), (op, op_local), (b, right_local)) if k }
+                value = self.value(output, [ left, op_local, right_local ], scope)
+
+                lines += [
+                    f"            if {level} <= {index} and ({op_local} := {operator.accept(self)}) is not None and (",
+                    f"                ({right_local} := {right}) is not None",
+                    f"            ):",
+                    f"                {left} = {value}",
+                    f"                continue",
+                    f"            self.offset = {cursor}",
+                ]
+
+        self.locals = saved
+        self.helpers.append(self.method(lines[0], [ *lines[1:], f"            return {left}" ]))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- EMITTER :: Collect the Type Mask and Literals of a Set of Terminals -----------
+    # ------------------------------------------------------------------------------------------
+    def terminals(self, node: Expression) -> tuple[int, list[str]]:
+
+        mask, literals, pending = 0, [], [node]
+
+        while pending:
+
+            if isinstance(terminal := pending.pop(0), Alternation):
+                pending[0:0] = terminal.expressions
+
+            elif isinstance(terminal, Identifier):
+                mask |= self.mask(terminal.token.literal)
+
+            elif isinstance(terminal, String):
+                literals.append(terminal.token.literal[1:-1])
+
+            else:
+                literals.append(terminal.token.literal)
+
+        return mask, literals
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- EMITTER :: Declare a Module Constant for a Set of Literals ---------------
+    # ------------------------------------------------------------------------------------------
+    def constant(self, literals: list[str]) -> str:
+        return self.declare('LITERALS', f"frozenset({sorted(set(literals))!r})")
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- EMITTER :: Declare a Module Constant Named for the Rule -----------------
+    # ------------------------------------------------------------------------------------------
+    def declare(self, prefix: str, value: str) -> str:
+
+        self.declared += 1
+        constant = f"{prefix}_{self.rule}_{self.declared}"    # unaffected by other rules, so units splice
+
+        if (line := f"{constant} = {value}") not in self.constants:    # the stepped pass declares them again
+            self.constants.append(line)
+
+        return constant
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- EMITTER :: Compile a Set of Terminals into a Single Token Test -------------
+    # ------------------------------------------------------------------------------------------
+    def tokenset(self, node: Expression) -> str:
+
+        mask, literals = self.terminals(node)
+
+        if not literals:
+            return f"self.expect({mask})"
+
+        if not mask and len(literals) == 1:
+            return f"self.expect_literal({literals[0]!r})"
+
+        if not mask:
+            return f"self.expect_literals({self.constant(literals)})"
+
+        return f"self.expect_any({mask}, {self.constant(literals)})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- EMITTER :: Compile a Negative Lookahead into a Test on the Next Token ----------
+    # ------------------------------------------------------------------------------------------
+    def negative(self, node: Negative) -> str:
+
+        expression = node.expression
+
+        while isinstance(expression, Parenthetical) and expression.output is None:
+            expression = expression.expression
+
+        if not self.terminal(expression):
+
+            ratchet, self.ratchet = self.ratchet, False    # the lookahead rewinds whatever it matched
+            call = expression.accept(self)
+            self.ratchet = ratchet
+
+            if self.stepping:    # the driver steps the method, then the saved offset is restored
+                return f"self.negated(({self.local('mark')} := self.offset), {call})"
+
+            return f"self.negative({call.removesuffix('()')})"
+
+        mask, literals = self.terminals(expression)
+        tests = [ f"not self.types[self.offset] & {mask}" ] if mask else []
+
+        if len(literals) == 1:
+            tests.append(f"self.literals[self.offset] != {literals[0]!r}")
+
+        elif literals:
+            tests.append(f"self.literals[self.offset] not in {self.constant(literals)}")
+
+        return ' and '.join(tests)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: Alternation) -> str:
+
+        if self.terminal(node):
+            return self.tokenset(node)
+
+        return self.group(node, self.alternatives(node))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Assignment -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_assignment(self, node: Assignment) -> str:
+        return node.expression.accept(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_concatenation(self, node: Concatenation) -> str:
+        return self.group(node, [ (node, None) ])
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------------- VISITOR :: Visit Cut ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_cut(self, node: Cut) -> str:
+        return "True"    # a cut outside a sequence of items has no choice left to commit
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Gather ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_gather(self, node: Gather) -> str:
+        return self.loop(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_identifier(self, node: Identifier) -> str:
+
+        if (name := node.token.literal) in self.rules:
+            return self.invoke(f"rule_{name}")
+
+        return f"self.expect({self.mask(name)})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Negative --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_negative(self, node: Negative) -> str:
+        return f"({self.negative(node)} or None)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Number ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_number(self, node: Number) -> str:
+        return f"self.expect_literal({node.token.literal!r})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_optional(self, node: Optional) -> str:
+
+        if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+            return node.expression.accept(self)
+
+        return self.group(node, self.alternatives(node.expression, node.output))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: Parenthetical) -> str:
+
+        if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+            return node.expression.accept(self)
+
+        return self.group(node, self.alternatives(node.expression, node.output))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_plus(self, node: Plus) -> str:
+        return self.loop(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_production(self, node: Production) -> str:
+        return self.group(node, [ (node.expression, node.output) ])
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_star(self, node: Star) -> str:
+        return self.loop(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit String ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_string(self, node: String) -> str:
+        return f"self.expect_literal({node.token.literal[1:-1]!r})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ GENERATOR :: Compile a Definition into a Rule Method ------------------
+    # ------------------------------------------------------------------------------------------
+    def definition(self, definition: Definition) -> list[str]:
+
+        self.rule     = self.name(definition)
+        self.counter  = 0
+        self.declared = 0
+        self.locals   = set()
+        self.voids    = set()
+        self.framed   = True
+        self.ratchet  = self.cuts
+
+        if self.rule in self.towers:
+
+            tower, index = self.towers[self.rule]
+            body = [ f"        return {self.invoke(f'_{tower.levels[0]}_pratt', str(index))}" ]
+
+            if index == 0:
+                self.pratt(tower)
+
+        elif self.regular is not None and self.rule in self.regular.rules:
+            body = self.regular.method(definition)
+
+        else:
+            body = self.choice(self.alternatives(definition.productions), 8, {})
+
+            if not self.exhausted(body, 8):
+                body.append("        return None")
+
+        if self.table is not None and self.rule in self.table.lr:
+
+            result = self.local('result')
+
+            body = [    # the tables commit to the longest parse, so a rejection retries as PEG
+                f"        if ({result} := self.shift_reduce({self.table.entries[self.rule]})) is not None:",
+                f"            return {result}",
+                *body,
+            ]
+
+        decorators = [
+            "    @track" if self.tracked else "    @memoize",
+            *([ "    @frame" ] if self.cuts else []),
+            *([ "    @notify" ] if self.reported & { 'enter_rule', 'exit_rule' } else []),
+        ]
+
+        if self.stepping:    # the driver memoizes and frames instead
+            return [ *self.method(f"    def rule_{self.rule}(self):", body), "" ]
+
+        return [
+            *self.banner(f"RULE :: {self.rule}", 4),
+            *decorators,
+            *self.method(f"    def rule_{self.rule}(self):", body),
+            "",
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- EMITTER :: Compile a Header and Body into a Method -------------------
+    # ------------------------------------------------------------------------------------------
+    def method(self, header: str, body: list[str]) -> list[str]:
+
+        if not self.stepping:
+            return [ header, *body, "" ]
+
+        self.stepped.append(name := re.search(r"def (\w+)\(", header)[1])
+        header, lines = header.replace(f"def {name}(", f"def {name}_stepped("), []
+
+        for line in body:    # the driver resumes with next(), so a value is handed back in 'returned'
+
+            if match := re.fullmatch(r"( *)return (.+)", line):
+                lines += [ f"{match[1]}self.returned = {match[2]}", f"{match[1]}return" ]
+
+            else:
+                lines.append(line)
+
+        if not any('(yield ' in line for line in lines):    # the driver steps every method
+            lines.append("        yield    # never reached, only makes the method a generator")
+
+        return [ header, *lines, "" ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- GENERATOR :: Constants, Methods and Stepped Names of One Rule --------------
+    # ------------------------------------------------------------------------------------------
+    def unit(self, definition: Definition) -> tuple[list[str], list[str], list[str]]:
+
+        self.constants, self.helpers, stepped = [], [], len(self.stepped)
+
+        methods  = self.definition(definition)
+        methods += [ line for helper in self.helpers for line in helper ]
+
+        if self.stackless:    # generator copies of every method, for input nested deeper than recursion allows
+
+            self.stepping, self.helpers = True, []
+
+            methods += self.definition(definition)
+            methods += [ line for helper in self.helpers for line in helper ]
+
+            self.stepping = False
+
+        return self.constants, methods, self.stepped[stepped:]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- GENERATOR :: Module and Class Around the Rules, with Constants -------------
+    # ------------------------------------------------------------------------------------------
+    def shell(self, constants: list[str]) -> list[str]:
+
+        if self.handler is not None:    # any handler is passed in, though only tokens need matchers reporting
+            base = 'Events' if 'token' in self.reported else 'Handled'
+
+        else:
+            base = 'Incremental' if self.tracked else 'Parser'
+
+        return [
+            *self.banner(f"GENERATED :: Parser for '{self.root.origin}'"),
+            *constants,
+            "",
+            "",
+            *(self.schema.emit() if self.schema is not None else []),
+            *self.banner("CLASS :: Generated Parser"),
+            f"class GeneratedParser({base}):",
+            "",
+            f"    start = {next(iter(self.rules), '')!r}",
+            "",
+            *([ "    DEFERRED    = True" ] if self.deferred else []),
+            *([ "    FRAMED      = True" ] if self.stackless and self.cuts else []),
+            *([ "", "" ] if self.deferred or self.stackless and self.cuts else [ "" ]),
+            *(self.table.emit() if self.table is not None and self.table.lr else []),
+            *(self.regular.emit() if self.regular is not None and self.regular.rules else []),
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ GENERATOR :: Generate Parser Source Code ------------------------
+    # ------------------------------------------------------------------------------------------
+    def generate(self) -> str:
+
+        self.stepped, self.emitted = [], set()    # a helper shared by several rules is written once
+
+        units   = [ self.unit(d) for d in self.rules.values() ]
+        stepped = [ name for _, _, names in units for name in names ]
+
+        return '\n'.join([
+            *self.shell([ line for constants, _, _ in units for line in constants ]),
+            *( line for _, methods, _ in units for line in methods ),
+            *([
+                *self.banner("STEPPED :: Rules and Helpers as Generators, for the Driver", 4),
+                "    STEPPED = {",
+                *(f"        {name!r}: {name}_stepped," for name in stepped),
+                "    }",
+            ] if self.stackless else []),
+        ])
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- GENERATOR :: Everything Global that the Rule Methods Depend on -------------
+    # ------------------------------------------------------------------------------------------
+    def context(self) -> str:
+
+        return repr((
+            sorted(self.rules), self.cuts, self.deferred, self.tracked, self.stackless, self.blocks,
+            self.handler is not None, sorted(self.reported), self.schema is not None,
+            tuple((member.name, int(member)) for member in self.tokentype),
+            sorted((name, tuple(tower.levels), index) for name, (tower, index) in self.towers.items()),
+            (sorted(self.regular.rules), self.regular.indexes) if self.regular is not None else None,
+            sorted(self.table.entries.items()) if self.table is not None else None,
+        ))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- GENERATOR :: Fingerprint of what a Rule is Compiled from ----------------
+    # ------------------------------------------------------------------------------------------
+    def fingerprint(self, rule: str) -> str:
+
+        if rule in self.towers or self.regular is not None and rule in self.regular.rules:
+            return self.fingerprints[rule]    # inlines the bodies of the rules it references
+
+        return self.digests[rule]    # only calls them, so is unchanged by their edits
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- GENERATOR :: Compile One Rule Apart, to Splice into a Shell ---------------
+    # ------------------------------------------------------------------------------------------
+    def compile_unit(self, definition: Definition) -> tuple[CodeType, list[str]]:
+
+        self.emitted = set()    # so the unit defines every helper it calls, and splices alone
+
+        constants, methods, stepped = self.unit(definition)
+        source = '\n'.join([ *constants, "class Unit:", *methods ])
+
+        return compile(source, f"<generated '{self.root.origin}' :: {self.name(definition)}>", 'exec'), stepped
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- GENERATOR :: Compile the Shell Apart, Empty -----------------------
+    # ------------------------------------------------------------------------------------------
+    def compile_shell(self) -> CodeType:
+        return compile('\n'.join(self.shell([])), f"<generated '{self.root.origin}'>", 'exec')
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- GENERATOR :: Fill a Compiled Shell with Compiled Rule Units ---------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def assemble(
+        shell: CodeType, units: list[CodeType], stepped: list[str], namespace: dict[str, Any] | None = None
+    ) -> type[Parser]:
+
+        exec(shell, scope := Generator.scope(namespace))
+        parser = scope['GeneratedParser']
+
+        for unit in units:
+
+            exec(unit, scope)
+
+            for name, method in vars(scope.pop('Unit')).items():
+                if not name.startswith('__'):
+                    setattr(parser, name, method)
+
+        if stepped:
+            parser.STEPPED = { name: getattr(parser, f"{name}_stepped") for name in stepped }
+
+        return parser
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- GENERATOR :: Compile the Parser Source to Bytecode -------------------
+    # ------------------------------------------------------------------------------------------
+    def code(self) -> CodeType:
+        return compile(self.generate(), f"<generated '{self.root.origin}'>", 'exec')
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- GENERATOR :: Names the Generated Source Relies on --------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def scope(namespace: dict[str, Any] | None = None) -> dict[str, Any]:
+        return {
+            **(namespace or {}),
+            'Parser': Parser, 'NOTHING': NOTHING, 'memoize': memoize, 'frame': frame, 'array': array, 're': re,
+            'Incremental': Incremental, 'track': track,
+            'Events': Events, 'Handled': Handled, 'notify': notify
+        }
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- GENERATOR :: Generate and Load a Parser Class ----------------------
+    # ------------------------------------------------------------------------------------------
+    def load(self, namespace: dict[str, Any] | None = None) -> type[Parser]:
+
+        exec(self.code(), scope := self.scope(namespace))
+        return scope['GeneratedParser']
\ No newline at end of file
@@ -0,0 +1,208 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- PARSING :: Context-Free Grammar Lowering ----------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Negative      import Negative
+from ... Preparsing.Nodes.Number        import Number
+from ... Preparsing.Nodes.Optional      import Optional
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Star          import Star
+from ... Preparsing.Nodes.String        import String
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+Terminal = tuple[str, str]
+Symbol   = str | Terminal
+
+UNSUPPORTED = ('unsupported', '')
+IDENTITY    = "lambda v0: v0"
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- CLASS :: Context-Free Grammar Lowering -----------------------------
+# --------------------------------------------------------------------------------------------------
+class Grammar(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    generator   : 'Generator'
+    rules       : dict[str, list[tuple[tuple[Symbol, ...], str]]]
+    owners      : dict[str, str]
+    unsupported : set[str]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, generator: 'Generator') -> None:
+
+        self.generator   = generator
+        self.rules       = {}
+        self.owners      = { name: name for name in generator.rules }
+        self.unsupported = set()
+
+        for name, definition in generator.rules.items():
+            self.rules[name] = self.alternatives(generator.alternatives(definition.productions), name)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Grammar('{self.generator.root.origin}', {len(self.rules)} nonterminals)"
+
+    def __str__(self)  -> str:
+        return f"Grammar('{self.generator.root.origin}', {len(self.rules)} nonterminals)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Declare a Synthesized Nonterminal Owned by a Rule ---------------
+    # ------------------------------------------------------------------------------------------
+    def nonterminal(self, owner: str, productions: list[tuple[tuple[Symbol, ...], str]]) -> str:
+
+        name = f"{owner}__{len(self.owners)}"
+
+        self.owners[name]  = owner
+        self.rules[name] = productions
+
+        return name
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- TRANSLATOR :: Translate an Expression into a Grammar Symbol ---------------
+    # ------------------------------------------------------------------------------------------
+    def symbol(self, node: Expression, owner: str) -> Symbol:
+
+        generator = self.generator
+
+        if isinstance(node, Assignment):
+            return self.symbol(node.expression, owner)
+
+        if isinstance(node, Identifier):
+            name = node.token.literal
+            return name if name in generator.rules else ('type', name)
+
+        if isinstance(node, String):
+            return ('literal', node.token.literal[1:-1])
+
+        if isinstance(node, Number):
+            return ('literal', node.token.literal)
+
+        if isinstance(node, Alternation) and generator.terminal(node):
+            return self.nonterminal(owner, [ ((self.symbol(e, owner),), IDENTITY) for e in node.expressions ])
+
+        if isinstance(node, (Alternation, Concatenation, Production)):
+            return self.nonterminal(owner, self.alternatives(generator.alternatives(node), owner))
+
+        if isinstance(node, (Parenthetical, Optional)):
+
+            if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+                body = self.symbol(node.expression, owner)
+
+            else:
+                alternatives = generator.alternatives(node.expression, node.output)
+                body = self.nonterminal(owner, self.alternatives(alternatives, owner))
+
+            if isinstance(node, Parenthetical):
+                return body
+
+            return self.nonterminal(owner, [ ((), "lambda: None"), ((body,), IDENTITY) ])
+
+        if isinstance(node, (Star, Plus)):
+
+            body  = self.symbol(node.expression, owner)
+            first = ((), "lambda: []") if isinstance(node, Star) else ((body,), "lambda v0: [v0]")
+            name  = self.nonterminal(owner, [ first ])
+
+            self.rules[name].append(((name, body), "lambda v0, v1: v0.append(v1) or v0"))
+            return name
+
+        if isinstance(node, Gather):
+
+            body = self.symbol(node.expression, owner)
+            name = self.nonterminal(owner, [ ((body,), "lambda v0: [v0]") ])
+
+            separator = self.symbol(node.separator, owner)
+            self.rules[name].append(((name, separator, body), "lambda v0, v1, v2: v0.append(v2) or v0"))
+
+            return name
+
+        self.unsupported.add(owner)    # lookaheads and cuts have no context-free counterpart
+        return UNSUPPORTED
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- TRANSLATOR :: Translate one Alternative, Distributing Factored Tails ----------
+    # ------------------------------------------------------------------------------------------
+    def alternative(self,
+        expression: Expression, output: Output | None, prefix: list[tuple[Symbol, str | None]], owner: str
+    ) -> list[tuple[tuple[Symbol, ...], str]]:
+
+        generator = self.generator
+
+        items = generator.items(expression)
+        tail  = items.pop() if items and generator.factored(items[-1]) else None
+        bound = list(prefix)
+
+        for item in items:
+
+            name, expression = generator.binding(item)
+
+            if isinstance(expression, (Negative, Cut)):
+                self.unsupported.add(owner)
+                continue
+
+            bound.append((self.symbol(expression, owner), name))
+
+        if tail is not None:
+            return self.alternatives(generator.alternatives(generator.binding(tail)[1]), owner, bound)
+
+        parameters = [ f"v{index}" for index in range(len(bound)) ]
+        scope = { name: parameter for (_, name), parameter in zip(bound, parameters) if name }
+        value = generator.value(output, parameters[len(prefix):], scope)
+
+        return [ (tuple(symbol for symbol, _ in bound), f"lambda {', '.join(parameters)}: {value}") ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- TRANSLATOR :: Translate a List of Alternatives ---------------------
+    # ------------------------------------------------------------------------------------------
+    def alternatives(self,
+        alternatives: list[tuple[Expression, Output | None]],
+        owner: str, prefix: list[tuple[Symbol, str | None]] | None = None
+    ) -> list[tuple[tuple[Symbol, ...], str]]:
+
+        return [ p for e, o in alternatives for p in self.alternative(e, o, prefix or [], owner) ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- HELPER :: Rules Whose Productions a Rule can Reach -------------------
+    # ------------------------------------------------------------------------------------------
+    def reachable(self, name: str) -> set[str]:
+
+        seen, pending = { name }, [ name ]
+
+        while pending:
+
+            for rhs, _ in self.rules[pending.pop()]:
+
+                for symbol in rhs:
+
+                    if isinstance(symbol, str) and symbol not in seen:
+                        seen.add(symbol)
+                        pending.append(symbol)
+
+        return { self.owners[n] for n in seen }
\ No newline at end of file
@@ -0,0 +1,59 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- PARSING :: Parse-Event Handler ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------- CLASS :: Parse-Event Handler ----------------------------------
+# --------------------------------------------------------------------------------------------------
+class Handler(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- EVENT :: A Rule Starts Running at an Offset -----------------------
+    # ------------------------------------------------------------------------------------------
+    def enter_rule(self, rule: str, offset: int) -> None:
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- EVENT :: A Rule Finished, at its End or Rewound on Failure ---------------
+    # ------------------------------------------------------------------------------------------
+    def exit_rule(self, rule: str, offset: int, matched: bool) -> None:
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ EVENT :: A Token was Matched ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def token(self, token: Any) -> None:
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- EVENT :: An Output Action Ran, Returning what Stands for its Node ------------
+    # ------------------------------------------------------------------------------------------
+    def action_result(self, action: str, arguments: tuple[Any, ...]) -> Any:
+        return True    # anything but None, so the alternative still matches
\ No newline at end of file
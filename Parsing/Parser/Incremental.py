@@ -0,0 +1,172 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------ PARSING :: Incremental Generated-Parser Runtime -------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Parser import Parser
+
+from typing import Callable
+from typing import Iterable
+from typing import Any
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------- FUNCTION :: Memoize a Rule Method with the Tokens it Examined ------------------
+# --------------------------------------------------------------------------------------------------
+def track(method: Callable[['Incremental'], Any]) -> Callable[['Incremental'], Any]:
+
+    name = method.__name__
+
+    def tracked(self: 'Incremental') -> Any:
+
+        if (bucket := self.memo.get(offset := self.offset)) is None:
+            bucket = self.memo[offset] = {}
+
+        if (entry := bucket.get(name)) is not None or (entry := self.recall(name, offset)) is not None:
+
+            self.offset = entry[1]
+            self.reach  = entry[2] if entry[2] > self.reach else self.reach
+
+            return entry[0]
+
+        reach, self.reach = self.reach, offset - 1
+
+        result = method(self)
+        bucket[name] = (result, self.offset, self.reach)
+
+        self.reach = reach if reach > self.reach else self.reach
+        return result
+
+    tracked.__name__ = name
+    return tracked
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------- CLASS :: Incremental Generated-Parser Runtime --------------------------
+# --------------------------------------------------------------------------------------------------
+class Incremental(Parser):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    reach    : int
+    previous : dict[int, dict[str, tuple[Any, int, int]]]
+    damage   : tuple[int, int, int]
+    reused   : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, tokens: Iterable[Any]) -> None:
+
+        super().__init__(tokens)
+
+        self.reach    = -1
+        self.previous = {}
+        self.damage   = (0, 0, 0)
+        self.reused   = 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ MATCHERS :: Match Tokens, Recording the Furthest Token Examined -------------
+    # ------------------------------------------------------------------------------------------
+    def expect(self, mask: int) -> Any:
+
+        if (offset := self.offset) > self.reach:
+            self.reach = offset
+
+        if self.types[offset] & mask:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+    def expect_literal(self, literal: str) -> Any:
+
+        if (offset := self.offset) > self.reach:
+            self.reach = offset
+
+        if self.literals[offset] == literal:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+    def expect_literals(self, literals: frozenset[str]) -> Any:
+
+        if (offset := self.offset) > self.reach:
+            self.reach = offset
+
+        if self.literals[offset] in literals:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+    def expect_any(self, mask: int, literals: frozenset[str]) -> Any:
+
+        if (offset := self.offset) > self.reach:
+            self.reach = offset
+
+        if self.types[offset] & mask or self.literals[offset] in literals:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- REUSE :: Carry a Previous Entry Across the Edit, if Undamaged --------------
+    # ------------------------------------------------------------------------------------------
+    def recall(self, name: str, offset: int) -> tuple[Any, int, int] | None:
+
+        start, stop, delta = self.damage
+
+        if offset < start:
+            shift = 0
+
+        elif offset >= stop + delta:
+            shift = delta
+
+        else:
+            return None
+
+        if (entry := self.previous.get(offset - shift, {}).get(name)) is None:
+            return None
+
+        if offset < start <= entry[2] + 1:    # a lookahead test may read one token past the last match
+            return None
+
+        self.reused += 1
+        self.memo[offset][name] = entry = (entry[0], entry[1] + shift, entry[2] + shift)
+
+        return entry
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- EDITING :: Replace Tokens [start, stop) and Keep what Survives -------------
+    # ------------------------------------------------------------------------------------------
+    def edit(self, start: int, stop: int, tokens: Iterable[Any]) -> None:
+
+        tokens = [ token for token in tokens if token is not None ]
+        delta  = len(tokens) - (stop - start)
+
+        self.tokens[start:stop]   = tokens
+        self.types[start:stop]    = [ int(token.type) for token in tokens ]
+        self.literals[start:stop] = [ token.literal for token in tokens ]
+
+        self.previous = self.memo    # empty if the last edit was never parsed, so nothing is reused
+        self.damage   = (start, stop, delta)
+
+        self.offset   = 0
+        self.memo     = {}
+        self.marks    = []
+        self.released = 0
+        self.encoded  = None
+        self.nesting  = None
+        self.log      = []
+        self.reach    = -1
+        self.reused   = 0
\ No newline at end of file
@@ -0,0 +1,85 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- PARSING :: Lazy Block Body -----------------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Parser import Parser
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ CLASS :: Lazy Block Body ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Lazy(object):
+
+    __slots__ = ('parser', 'method', 'tokens', 'span', 'value', 'forced')
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    parser : type['Parser']
+    method : str
+    tokens : list[Any]
+    span   : tuple[int, int]
+    value  : Any
+    forced : bool
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, parser: type['Parser'], method: str, tokens: list[Any], span: tuple[int, int]) -> None:
+
+        self.parser = parser
+        self.method = method
+        self.tokens = tokens
+        self.span   = span
+        self.value  = None
+        self.forced = False
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return repr(self.value) if self.forced else f"Lazy('{self.method}', {self.span[0]}, {self.span[1]})"
+
+    def __str__(self)  -> str:
+        return str(self.value) if self.forced else f"Lazy('{self.method}', {self.span[0]}, {self.span[1]})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- PARSER :: Parse the Body the First Time it is Touched, then Keep it -----------
+    # ------------------------------------------------------------------------------------------
+    def force(self) -> Any:
+
+        if not self.forced:
+
+            start, stop = self.span
+            parser = self.parser(self.tokens[start:stop])
+
+            value = parser.evaluate(self.method)
+
+            self.value  = value if parser.offset == stop - start else None    # the body must be all of it
+            self.forced = True
+            self.tokens = []    # the slice was copied, so the whole token list can be freed
+
+        return self.value
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ ACCESSORS :: Touching the Body Parses it ------------------------
+    # ------------------------------------------------------------------------------------------
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.force(), name)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.force())
+
+    def __len__(self) -> int:
+        return len(self.force())
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.force()[index]
\ No newline at end of file
@@ -0,0 +1,143 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------- PARSING :: Cut Linter --------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Cut           import Cut
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Sequence      import Sequence
+
+from  . Suggestion import Suggestion
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+First = tuple[int, frozenset[str]]
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------------- CLASS :: Cut Linter ---------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Linter(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    generator   : 'Generator'
+    suggestions : list[Suggestion]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, generator: 'Generator') -> None:
+
+        self.generator   = generator
+        self.suggestions = []
+
+        for name, definition in generator.rules.items():
+            self.choice(name, generator.alternatives(definition.productions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Linter('{self.generator.root.origin}', {len(self.suggestions)} suggestions)"
+
+    def __str__(self)  -> str:
+        return '\n'.join(map(str, self.suggestions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- HELPER :: Whether Two Sets of First Tokens are Disjoint -----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def disjoint(a: First, b: First) -> bool:
+
+        (mask_a, literals_a), (mask_b, literals_b) = a, b
+
+        if mask_a & mask_b or literals_a & literals_b:
+            return False
+
+        return not (mask_a and literals_b or mask_b and literals_a)    # a literal may have either type
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Tokens an Expression can Start With, None if Unknown -------------
+    # ------------------------------------------------------------------------------------------
+    def first(self, node: Expression, visiting: frozenset[str] = frozenset()) -> First | None:
+
+        generator = self.generator
+
+        if generator.terminal(node):
+            mask, literals = generator.terminals(node)
+            return mask, frozenset(literals)
+
+        if isinstance(node, Identifier):
+
+            if (name := node.token.literal) in visiting:
+                return None
+
+            return self.first(generator.rules[name].productions, visiting | { name })
+
+        if isinstance(node, (Assignment, Parenthetical, Plus, Gather, Production)):
+            return self.first(node.expression, visiting)
+
+        if isinstance(node, Concatenation):    # a nullable head has no first set, so neither does this
+
+            if (head := next((e for e in node.expressions if not isinstance(e, Cut)), None)) is None:
+                return None    # nothing but cuts, so it matches the empty input
+
+            return self.first(head, visiting)
+
+        if isinstance(node, (Alternation, Sequence)):
+
+            mask, literals = 0, frozenset()
+
+            for e in (node.elements if isinstance(node, Sequence) else node.expressions):
+
+                if (first := self.first(e, visiting)) is None:
+                    return None
+
+                mask, literals = mask | first[0], literals | first[1]
+
+            return mask, literals
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------- LINTER :: Suggest Cuts after Leading Tokens no Later Alternative Shares ---------
+    # ------------------------------------------------------------------------------------------
+    def choice(self, rule: str, alternatives: list[tuple[Expression, Output | None]]) -> None:
+
+        generator = self.generator
+        firsts    = [ self.first(expression) for expression, _ in alternatives ]
+
+        for index, (expression, _) in enumerate(alternatives):
+
+            items = generator.items(expression)
+
+            if items and generator.factored(items[-1]):
+                self.choice(rule, generator.alternatives(generator.binding(items[-1])[1]))
+
+            if index == len(alternatives) - 1 or len(items) < 2 or any(isinstance(i, Cut) for i in items):
+                continue
+
+            if not generator.terminal(head := generator.binding(items[0])[1]):
+                continue
+
+            leading = self.first(head)
+
+            if all(first is not None and self.disjoint(leading, first) for first in firsts[index + 1:]):
+                self.suggestions.append(Suggestion(rule, index + 1, head.start))
\ No newline at end of file
@@ -0,0 +1,522 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ PARSING :: Generated-Parser Runtime -------------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Lazy import Lazy
+
+from array     import array
+from bisect    import bisect_left
+from itertools import repeat
+from operator  import add
+from typing    import Callable
+from typing    import Iterable
+from typing    import Any
+
+import sys
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------- CLASS :: Value of a Match whose Output is None -------------------------
+# --------------------------------------------------------------------------------------------------
+class Nothing(object):
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return "NOTHING"
+
+    def __str__(self)  -> str:
+        return "NOTHING"
+
+
+NOTHING = Nothing()    # None already means no match, so a method matching a None output returns this
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------- CLASS :: Reference to a Logged Action Call ---------------------------
+# --------------------------------------------------------------------------------------------------
+class Deferred(object):
+
+    __slots__ = ('index',)
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    index : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Deferred({self.index})"
+
+    def __str__(self)  -> str:
+        return f"Deferred({self.index})"
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- FUNCTION :: Memoize a Rule Method --------------------------------
+# --------------------------------------------------------------------------------------------------
+def memoize(method: Callable[['Parser'], Any]) -> Callable[['Parser'], Any]:
+
+    name = method.__name__
+
+    def memoized(self: 'Parser') -> Any:
+
+        if (bucket := self.memo.get(offset := self.offset)) is None:
+            bucket = self.memo[offset] = {}
+
+        elif (entry := bucket.get(name)) is not None:
+
+            self.offset = entry[1]
+            return entry[0]
+
+        result = method(self)
+        bucket[name] = (result, self.offset)    # dropped with the bucket, if a cut released it meanwhile
+
+        return result
+
+    memoized.__name__ = name
+    return memoized
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------- FUNCTION :: Track the Backtrack Mark of a Rule Method ----------------------
+# --------------------------------------------------------------------------------------------------
+def frame(method: Callable[['Parser'], Any]) -> Callable[['Parser'], Any]:
+
+    name = method.__name__
+
+    def framed(self: 'Parser') -> Any:
+
+        marks = self.marks
+        marks.append(self.offset)
+
+        result = method(self)
+        marks.pop()
+
+        return result
+
+    framed.__name__ = name
+    return framed
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Generated-Parser Runtime --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Parser(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    tokens   : list[Any]
+    types    : list[int]
+    literals : list[str | None]
+
+    offset   : int
+    memo     : dict[int, dict[str, tuple[Any, int]]]
+    marks    : list[int]
+    released : int
+    encoded  : str | None
+    nesting  : list[int] | None
+    returned : Any
+    log      : list[tuple[Callable[..., Any], int, tuple[Any, ...]]]
+
+    start    : str = ''
+
+    ACTIONS     : Any = ()
+    ACTION_ROWS : Any = ()
+    GOTOS       : Any = ()
+    GOTO_ROWS   : Any = ()
+    COLUMNS     : dict[str, int] = {}
+    MASKS       : tuple[tuple[int, int], ...] = ()
+    END         : int = 0
+    PRODUCTIONS : tuple[tuple[int, int, Callable[..., Any] | None], ...] = ()
+
+    BASE        : int = 0x100
+    ENCODING    : dict[str, int] = {}
+    STRIDE      : int = 1
+
+    DEFERRED    : bool = False
+    STEPPED     : dict[str, Callable[..., Any]] = {}
+    FRAMED      : bool = False
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, tokens: Iterable[Any]) -> None:
+
+        self.tokens   = [ token for token in tokens if token is not None ]
+        self.types    = [ int(token.type) for token in self.tokens ]
+        self.literals = [ token.literal   for token in self.tokens ]
+
+        self.tokens.append(None)    # sentinel, never matched by any mask or literal
+        self.types.append(0)
+        self.literals.append(None)
+
+        self.offset   = 0
+        self.memo     = {}
+        self.marks    = []
+        self.released = 0
+        self.encoded  = None
+        self.nesting  = None
+        self.returned = None
+        self.log      = []
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(offset={self.offset})"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}(offset={self.offset})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- MATCHER :: Match a Token by Type Mask --------------------------
+    # ------------------------------------------------------------------------------------------
+    def expect(self, mask: int) -> Any:
+
+        if self.types[offset := self.offset] & mask:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------- MATCHER :: Match a Token by Literal ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def expect_literal(self, literal: str) -> Any:
+
+        if self.literals[offset := self.offset] == literal:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- MATCHER :: Match a Token by a Set of Literals ----------------------
+    # ------------------------------------------------------------------------------------------
+    def expect_literals(self, literals: frozenset[str]) -> Any:
+
+        if self.literals[offset := self.offset] in literals:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- MATCHER :: Match a Token by Type Mask or Set of Literals ----------------
+    # ------------------------------------------------------------------------------------------
+    def expect_any(self, mask: int, literals: frozenset[str]) -> Any:
+
+        offset = self.offset
+
+        if self.types[offset] & mask or self.literals[offset] in literals:
+
+            self.offset = offset + 1
+            return self.tokens[offset]
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- MATCHER :: Succeed Without Consuming if a Method Fails Here ---------------
+    # ------------------------------------------------------------------------------------------
+    def negative(self, method: Callable[[], Any]) -> Any:
+
+        offset = self.offset
+        result = method()
+        self.offset = offset
+
+        return True if result is None else None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- MATCHER :: Restore the Offset a Lookahead Saved, Inverting its Result ----------
+    # ------------------------------------------------------------------------------------------
+    def negated(self, offset: int, result: Any) -> Any:
+
+        self.offset = offset
+        return True if result is None else None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --- COMMITMENT :: Commit the Current Rule, Releasing Memo Entries no Rule can Revisit ----
+    # ------------------------------------------------------------------------------------------
+    def cut(self) -> None:
+
+        self.marks[-1] = self.offset    # every active rule rewinds no further back than its mark
+
+        if (floor := min(self.marks)) > self.released:
+
+            memo = self.memo    # one bucket per offset, so only the offsets just passed are visited
+
+            for offset in range(self.released, floor):
+                memo.pop(offset, None)
+
+            self.released = floor
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- SKIPPER :: Pass over a Block Body, Returning a Handle that Parses it ----------
+    # ------------------------------------------------------------------------------------------
+    def skip(self, indent: int, dedent: int, method: str) -> Lazy | None:
+
+        if self.nesting is None:    # only the block delimiters are walked, never the tokens between
+            self.nesting = [ index for index, kind in enumerate(self.types) if kind & (indent | dedent) ]
+
+        nesting, types, depth = self.nesting, self.types, 0
+
+        for position in range(bisect_left(nesting, start := self.offset), len(nesting)):
+
+            if types[index := nesting[position]] & indent:
+                depth += 1
+
+            elif depth:
+                depth -= 1
+
+            else:
+                self.offset = index
+                return Lazy(type(self), method, self.tokens, (start, index))
+
+        return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- ENCODER :: Encode each Token as one Character of its Type and Literal ----------
+    # ------------------------------------------------------------------------------------------
+    def encode(self) -> str:
+
+        if self.encoded is None:
+
+            base, stride, indexes = self.BASE, self.STRIDE, self.ENCODING
+
+            offsets = {    # the sentinel encodes as '\0', a character no pattern matches
+                kind: base + (kind.bit_length() - 1) * stride if kind else 0 for kind in set(self.types)
+            }
+
+            codes = map(add, map(offsets.__getitem__, self.types), map(indexes.get, self.literals, repeat(0)))
+            self.encoded = array('I', codes).tobytes().decode(f"utf-32-{sys.byteorder[0]}e")
+
+        return self.encoded
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ PARSER :: Run the LALR(1) Tables from an Entry State ------------------
+    # ------------------------------------------------------------------------------------------
+    def shift_reduce(self, state: int) -> Any:
+
+        actions, action_rows, gotos, goto_rows = self.ACTIONS, self.ACTION_ROWS, self.GOTOS, self.GOTO_ROWS
+        columns, masks, end, productions = self.COLUMNS, self.MASKS, self.END, self.PRODUCTIONS
+
+        tokens, types, literals = self.tokens, self.types, self.literals
+
+        states, values, offset, classes = [ state ], [], self.offset, {}
+
+        while True:
+
+            row, action = action_rows[states[-1]], 0
+
+            if (column := columns.get(literals[offset])) is not None:
+                action = actions[row + column]
+
+            if not action:
+
+                if (candidates := classes.get(kind := types[offset])) is None:
+                    candidates = classes[kind] = (*(c for mask, c in masks if kind & mask), end)
+
+                for column in candidates:
+
+                    if action := actions[row + column]:
+                        break
+
+            if action > 0:
+
+                states.append(action - 1)
+                values.append(tokens[offset])
+                offset += 1
+
+            elif action < 0:
+
+                lhs, length, function = productions[-action - 1]
+
+                if lhs < 0:
+                    self.offset = offset
+                    return values[-1]
+
+                arguments = values[len(values) - length:]
+
+                del values[len(values) - length:]
+                del states[len(states) - length:]
+
+                if function is None:
+                    value = arguments[0]
+
+                elif (value := function(*arguments)) is None:
+                    return None
+
+                values.append(value)
+                states.append(gotos[goto_rows[states[-1]] + lhs])
+
+            else:
+                return None
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- DEFERRAL :: Log an Action Call, Returning a Reference in Place of the Node -------
+    # ------------------------------------------------------------------------------------------
+    def defer(self, function: Callable[..., Any], stars: int, *arguments: Any) -> Deferred:
+
+        self.log.append((function, stars, arguments))
+        return Deferred(len(self.log) - 1)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- DEFERRAL :: Run the Logged Actions a Committed Value Refers To -------------
+    # ------------------------------------------------------------------------------------------
+    def resolve(self, value: Any) -> Any:
+
+        log, built, reached, pending = self.log, {}, set(), [ value ]
+
+        while pending:     # an abandoned alternative's entries are never reached, so never built
+
+            if (kind := (item := pending.pop()).__class__) is Deferred:
+
+                if item.index not in reached:
+                    reached.add(item.index)
+                    pending += log[item.index][2]
+
+            elif kind is list or kind is tuple:    # only the generated code's containers, never a token's
+                pending += item
+
+        def build(item: Any) -> Any:
+
+            if (kind := item.__class__) is Deferred:
+                return built[item.index]
+
+            if kind is list:
+                return [ build(element) for element in item ]
+
+            if kind is tuple:
+                return tuple(build(element) for element in item)
+
+            return item
+
+        for index in sorted(reached):   # arguments are always logged before the call using them
+
+            function, stars, arguments = log[index]
+            parameters = []
+
+            for position, argument in enumerate(arguments):
+
+                if stars >> position & 1:
+                    parameters += build(argument)
+
+                else:
+                    parameters.append(build(argument))
+
+            built[index] = function(*parameters)
+
+        return build(value)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- DRIVER :: Step Generator Rules on an Explicit Stack, instead of Recursing --------
+    # ------------------------------------------------------------------------------------------
+    def drive(self, method: str) -> Any:
+
+        framed, functions, memo = self.FRAMED, self.STEPPED, self.memo
+        stack = []
+
+        push, pop, step = stack.append, stack.pop, next
+        request, generator, key = method, None, None
+
+        while True:
+
+            if request.__class__ is not str:    # a helper generator, which is never memoized
+                push((generator, key))
+                generator, key = request, None
+
+            elif (entry := (bucket := memo.get(offset := self.offset) or {}).get(request)) is not None:
+                self.offset, self.returned = entry[1], entry[0]
+
+            else:
+
+                bucket = memo.setdefault(offset, bucket)    # a miss, so the entry it leaves needs a bucket
+
+                if framed:
+                    self.marks.append(offset)
+
+                push((generator, key))
+                generator, key = functions[request](self), (bucket, request)    # the bucket its entry goes in
+
+            while generator is not None and (request := step(generator, None)) is None:    # it returned
+
+                if key is not None:
+
+                    key[0][key[1]] = (self.returned, self.offset)
+
+                    if framed:
+                        self.marks.pop()
+
+                generator, key = pop()
+
+            if generator is None:
+                return self.returned
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------- PARSER :: Run one Rule or Helper ----------------------------
+    # ------------------------------------------------------------------------------------------
+    def run(self, method: str) -> Any:
+
+        if not self.STEPPED:
+            return getattr(self, method)()
+
+        offset, marks = self.offset, len(self.marks)
+
+        try:
+            return getattr(self, method)()
+
+        except RecursionError:    # too deep to recurse, so the driver starts over, reusing every completed rule
+
+            self.offset = offset
+            del self.marks[marks:]
+
+            return self.drive(method)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ PARSER :: Run one Rule or Helper to its Final Value -------------------
+    # ------------------------------------------------------------------------------------------
+    def evaluate(self, method: str) -> Any:
+
+        if (result := self.run(method)) is None or result is NOTHING:
+            return None
+
+        return self.resolve(result) if self.DEFERRED else result
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- PARSER :: Parse from a Start Rule ----------------------------
+    # ------------------------------------------------------------------------------------------
+    def parse(self, start: str = '') -> Any:
+        return self.evaluate(f"rule_{start or self.start}")
\ No newline at end of file
@@ -0,0 +1,462 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: Regular Rule Compiler --------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Definition    import Definition
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Gather        import Gather
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Negative      import Negative
+from ... Preparsing.Nodes.Optional      import Optional
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.Plus          import Plus
+from ... Preparsing.Nodes.Production    import Production
+from ... Preparsing.Nodes.Sequence      import Sequence
+from ... Preparsing.Nodes.Star          import Star
+
+from  . Parser import Parser
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+Rendered = tuple[str, str | None]
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Regular Rule Compiler ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Regular(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    generator : 'Generator'
+
+    rules     : set[str]
+    regular   : dict[str, bool]
+    literals  : set[str]
+    indexes   : dict[str, int]
+    stride    : int
+    bits      : int
+
+    groups    : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, generator: 'Generator') -> None:
+
+        self.generator = generator
+
+        self.rules     = set()
+        self.regular   = {}
+        self.literals  = set()
+
+        self.groups    = 0
+
+        candidates = [ name for name in generator.rules if self.accepts(name, frozenset()) ]
+
+        self.indexes = { literal: index + 1 for index, literal in enumerate(sorted(self.literals)) }
+        self.stride  = len(self.indexes) + 1
+        self.bits    = max(int(member) for member in generator.tokentype).bit_length()
+
+        for name in candidates:     # rules without a repetition gain nothing over the inline matchers
+
+            pattern, _ = self.choice(generator.alternatives(generator.rules[name].productions), False)
+
+            if '*+' in pattern or '++' in pattern:
+                self.rules.add(name)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Regular('{self.generator.root.origin}', {len(self.rules)} rules)"
+
+    def __str__(self)  -> str:
+        return f"Regular('{self.generator.root.origin}', {len(self.rules)} rules)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ HELPER :: Whether a Rule Reaches no Rule Recursively ------------------
+    # ------------------------------------------------------------------------------------------
+    def accepts(self, name: str, visiting: frozenset[str]) -> bool:
+
+        if name in self.regular:
+            return self.regular[name]
+
+        if name in visiting or name in self.generator.towers:
+            return False
+
+        self.regular[name] = self.supported(self.generator.rules[name].productions, visiting | { name })
+        return self.regular[name]
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Whether an Expression has a Regular Counterpart ----------------
+    # ------------------------------------------------------------------------------------------
+    def supported(self, node: Expression, visiting: frozenset[str]) -> bool:
+
+        generator = self.generator
+
+        if generator.terminal(node):
+            self.literals.update(generator.terminals(node)[1])
+            return True
+
+        if isinstance(node, Identifier):
+            return self.accepts(node.token.literal, visiting)
+
+        if isinstance(node, Gather):
+            return self.supported(node.expression, visiting) and self.supported(node.separator, visiting)
+
+        if isinstance(node, (Assignment, Parenthetical, Optional, Star, Plus, Negative, Production)):
+            return self.supported(node.expression, visiting)
+
+        if isinstance(node, (Alternation, Concatenation)):
+            return all(self.supported(e, visiting) for e in node.expressions)
+
+        if isinstance(node, Sequence):
+            return all(self.supported(e, visiting) for e in node.elements)
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- HELPER :: Strip Parentheses that Carry no Output --------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def unwrap(node: Expression) -> Expression:
+
+        while isinstance(node, Parenthetical) and node.output is None:
+            node = node.expression
+
+        return node
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- HELPER :: Width and Value Positions of a Repetition Body of Single Tokens --------
+    # ------------------------------------------------------------------------------------------
+    def fixed(self, node: Star | Plus | Gather) -> tuple[int, list[int]] | None:
+
+        generator, body = self.generator, self.unwrap(node.expression)
+
+        if isinstance(node, Gather):
+            terminal = generator.terminal(body) and generator.terminal(self.unwrap(node.separator))
+            return (2, [ 0 ]) if terminal else None
+
+        if isinstance(body, Parenthetical):
+            alternatives = generator.alternatives(body.expression, body.output)
+
+        else:
+            alternatives = generator.alternatives(body)
+
+        if len(alternatives) != 1:
+            return None
+
+        expression, output = alternatives[0]
+        names, items = zip(*map(generator.binding, generator.items(expression)))
+
+        if not all(generator.terminal(item) for item in items):
+            return None
+
+        if output is None:
+            return len(items), list(range(len(items)))
+
+        if isinstance(output.expression, Identifier) and (name := output.expression.token.literal) in names:
+            return len(items), [ names.index(name) ]
+
+        return None     # tokens are sliced out in place, so any other action goes through a helper
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- HELPER :: Allocate the Next Capture Group ------------------------
+    # ------------------------------------------------------------------------------------------
+    def group(self) -> int:
+
+        self.groups += 1
+        return self.groups
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- HELPER :: Escape a Character Code for a Pattern ---------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def escape(code: int) -> str:
+        return f"\\u{code:04x}" if code < 0x10000 else f"\\U{code:08x}"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- EMITTER :: Character Class Matching a Set of Terminals -----------------
+    # ------------------------------------------------------------------------------------------
+    def characters(self, node: Expression) -> str:
+
+        mask, literals = self.generator.terminals(node)
+        spans = []
+
+        for bit in range(self.bits):
+
+            first = Parser.BASE + bit * self.stride
+
+            if mask >> bit & 1:
+                spans.append((first, first + self.stride - 1))
+
+            spans += [ (first + self.indexes[literal],) * 2 for literal in literals ]
+
+        merged = []
+
+        for low, high in sorted(spans):
+
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(high, merged[-1][1]))
+
+            else:
+                merged.append((low, high))
+
+        ranges = [ (self.escape(low), self.escape(high)) for low, high in merged ]
+
+        return f"[{''.join(low if low == high else f'{low}-{high}' for low, high in ranges)}]"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- EMITTER :: Declare a Module Constant for a Compiled Pattern ---------------
+    # ------------------------------------------------------------------------------------------
+    def compile(self, pattern: str) -> str:
+        return self.generator.declare('PATTERN', f"re.compile({pattern!r})")
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------ EMITTER :: Compile an Expression into a Pattern and a Value over its Groups -------
+    # ------------------------------------------------------------------------------------------
+    def render(self, node: Expression, capture: bool) -> Rendered:
+
+        generator = self.generator
+
+        if generator.terminal(node):
+
+            if not capture:
+                return self.characters(node), None
+
+            group = self.group()
+            return f"({self.characters(node)})", f"tokens[match.start({group})]"
+
+        if isinstance(node, Assignment):
+            return self.render(node.expression, capture)
+
+        if isinstance(node, Identifier):    # a regular rule is inlined, atomic like a call
+            return self.choice(generator.alternatives(generator.rules[node.token.literal].productions), capture)
+
+        if isinstance(node, Negative):
+            return f"(?!{self.render(node.expression, False)[0]})", None
+
+        if isinstance(node, (Star, Plus, Gather)):
+            return self.repetition(node, capture)
+
+        if isinstance(node, (Alternation, Concatenation, Production)):
+            return self.choice(generator.alternatives(node), capture)
+
+        group = self.group() if capture and isinstance(node, Optional) else 0
+
+        if node.output is None and not isinstance(node.expression, (Concatenation, Assignment)):
+            pattern, value = self.render(node.expression, capture)
+
+        else:
+            pattern, value = self.choice(generator.alternatives(node.expression, node.output), capture)
+
+        if isinstance(node, Parenthetical):
+            return pattern, value
+
+        if not capture:
+            return f"(?:{pattern})?+", None
+
+        return f"({pattern})?+", f"({value} if match.start({group}) >= 0 else None)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ EMITTER :: Compile one Alternative, Distributing Factored Tails -------------
+    # ------------------------------------------------------------------------------------------
+    def alternative(self,
+        expression: Expression, output: Output | None, prefix: list[tuple[str | None, str]], capture: bool
+    ) -> Rendered:
+
+        generator = self.generator
+
+        items    = generator.items(expression)
+        tail     = items.pop() if items and generator.factored(items[-1]) else None
+        bound    = list(prefix)
+        patterns = []
+
+        for item in items:
+
+            name, expression = generator.binding(item)
+            pattern, value = self.render(expression, capture)
+            patterns.append(pattern)
+
+            if not isinstance(expression, Negative):
+                bound.append((name, value))
+
+        if tail is not None:
+            pattern, value = self.choice(generator.alternatives(generator.binding(tail)[1]), capture, bound)
+            return ''.join(patterns) + pattern, value
+
+        if not capture:
+            return ''.join(patterns), None
+
+        scope = { name: value for name, value in bound if name }
+        return ''.join(patterns), generator.value(output, [ v for _, v in bound[len(prefix):] ], scope)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ EMITTER :: Compile an Ordered Choice into an Atomic Alternation -------------
+    # ------------------------------------------------------------------------------------------
+    def choice(self,
+        alternatives: list[tuple[Expression, Output | None]],
+        capture: bool, prefix: list[tuple[str | None, str]] | None = None
+    ) -> Rendered:
+
+        patterns, values = [], []
+
+        for expression, output in alternatives:
+
+            marker = self.group() if capture and len(alternatives) > 1 else 0
+            pattern, value = self.alternative(expression, output, prefix or [], capture)
+
+            patterns.append(f"({pattern})" if marker else pattern)
+            values.append((marker, value))
+
+        if not capture:
+            return f"(?>{'|'.join(patterns)})", None
+
+        value = values[-1][1]
+
+        for marker, other in reversed(values[:-1]):
+            value = f"({other} if match.start({marker}) >= 0 else {value})"
+
+        return f"(?>{'|'.join(patterns)})", value
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- EMITTER :: Compile a Repetition into a Possessive Loop -----------------
+    # ------------------------------------------------------------------------------------------
+    def repetition(self, node: Star | Plus | Gather, capture: bool) -> Rendered:
+
+        group = self.group() if capture else 0
+
+        if isinstance(node, Gather):
+            element, separator = self.render(node.expression, False)[0], self.render(node.separator, False)[0]
+            pattern = f"{element}(?:{separator}{element})*+"
+
+        else:
+            pattern = f"(?:{self.render(node.expression, False)[0]}){'*+' if isinstance(node, Star) else '++'}"
+
+        if not capture:
+            return f"(?:{pattern})", None
+
+        start, end = f"match.start({group})", f"match.end({group})"
+
+        if (fixed := self.fixed(node)) is None:
+            return f"({pattern})", f"self.{self.iteration(node)}({start}, {end})"
+
+        width, positions = fixed
+        step   = f":{width}" if width > 1 else ''
+        slices = [ f"tokens[{start}{f' + {p}' if p else ''}:{end}{step}]" for p in positions ]
+
+        return f"({pattern})", slices[0] if len(slices) == 1 else f"list(zip({', '.join(slices)}))"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --- EMITTER :: Compile a Repetition Body into a Helper Collecting one Value per Match ----
+    # ------------------------------------------------------------------------------------------
+    def iteration(self, node: Star | Plus | Gather) -> str:
+
+        name, saved = self.generator.helper(), self.groups
+        self.groups = 0
+
+        pattern, value = self.render(node.expression, True)
+        constant = self.compile(pattern)
+
+        lines = [
+            f"    def {name}(self, start, end):",
+            f"        encoded, tokens, items = self.encode(), self.tokens, []",
+        ]
+
+        if isinstance(node, Gather):
+
+            separator = self.render(node.separator, False)[0]
+            following = self.compile(f"(?:{separator}){pattern}")
+
+            lines += [
+                f"        match = {constant}.match(encoded, start)",
+                f"        while True:",
+                f"            items.append({value})",
+                f"            if (start := match.end()) >= end:",
+                f"                return items",
+                f"            match = {following}.match(encoded, start)",
+                "",
+            ]
+
+        else:
+
+            lines += [
+                f"        while start < end:",
+                f"            match = {constant}.match(encoded, start)",
+                f"            items.append({value})",
+                f"            start = match.end()",
+                f"        return items",
+                "",
+            ]
+
+        self.groups = saved
+        self.generator.helpers.append(lines)
+
+        return name
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- GENERATOR :: Compile a Regular Definition into a Rule Body ---------------
+    # ------------------------------------------------------------------------------------------
+    def method(self, definition: Definition) -> list[str]:
+
+        self.groups = 0
+
+        pattern, value = self.choice(self.generator.alternatives(definition.productions), True)
+        constant = self.compile(pattern)
+
+        lines = [
+            f"        if (match := {constant}.match(self.encode(), self.offset)) is None:",
+            f"            return None",
+            f"        tokens = self.tokens",
+        ]
+
+        if self.generator.name(definition) in self.generator.nones:    # the match stands, whatever its value
+            return [
+                *lines,
+                f"        self.offset = match.end()",
+                f"        return NOTHING if (result := {value}) is None else result",
+            ]
+
+        return [
+            *lines,
+            f"        if (result := {value}) is not None:",
+            f"            self.offset = match.end()",
+            f"        return result",
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------- GENERATOR :: Emit the Token Encoding as Generated-Parser Class Attributes --------
+    # ------------------------------------------------------------------------------------------
+    def emit(self) -> list[str]:
+
+        return [
+            f"    ENCODING    = {self.indexes!r}",
+            f"    STRIDE      = {self.stride}",
+            "",
+            "",
+        ]
\ No newline at end of file
@@ -0,0 +1,162 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: Inferred Node Schema ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Call       import Call
+from ... Preparsing.Nodes.Identifier import Identifier
+from ... Preparsing.Nodes.Output     import Output
+from ... Preparsing.Nodes.Sequence   import Sequence
+from ... Preparsing.Nodes.Star       import Star
+
+from ..  Visitors.Visitor import method
+
+from typing import Any
+from typing import TYPE_CHECKING
+
+import keyword
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+Field = tuple[str, bool]
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Inferred Node Schema ----------------------------------
+# --------------------------------------------------------------------------------------------------
+class Schema(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    generator : 'Generator'
+    classes   : dict[str, list[Field]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, generator: 'Generator') -> None:
+
+        self.generator = generator
+        self.classes   = {}
+
+        for call in self.calls(list(generator.rules.values())):
+            self.infer(call)
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Schema('{self.generator.root.origin}', {len(self.classes)} classes)"
+
+    def __str__(self)  -> str:
+        return f"Schema('{self.generator.root.origin}', {len(self.classes)} classes)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Calls in the Outputs of Definitions, in Source Order -------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def calls(pending: list[Any]) -> list[Call]:
+
+        calls, pending = [], pending[::-1]
+
+        while pending:
+
+            if isinstance(node := pending.pop(), Call):
+                calls.append(node)
+
+            pending += [ *node.children() ][::-1]
+
+        return calls
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Merge the Fields a Call Site Passes into its Class --------------
+    # ------------------------------------------------------------------------------------------
+    def infer(self, call: Call) -> None:
+
+        name = call.identifier.token.literal
+        parameters = call.parameters.elements if isinstance(call.parameters, Sequence) else [ call.parameters ]
+
+        fields = self.classes.setdefault(name, [])
+
+        for index, parameter in enumerate(parameters):
+
+            starred = isinstance(parameter, Star)
+            inner   = parameter.expression if starred else parameter
+
+            if fields and fields[-1][1]:    # a variadic field already collects every later argument
+                break
+
+            if index < len(fields):
+
+                if starred:
+                    fields[index:] = [ (fields[index][0], True) ]
+
+                continue
+
+            field = inner.token.literal if isinstance(inner, Identifier) else f"field{index}"
+            field = field if field.isidentifier() and not keyword.iskeyword(field) else f"field{index}"
+
+            if field in (f for f, _ in fields) or field in ('tag', 'self'):
+                field = f"{field}{index}"
+
+            fields.append((field, starred))
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- EMITTER :: Compile one Inferred Class to Source ---------------------
+    # ------------------------------------------------------------------------------------------
+    def node(self, name: str, fields: list[Field], tag: int) -> list[str]:
+
+        names      = [ field for field, _ in fields ]
+        parameters = [ f"*{field}" if starred else f"{field}=None" for field, starred in fields ]
+        slots      = repr(tuple(names))
+
+        shown = ', '.join(f"{{self.{field}!r}}" for field in names)
+
+        return [
+            f"class {name}(object):",
+            "",
+            f"    __slots__      = {slots}",
+            f"    __match_args__ = {slots}",
+            f"    tag            = {tag}",
+            "",
+            f"    def __init__(self{''.join(f', {p}' for p in parameters)}):",
+            *(f"        self.{field} = {field}" for field in names),
+            *([ "        pass" ] if not names else []),
+            "",
+            "    def __repr__(self):",
+            f"        return f\"{name}({shown})\"",
+            "",
+            "    def accept(self, visitor):",
+            f"        return getattr(visitor, {method(name)!r}, visitor.visit_generic)(self)",
+            "",
+            "",
+        ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ EMITTER :: Compile every Class to Source ------------------------
+    # ------------------------------------------------------------------------------------------
+    def emit(self) -> list[str]:
+
+        lines = [ *self.generator.banner("NODES :: Inferred from Output Actions"), "" ] if self.classes else []
+
+        for tag, (name, fields) in enumerate(self.classes.items(), 1):
+            lines += self.node(name, fields, tag)
+
+        return lines
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- LOADER :: Compile the Classes into a Namespace ---------------------
+    # ------------------------------------------------------------------------------------------
+    def load(self) -> dict[str, type]:
+
+        scope = {}
+        exec(compile('\n'.join(self.emit()), f"<nodes '{self.generator.root.origin}'>", 'exec'), scope)
+
+        return { name: scope[name] for name in self.classes }
\ No newline at end of file
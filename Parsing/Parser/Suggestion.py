@@ -0,0 +1,41 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- PARSING :: Cut Suggestion ------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Lexer.Token import Token
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ CLASS :: Cut Suggestion -------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Suggestion(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    rule        : str
+    alternative : int
+    token       : Token
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, rule: str, alternative: int, token: Token) -> None:
+
+        self.rule        = rule
+        self.alternative = alternative
+        self.token       = token
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Suggestion('{self.rule}', {self.alternative}, {self.token.literal!r})"
+
+    def __str__(self)  -> str:
+        return (
+            f"{self.token.origin}: "
+            f"a cut after {self.token.literal} in alternative {self.alternative} of '{self.rule}' is safe, "
+            f"no later alternative can start with it"
+        )
\ No newline at end of file
@@ -0,0 +1,404 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- PARSING :: LALR(1) Table Builder --------------------------------
+# --------------------------------------------------------------------------------------------------
+from  . Conflict import Conflict
+from  . Grammar  import Grammar
+from  . Grammar  import IDENTITY
+from  . Grammar  import Symbol
+from  . Grammar  import Terminal
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+Item = tuple[int, int]
+
+END       = ('end', '')
+PROPAGATE = ('#', '')
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: LALR(1) Table Builder ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Table(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    generator    : 'Generator'
+    grammar      : Grammar
+
+    lr           : set[str]
+    conflicts    : list[Conflict]
+
+    productions  : list[tuple[str, tuple[Symbol, ...], str | None]]
+    terminals    : list[Terminal]
+    nonterminals : list[str]
+    entries      : dict[str, int]
+
+    lhs          : dict[str, list[int]]
+    firsts       : dict[str, set[Terminal]]
+    nullable     : set[str]
+
+    actions      : list[list[int]]
+    gotos        : list[list[int]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, generator: 'Generator') -> None:
+
+        self.generator    = generator
+        self.grammar      = Grammar(generator)
+
+        self.lr           = set()
+        self.conflicts    = []
+
+        self.productions  = []
+        self.terminals    = []
+        self.nonterminals = []
+        self.entries      = {}
+
+        self.lhs          = {}
+        self.firsts       = {}
+        self.nullable     = set()
+
+        self.actions      = []
+        self.gotos        = []
+
+        self.build()
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Table('{self.generator.root.origin}', {len(self.actions)} states)"
+
+    def __str__(self)  -> str:
+        return f"Table('{self.generator.root.origin}', {len(self.actions)} states)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- HELPER :: Readable Name of a Terminal --------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def display(terminal: Terminal) -> str:
+
+        if terminal == END:
+            return 'end of input'
+
+        return repr(terminal[1]) if terminal[0] == 'literal' else terminal[1]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- HELPER :: First Terminals of a Symbol String, Followed by Lookaheads ----------
+    # ------------------------------------------------------------------------------------------
+    def first(self, symbols: tuple[Symbol, ...], lookaheads: set[Terminal]) -> set[Terminal]:
+
+        result = set()
+
+        for symbol in symbols:
+
+            if not isinstance(symbol, str):
+                result.add(symbol)
+                return result
+
+            result |= self.firsts[symbol]
+
+            if symbol not in self.nullable:
+                return result
+
+        return result | lookaheads
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------- HELPER :: LR(1) Closure of a Set of Items ------------------------
+    # ------------------------------------------------------------------------------------------
+    def closure(self, items: dict[Item, set[Terminal]]) -> dict[Item, set[Terminal]]:
+
+        pending = list(items)
+
+        while pending:
+
+            production, dot = pending.pop()
+            rhs = self.productions[production][1]
+
+            if dot == len(rhs) or not isinstance(rhs[dot], str):
+                continue
+
+            lookaheads = self.first(rhs[dot + 1:], items[(production, dot)])
+
+            for other in self.lhs[rhs[dot]]:
+
+                if (other, 0) not in items:
+                    items[(other, 0)] = set(lookaheads)
+                    pending.append((other, 0))
+
+                elif not lookaheads <= items[(other, 0)]:
+                    items[(other, 0)] |= lookaheads
+                    pending.append((other, 0))
+
+        return items
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- BUILDER :: Build LALR(1) Tables, Falling Back on Conflicting Rules -----------
+    # ------------------------------------------------------------------------------------------
+    def build(self) -> None:
+
+        reach   = { name: self.grammar.reachable(name) for name in self.generator.rules }
+        blocked = set(self.grammar.unsupported)
+
+        while True:
+
+            rules = [ name for name in self.generator.rules if not reach[name] & blocked ]
+
+            if not (conflicts := self.construct(rules)):
+                break
+
+            self.conflicts += conflicts
+            blocked |= { rule for conflict in conflicts for rule in conflict.rules }
+
+        self.lr = set(rules)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- BUILDER :: Build the Automaton and Tables for a Set of Rules --------------
+    # ------------------------------------------------------------------------------------------
+    def construct(self, rules: list[str]) -> list[Conflict]:
+
+        nonterminals, pending = [], list(reversed(rules))
+
+        while pending:
+
+            if (name := pending.pop()) in nonterminals:
+                continue
+
+            nonterminals.append(name)
+            pending += [ s for rhs, _ in self.grammar.rules[name] for s in reversed(rhs) if isinstance(s, str) ]
+
+        self.productions = [ ('', (rule,), None) for rule in rules ]
+        self.productions += [ (n, rhs, action) for n in nonterminals for rhs, action in self.grammar.rules[n] ]
+
+        self.lhs      = { name: [] for name in nonterminals }
+        self.firsts   = { name: set() for name in nonterminals }
+        self.nullable = set()
+
+        for index, (name, _, _) in enumerate(self.productions):
+
+            if name:
+                self.lhs[name].append(index)
+
+        changed = True
+
+        while changed:
+
+            changed = False
+
+            for name, rhs, _ in self.productions[len(rules):]:
+
+                first = self.first(rhs, { PROPAGATE })
+
+                if PROPAGATE in first and name not in self.nullable:
+                    self.nullable.add(name)
+                    changed = True
+
+                if not (first := first - { PROPAGATE }) <= self.firsts[name]:
+                    self.firsts[name] |= first
+                    changed = True
+
+        states, index, transitions = [], {}, {}
+
+        def state(kernel: frozenset[Item]) -> int:
+
+            if kernel not in index:
+                index[kernel] = len(states)
+                states.append(kernel)
+
+            return index[kernel]
+
+        self.entries = { rule: state(frozenset({ (number, 0) })) for number, rule in enumerate(rules) }
+        position = 0
+
+        while position < len(states):
+
+            moves = {}
+
+            for production, dot in sorted(self.closure({ item: set() for item in states[position] })):
+
+                if dot < len(rhs := self.productions[production][1]):
+                    moves.setdefault(rhs[dot], set()).add((production, dot + 1))
+
+            for symbol, kernel in moves.items():
+                transitions[(position, symbol)] = state(frozenset(kernel))
+
+            position += 1
+
+        lookaheads = { (s, item): set() for s, kernel in enumerate(states) for item in kernel }
+        propagate  = {}
+
+        for number, rule in enumerate(rules):
+            lookaheads[(self.entries[rule], (number, 0))].add(END)
+
+        for s, kernel in enumerate(states):
+
+            for item in kernel:
+
+                for (production, dot), found in self.closure({ item: { PROPAGATE } }).items():
+
+                    if dot == len(rhs := self.productions[production][1]):
+                        continue
+
+                    target = (transitions[(s, rhs[dot])], (production, dot + 1))
+
+                    for terminal in found:
+
+                        if terminal == PROPAGATE:
+                            propagate.setdefault((s, item), []).append(target)
+
+                        else:
+                            lookaheads[target].add(terminal)
+
+        changed = True
+
+        while changed:
+
+            changed = False
+
+            for source, targets in propagate.items():
+
+                for target in targets:
+
+                    if not lookaheads[source] <= lookaheads[target]:
+                        lookaheads[target] |= lookaheads[source]
+                        changed = True
+
+        terminals = { s for _, rhs, _ in self.productions for s in rhs if not isinstance(s, str) }
+        self.terminals    = sorted(terminals - { END }) + [ END ]
+        self.nonterminals = nonterminals
+
+        columns   = { terminal: column for column, terminal in enumerate(self.terminals) }
+        rows      = { name: row for row, name in enumerate(nonterminals) }
+        conflicts = []
+
+        self.actions, self.gotos = [], []
+
+        for s, kernel in enumerate(states):
+
+            closed  = self.closure({ item: set(lookaheads[(s, item)]) for item in kernel })
+            shifts  = {}
+            reduces = {}
+
+            for (production, dot), found in closed.items():
+
+                name, rhs, _ = self.productions[production]
+                owner = self.grammar.owners[name] if name else rhs[0]
+
+                if dot < len(rhs) and not isinstance(rhs[dot], str):
+                    shifts.setdefault(rhs[dot], set()).add(owner)
+
+                elif dot == len(rhs):
+
+                    for terminal in found:
+                        reduces.setdefault(terminal, {})[production] = owner
+
+            action = [ 0 ] * len(self.terminals)
+            goto   = [ 0 ] * len(nonterminals)
+
+            for terminal in shifts:
+                action[columns[terminal]] = transitions[(s, terminal)] + 1
+
+            for terminal, candidates in reduces.items():
+
+                if terminal in shifts or len(candidates) > 1:
+
+                    kind = 'shift/reduce' if terminal in shifts else 'reduce/reduce'
+                    involved = set(candidates.values()) | shifts.get(terminal, set())
+
+                    conflicts.append(Conflict(kind, s, self.display(terminal), sorted(involved)))
+                    continue
+
+                action[columns[terminal]] = -(next(iter(candidates)) + 1)
+
+            for name in nonterminals:
+
+                if (s, name) in transitions:
+                    goto[rows[name]] = transitions[(s, name)]
+
+            self.actions.append(action)
+            self.gotos.append(goto)
+
+        return conflicts
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- EMITTER :: Pack Rows into a Flat Array, Sharing Identical Rows -------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def compact(rows: list[list[int]]) -> tuple[list[int], list[int]]:
+
+        flat, bases, seen = [], [], {}
+
+        for row in rows:
+
+            if (key := tuple(row)) not in seen:
+                seen[key] = len(flat)
+                flat += row
+
+            bases.append(seen[key])
+
+        return flat, bases
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------- EMITTER :: Format an Integer Array as a Class Attribute -----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def array(name: str, values: list[int]) -> list[str]:
+
+        chunks = [ ', '.join(map(str, values[i:i + 24])) for i in range(0, len(values), 24) ]
+
+        if len(chunks) < 2:
+            return [ f"    {name:<11} = array('i', [{''.join(chunks)}])" ]
+
+        return [ f"    {name:<11} = array('i', [", *(f"        {c}," for c in chunks), "    ])" ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ EMITTER :: Emit the Tables as Generated-Parser Class Attributes -------------
+    # ------------------------------------------------------------------------------------------
+    def emit(self) -> list[str]:
+
+        actions, action_rows = self.compact(self.actions)
+        gotos,   goto_rows   = self.compact(self.gotos)
+
+        rows    = { name: row for row, name in enumerate(self.nonterminals) }
+        columns = { t[1]: c for c, t in enumerate(self.terminals) if t[0] == 'literal' }
+        masks   = tuple(
+            (self.generator.mask(t[1]), c) for c, t in enumerate(self.terminals) if t[0] == 'type'
+        )
+
+        productions = [
+            f"        ({rows[name] if name else -1}, {len(rhs)}, {action if action != IDENTITY else None}),"
+            for name, rhs, action in self.productions
+        ]
+
+        return [
+            *self.array('ACTIONS', actions),
+            *self.array('ACTION_ROWS', action_rows),
+            *self.array('GOTOS', gotos),
+            *self.array('GOTO_ROWS', goto_rows),
+            "",
+            f"    COLUMNS     = {columns!r}",
+            f"    MASKS       = {masks!r}",
+            f"    END         = {len(self.terminals) - 1}",
+            "",
+            "    PRODUCTIONS = (",
+            *productions,
+            "    )",
+            "",
+            "",
+        ]
\ No newline at end of file
@@ -0,0 +1,64 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TESTS :: On-Disk Grammar and Parser Cache ----------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Cache import Cache
+
+GRAMMAR = "sum :=\n    | a=NUMBER '+' b=sum { Add(a, b) }\n    | a=NUMBER { Num(a) }\n"
+
+NAMESPACE = { 'Add': lambda a, b: (int(a.literal), b), 'Num': lambda a: int(a.literal) }
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- TEST :: A Second Load is Read Back, and Parses the Same ---------------------
+# --------------------------------------------------------------------------------------------------
+def test_parser(tmp_path, tokens, tokentype):
+
+    (origin := tmp_path / 'sum.pgram').write_text(GRAMMAR)
+
+    cache = Cache(str(tmp_path / 'cache'))
+    first = cache.parser(str(origin), tokentype, NAMESPACE)
+
+    assert cache.hits == 0
+
+    misses = cache.misses
+    second = cache.parser(str(origin), tokentype, NAMESPACE)
+
+    assert (cache.hits, cache.misses) == (1, misses)
+    assert second(tokens('1 + 2')).parse() == first(tokens('1 + 2')).parse() == (1, 2)
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TEST :: A Changed Grammar is Not Read Back ---------------------------
+# --------------------------------------------------------------------------------------------------
+def test_changed(tmp_path, tokens, tokentype):
+
+    (origin := tmp_path / 'sum.pgram').write_text(GRAMMAR)
+
+    cache = Cache(str(tmp_path / 'cache'))
+    cache.root(str(origin))
+
+    origin.write_text(GRAMMAR.replace("'+'", "'-'"))
+    parser = cache.parser(str(origin), tokentype, NAMESPACE)
+
+    assert cache.hits == 0
+    assert parser(tokens('1 - 2')).parse() == (1, 2)
+
+# --------------------------------------------------------------------------------------------------
+# --------- TEST :: An Edited Rule is Compiled Again, and Spliced among the Cached Others ----------
+# --------------------------------------------------------------------------------------------------
+def test_spliced(tmp_path, tokens, tokentype):
+
+    text = GRAMMAR.replace("b=sum", "b=sum c=other") + "other :=\n    | a=IDENTIFIER { a }\n"
+
+    (origin := tmp_path / 'sum.pgram').write_text(text)
+
+    cache = Cache(str(tmp_path / 'cache'))
+    cache.parser(str(origin), tokentype, NAMESPACE)
+
+    origin.write_text(text.replace("'+'", "'-'"))
+
+    hits, misses = cache.hits, cache.misses
+    parser = cache.parser(str(origin), tokentype, NAMESPACE)
+
+    assert (cache.hits - hits, cache.misses - misses) == (1, 3)    # the grammar, the parser and 'sum' miss
+    assert parser(tokens('1 - 2 x')).parse() == (1, 2)
\ No newline at end of file
@@ -0,0 +1,62 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- TESTS :: Deferred Semantic Actions -------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+GRAMMAR = (
+    "s :=\n"
+    "    | a=NUMBER b=IDENTIFIER { Pair(a, b) }\n"
+    "    | a=item+ { a }\n"
+    "item :=\n    | a=NUMBER { Int(a) }\n    | a=IDENTIFIER { a }\n"
+)
+
+NAMESPACE = { 'Pair': lambda a, b: (a, b), 'Int': lambda a: int(a.literal) }
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------- TEST :: Tokens and Integers Pass through Resolution Untouched ------------------
+# --------------------------------------------------------------------------------------------------
+def test_plain_values(grammar, tokens, tokentype):
+
+    eager    = Generator(grammar(GRAMMAR), tokentype).load(NAMESPACE)
+    deferred = Generator(grammar(GRAMMAR), tokentype, deferred=True).load(NAMESPACE)
+
+    for source in ('3 x', 'x 0 y 1 2', '0 1'):
+
+        expected = eager(tokens(source)).parse()
+
+        assert deferred(tokens(source)).parse() == expected
+        assert [ type(v) for v in deferred(tokens(source)).parse() ] == [ type(v) for v in expected ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------- TEST :: The Deferred Result Equals the Eager Result -----------------------
+# --------------------------------------------------------------------------------------------------
+def test_matches_eager(grammar, arithmetic, constructors, tokens, tokentype):
+
+    eager    = Generator(grammar(arithmetic), tokentype).load(constructors)
+    deferred = Generator(grammar(arithmetic), tokentype, deferred=True).load(constructors)
+
+    for source in ('1', '1 + 2 * 3', '( 1 + 2 ) * 3 + 4 * ( 5 )', '1 * ( 2 + ( 3 * 4 ) ) + 5', '+'):
+        assert deferred(tokens(source)).parse() == eager(tokens(source)).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ TEST :: Actions of an Abandoned Alternative are Never Called ------------------
+# --------------------------------------------------------------------------------------------------
+def test_abandoned(grammar, tokens, tokentype):
+
+    text  = "s :=\n    | a=( b=NUMBER { Mark(b) } ) '!' { Done(a) }\n    | a=NUMBER '?' { Done(a) }\n"
+    calls = []
+    namespace = {
+        'Mark': lambda b: calls.append('Mark') or b.literal,
+        'Done': lambda a: calls.append('Done') or a,
+    }
+
+    assert Generator(grammar(text), tokentype).load(namespace)(tokens('1 ?')).parse().literal == '1'
+    assert calls == [ 'Mark', 'Done' ]
+
+    calls.clear()
+
+    assert Generator(grammar(text), tokentype, deferred=True).load(namespace)(tokens('1 ?')).parse().literal == '1'
+    assert calls == [ 'Done' ]
\ No newline at end of file
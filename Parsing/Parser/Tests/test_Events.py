@@ -0,0 +1,72 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Parse-Event Handlers ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+from .. Handler   import Handler
+from .. Parser    import Parser
+
+GRAMMAR = "sum :=\n    | a=NUMBER '+' b=sum { Add(a, b) }\n    | a=NUMBER { Num(a) }\n"
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Handler Recording Events --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Recorder(Handler):
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def enter_rule(self, rule, offset):
+        self.events.append(('enter', rule, offset))
+
+    def exit_rule(self, rule, offset, matched):
+        self.events.append(('exit', rule, offset, matched))
+
+    def token(self, token):
+        self.events.append(('token', token.literal))
+
+    def action_result(self, action, arguments):
+        return action, tuple(getattr(a, 'literal', a) for a in arguments)
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------- TEST :: The Recognizer Takes a Handler as Documented ----------------------
+# --------------------------------------------------------------------------------------------------
+def test_recognizer(grammar, tokens, tokentype):
+
+    parser = Generator(grammar(GRAMMAR), tokentype, handler=Handler).load()
+
+    assert parser(tokens('1 + 2'), Handler()).parse() is True
+    assert parser(tokens('1 +'), Handler()).parse() is True    # the second alternative matches '1'
+    assert parser(tokens('+'), Handler()).parse() is None
+    assert parser(tokens('1 + 2')).parse() is True    # the handler is optional
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TEST :: Every Overridden Event is Reported ---------------------------
+# --------------------------------------------------------------------------------------------------
+def test_events(grammar, tokens, tokentype):
+
+    parser  = Generator(grammar(GRAMMAR), tokentype, handler=Recorder).load()
+    handler = Recorder()
+    result  = parser(tokens('1 + 2'), handler).parse()
+
+    assert result == ('Add', ('1', ('Num', ('2',))))
+    assert handler.events[0] == ('enter', 'sum', 0)
+    assert handler.events[-1] == ('exit', 'sum', 3, True)
+    assert [ e[1] for e in handler.events if e[0] == 'token' ][:3] == [ '1', '+', '2' ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------- TEST :: Actions Alone Leave the Matchers Unwrapped -----------------------
+# --------------------------------------------------------------------------------------------------
+def test_actions_only(grammar, tokens, tokentype):
+
+    class Actions(Handler):
+        def action_result(self, action, arguments):
+            return action
+
+    parser = Generator(grammar(GRAMMAR), tokentype, handler=Actions).load()
+
+    assert parser.expect is Parser.expect    # tokens go unreported, so matched at full speed
+    assert parser(tokens('1 + 2'), Actions()).parse() == 'Add'
\ No newline at end of file
@@ -0,0 +1,84 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: PEG Parser Generator ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+GRAMMAR = (
+    "s :=\n"
+    "    | 'g' x=( y=[NUMBER] '!' { y } ) ';' { One(x) }\n"
+    "    | 'l' xs=( y=[NUMBER] ';' { y } )* '.' { Many(xs) }\n"
+    "    | 'r' x=opt '.' { One(x) }\n"
+    "opt :=\n    | a=[IDENTIFIER] { a }\n"
+)
+
+NAMESPACE = {
+    'One'  : lambda x: ('one', x and x.literal),
+    'Many' : lambda xs: ('many', [ x and x.literal for x in xs ]),
+}
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TEST :: A None Output is a Match, not a Failure -------------------------
+# --------------------------------------------------------------------------------------------------
+def test_none_output(grammar, tokens, tokentype):
+
+    parser = Generator(grammar(GRAMMAR), tokentype).load(NAMESPACE)
+
+    assert parser(tokens('g 1 ! ;')).parse() == ('one', '1')
+    assert parser(tokens('g ! ;')).parse() == ('one', None)
+    assert parser(tokens('l 1 ; ; 2 ; .')).parse() == ('many', [ '1', None, '2' ])
+    assert parser(tokens('l ; ; .')).parse() == ('many', [ None, None ])
+    assert parser(tokens('r x .')).parse() == ('one', 'x')
+    assert parser(tokens('r .')).parse() == ('one', None)
+    assert parser(tokens('g ;')).parse() is None
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- TEST :: Nothing is Emitted after an Unconditional Return --------------------
+# --------------------------------------------------------------------------------------------------
+def test_no_dead_code(grammar, tokentype):
+
+    text  = "r :=\n    | a=NUMBER* { List(a) }\n    | IDENTIFIER\n" + "s :=\n    | a=[NUMBER] { a }\n    | STRING\n"
+    lines = Generator(grammar(text), tokentype).generate().split('\n')
+    depth = lambda line: len(line) - len(line.lstrip())
+
+    for line, following in zip(lines, lines[1:]):
+
+        if line.lstrip().startswith('return '):    # only a dedent, or a blank line, can follow
+            assert not following.strip() or depth(following) < depth(line)
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: A Cut Releases the Memo Entries Behind it, and no Others ----------------
+# --------------------------------------------------------------------------------------------------
+def test_cut_releases(grammar, tokens, tokentype):
+
+    item = "item :=\n    | 'a' ~ b=NUMBER { b }\n    | 'c' ~ b=pair { b }\n"
+    pair = "pair :=\n    | '(' x=NUMBER ',' NUMBER ')' { x }\n    | '(' x=NUMBER ')' { x }\n"
+
+    cut   = Generator(grammar("s :=\n    | a=( ~ b=item { b } )* { a }\n" + item + pair), tokentype).load()
+    plain = Generator(grammar("s :=\n    | a=( b=item { b } )* { a }\n" + item.replace(' ~', '') + pair), tokentype).load()
+
+    source = 'a 1 c ( 2 , 3 ) c ( 4 ) a 5'
+    parser = cut(tokens(source))
+
+    assert parser.parse() == plain(tokens(source)).parse()
+    assert parser.released > 0 and all(offset >= parser.released for offset in parser.memo)
+
+# --------------------------------------------------------------------------------------------------
+# --------- TEST :: Repeated Subexpressions Share One Helper, Called from Every Occurrence ---------
+# --------------------------------------------------------------------------------------------------
+def test_shared_helpers(grammar, tokens, tokentype):
+
+    text = (
+        "s :=\n    | a=NUMBER b=( '+' c=NUMBER { c } )* { Sum(a, b) }\n    | a=t { a }\n"
+        "t :=\n    | a=IDENTIFIER b=( '+' c=NUMBER { c } )* { Sum(a, b) }\n"
+    )
+    namespace = { 'Sum': lambda a, b: [ a.literal, *(c.literal for c in b) ] }
+
+    source = Generator(grammar(text), tokentype).generate()
+    parser = Generator(grammar(text), tokentype).load(namespace)
+
+    assert len({ line.split('(')[0] for line in source.split('\n') if line.lstrip().startswith('def _') }) == 1
+    assert parser(tokens('1 + 2 + 3')).parse() == [ '1', '2', '3' ]
+    assert parser(tokens('x + 2')).parse() == [ 'x', '2' ]
\ No newline at end of file
@@ -0,0 +1,25 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Incremental Reparsing ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------- TEST :: An Edit Reparses to what a Fresh Parse Gives ----------------------
+# --------------------------------------------------------------------------------------------------
+def test_edit(grammar, arithmetic, constructors, tokens, tokentype):
+
+    incremental = Generator(grammar(arithmetic), tokentype, incremental=True).load(constructors)
+    plain       = Generator(grammar(arithmetic), tokentype).load(constructors)
+
+    parser = incremental(tokens('1 + 2 * 3 + 4'))
+    parser.parse()
+
+    parser.edit(2, 3, tokens('5 * 6')[:-1])    # '2' becomes '5 * 6', without the end of input
+
+    assert parser.parse() == plain(tokens('1 + 5 * 6 * 3 + 4')).parse()
+    assert parser.reused > 0
+
+    parser.edit(0, 2, [])
+
+    assert parser.parse() == plain(tokens('5 * 6 * 3 + 4')).parse()
\ No newline at end of file
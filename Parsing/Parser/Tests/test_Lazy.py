@@ -0,0 +1,47 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Lazily Parsed Blocks ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+from .. Lazy      import Lazy
+
+import pytest
+
+GRAMMAR = (
+    "blocks :=\n    | a=block b=blocks { Add(a, b) }\n    | block\n"
+    "block :=\n    | a=IDENTIFIER INDENT b=blocks DEDENT { Block(a, b) }\n"
+    "    | a=NUMBER { Num(a) }\n"
+)
+
+NAMESPACE = {
+    'Add'   : lambda a, b: ('+', a, b),
+    'Block' : lambda a, b: (a.literal, b),
+    'Num'   : lambda a: int(a.literal),
+}
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TEST :: A Block Body is Parsed Only when Touched ------------------------
+# --------------------------------------------------------------------------------------------------
+def test_forced(grammar, tokens, tokentype):
+
+    lazy  = Generator(grammar(GRAMMAR), tokentype, lazy=True).load(NAMESPACE)
+    eager = Generator(grammar(GRAMMAR), tokentype).load(NAMESPACE)
+
+    source = 'f { 1 g { 2 3 } } 4'
+    result = lazy(tokens(source)).parse()
+    expect = eager(tokens(source)).parse()
+
+    assert isinstance(body := result[1][1], Lazy)
+    assert result[2] == expect[2]
+    assert len(body) == 3 and body[:2] == expect[1][1][:2]    # forced, but its own block stays lazy
+    assert body[2][1].force() == expect[1][1][2][1]
+    assert lazy(tokens('f { 1')).parse() == eager(tokens('f { 1')).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------- TEST :: Lazy Bodies Cannot be Edited in Place --------------------------
+# --------------------------------------------------------------------------------------------------
+def test_not_incremental(grammar, tokentype):
+
+    with pytest.raises(ValueError):
+        Generator(grammar(GRAMMAR), tokentype, lazy=True, incremental=True)
\ No newline at end of file
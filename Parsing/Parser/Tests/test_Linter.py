@@ -0,0 +1,29 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------------- TESTS :: Cut Linter ---------------------------------------
+# --------------------------------------------------------------------------------------------------
+from .... Optimization.Pipeline import Pipeline
+
+from  .. Generator import Generator
+from  .. Linter    import Linter
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TEST :: A Disjoint Leading Token Suggests a Cut -------------------------
+# --------------------------------------------------------------------------------------------------
+def test_suggests_cut(grammar, tokentype):
+
+    text   = "r :=\n    | NUMBER IDENTIFIER\n    | IDENTIFIER\n"
+    linter = Linter(Generator(grammar(text), tokentype))
+
+    assert [ (s.rule, s.alternative) for s in linter.suggestions ] == [ ('r', 1) ]
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- TEST :: Linting a Factored Grammar with an Empty Branch ---------------------
+# --------------------------------------------------------------------------------------------------
+def test_factored_empty_branch(grammar, tokentype):
+
+    text = "r :=\n    | a NUMBER\n    | a\n    | STRING\na :=\n    | IDENTIFIER '+'\n"
+    root = Pipeline.default().run(grammar(text))    # factoring leaves the second branch empty
+
+    assert Linter(Generator(root, tokentype)).suggestions == []
\ No newline at end of file
@@ -0,0 +1,23 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TESTS :: Regular Rules Matched by Pattern ----------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+GRAMMAR = "names :=\n    | a=IDENTIFIER b=(',' c=IDENTIFIER { c })* { Names(a, b) }\n"
+
+NAMESPACE = { 'Names': lambda a, b: [ a.literal, *(name.literal for name in b) ] }
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------- TEST :: A Pattern-Matched Rule Builds the Same Tree -----------------------
+# --------------------------------------------------------------------------------------------------
+def test_same_as_descent(grammar, tokens, tokentype):
+
+    generator = Generator(grammar(GRAMMAR), tokentype, regular=True)
+    regular   = generator.load(NAMESPACE)
+    plain     = Generator(grammar(GRAMMAR), tokentype).load(NAMESPACE)
+
+    assert generator.regular.rules == { 'names' }
+
+    for source in ('x', 'x , y , z', 'x ,', ', x'):
+        assert regular(tokens(source)).parse() == plain(tokens(source)).parse()
\ No newline at end of file
@@ -0,0 +1,48 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Inferred Node Schema ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+GRAMMAR = (
+    "s :=\n"
+    "    | a=NUMBER b=NUMBER { Pair(a, b) }\n"
+    "    | '[' xs=NUMBER* ']' { List(*xs) }\n"
+    "    | a=NUMBER { Pair(a) }\n"
+)
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------- TEST :: Call Sites Name the Fields, Merged by Position Across Sites ---------------
+# --------------------------------------------------------------------------------------------------
+def test_inferred(grammar, tokentype):
+
+    classes = Generator(grammar(GRAMMAR), tokentype, nodes=True).schema.load()
+
+    assert classes['Pair'].__slots__ == classes['Pair'].__match_args__ == ('a', 'b')
+    assert classes['List'].__slots__ == ('xs',)
+    assert sorted(c.tag for c in classes.values()) == [ 1, 2 ]
+
+    assert not hasattr(classes['Pair'](1, 2), '__dict__')
+    assert classes['Pair'](1).b is None
+    assert classes['List'](1, 2, 3).xs == (1, 2, 3)
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------- TEST :: The Generated Parser Builds the Nodes, Ready to Match ------------------
+# --------------------------------------------------------------------------------------------------
+def test_parsed(grammar, arithmetic, tokens, tokentype):
+
+    parser = Generator(grammar(arithmetic), tokentype, nodes=True).load()
+    tree   = parser(tokens('1 + 2 * 3')).parse()
+
+    Bin, Num = type(tree), type(tree.a)
+
+    match tree:
+
+        case Bin(Num(one), plus, Bin(Num(two), times, Num(three))):
+            assert [ t.literal for t in (one, plus, two, times, three) ] == [ '1', '+', '2', '*', '3' ]
+
+        case _:
+            assert False, repr(tree)
+
+    assert (Bin.__name__, Num.__name__) == ('Bin', 'Num') and Bin.tag != Num.tag
\ No newline at end of file
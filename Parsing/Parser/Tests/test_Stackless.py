@@ -0,0 +1,36 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TESTS :: Stackless Parsing of Deep Nesting ---------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+import pytest
+
+DEPTH = 5000
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------- TEST :: Nesting too Deep to Recurse is Driven on the Explicit Stack ---------------
+# --------------------------------------------------------------------------------------------------
+def test_nested(grammar, arithmetic, constructors, tokens, tokentype):
+
+    source = tokens('( ' * DEPTH + '1 + 2 * 3' + ' )' * DEPTH)
+
+    recursive = Generator(grammar(arithmetic), tokentype).load(constructors)
+    stackless = Generator(grammar(arithmetic), tokentype, stackless=True).load(constructors)
+
+    with pytest.raises(RecursionError):
+        recursive(source).parse()
+
+    assert stackless(source).parse() == (1, '+', (2, '*', 3))
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: Shallow Inputs Parse the Same with or without the Stack -----------------
+# --------------------------------------------------------------------------------------------------
+def test_shallow(grammar, arithmetic, constructors, tokens, tokentype):
+
+    recursive = Generator(grammar(arithmetic), tokentype).load(constructors)
+    stackless = Generator(grammar(arithmetic), tokentype, stackless=True).load(constructors)
+
+    for source in ('1', '1 + 2 * 3', '( 1 + 2 ) * 3 + 4 * ( 5 )', '1 * ( 2 + ( 3 * 4 ) ) + 5', '+'):
+        assert stackless(tokens(source)).parse() == recursive(tokens(source)).parse()
\ No newline at end of file
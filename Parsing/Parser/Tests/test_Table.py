@@ -0,0 +1,20 @@
+# --------------------------------------------------------------------------------------------------
+# -------------------------------------- TESTS :: LALR Tables --------------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TEST :: A Table-Driven Rule Builds the Same Tree ------------------------
+# --------------------------------------------------------------------------------------------------
+def test_same_as_descent(grammar, arithmetic, constructors, tokens, tokentype):
+
+    generator = Generator(grammar(arithmetic), tokentype, lalr=True)
+    table     = generator.load(constructors)
+    plain     = Generator(grammar(arithmetic), tokentype).load(constructors)
+
+    assert generator.table.lr == { 'expr', 'term', 'atom' }
+    assert generator.table.conflicts == []
+
+    for source in ('1 + 2 + 3', '1 * 2 * 3', '( 1 + 2 ) * 3', '1 +', '* 1'):
+        assert table(tokens(source)).parse() == plain(tokens(source)).parse()
\ No newline at end of file
@@ -0,0 +1,28 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- TESTS :: Precedence Towers -----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Generator import Generator
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------- TEST :: Both Operator Levels Form One Tower ---------------------------
+# --------------------------------------------------------------------------------------------------
+def test_detected(grammar, arithmetic, tokentype):
+
+    generator = Generator(grammar(arithmetic), tokentype)
+
+    assert generator.towers['expr'][0] is generator.towers['term'][0]
+    assert [ generator.towers[name][1] for name in ('expr', 'term') ] == [ 0, 1 ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: Each Level Keeps its Associativity and Binding Strength -----------------
+# --------------------------------------------------------------------------------------------------
+def test_associativity(grammar, arithmetic, constructors, tokens, tokentype):
+
+    parser = Generator(grammar(arithmetic), tokentype).load(constructors)
+
+    assert parser(tokens('1 + 2 + 3')).parse() == (1, '+', (2, '+', 3))
+    assert parser(tokens('1 * 2 * 3')).parse() == ((1, '*', 2), '*', 3)
+    assert parser(tokens('1 + 2 * ( 3 + 4 )')).parse() == (1, '+', (2, '*', (3, '+', 4)))
+    assert parser(tokens('+ 1')).parse() is None
\ No newline at end of file
@@ -0,0 +1,204 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------- PARSING :: Precedence Tower -----------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Preparsing.Nodes.Alternation   import Alternation
+from ... Preparsing.Nodes.Assignment    import Assignment
+from ... Preparsing.Nodes.Concatenation import Concatenation
+from ... Preparsing.Nodes.Expression    import Expression
+from ... Preparsing.Nodes.Identifier    import Identifier
+from ... Preparsing.Nodes.Output        import Output
+from ... Preparsing.Nodes.Parenthetical import Parenthetical
+from ... Preparsing.Nodes.String        import String
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . Generator import Generator
+
+Binary = tuple[str | None, Expression, str | None, str | None, bool, Output | None]
+Prefix = tuple[Expression, str | None, str | None, Output | None]
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- CLASS :: Precedence Tower ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Tower(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    levels   : list[str]
+    base     : str
+    binaries : list[list[Binary]]
+    prefixes : list[list[Prefix]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self,
+        levels: list[str], base: str, binaries: list[list[Binary]], prefixes: list[list[Prefix]]
+    ) -> None:
+
+        self.levels   = levels
+        self.base     = base
+        self.binaries = binaries
+        self.prefixes = prefixes
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Tower({' > '.join(self.levels)} > {self.base})"
+
+    def __str__(self)  -> str:
+        return f"Tower({' > '.join(self.levels)} > {self.base})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------- HELPER :: Split an Item into its Binding Name and Unwrapped Expression ---------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def binding(item: Expression) -> tuple[str | None, Expression]:
+
+        name = None
+
+        if isinstance(item, Assignment):
+            name, item = item.identifier.token.literal, item.expression
+
+        while isinstance(item, Parenthetical) and item.output is None:
+            item = item.expression
+
+        return name, item
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- HELPER :: Name of the Rule an Item Refers To ----------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def reference(item: Expression) -> str | None:
+        return item.token.literal if isinstance(item, Identifier) else None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- HELPER :: Terminal Keys an Operator can Match ----------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def keys(operator: Expression) -> set[str]:
+
+        if isinstance(operator, Alternation):
+            return set().union(*map(Tower.keys, operator.expressions))
+
+        if isinstance(operator, String):
+            return { operator.token.literal[1:-1] }
+
+        return { operator.token.literal }
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- HELPER :: Whether any Two Operators of a Kind Overlap ------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def overlapping(operators: list[Expression]) -> bool:
+
+        seen = set()
+
+        for operator in operators:
+
+            if (keys := Tower.keys(operator)) & seen:
+                return True
+
+            seen |= keys
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------ HELPER :: Recognize one Level of a Precedence Tower -------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def level(
+        name: str, generator: 'Generator'
+    ) -> tuple[str, list[Binary], list[Prefix]] | None:
+
+        alternatives = generator.alternatives(generator.rules[name].productions)
+        binaries, prefixes = [], []
+
+        if len(alternatives) < 2 or alternatives[-1][1] is not None:
+            return None
+
+        if name in generator.nones:    # the operator loop would take a None operand for no match
+            return None
+
+        if (base := Tower.reference(alternatives[-1][0])) not in generator.rules or base == name:
+            return None
+
+        for expression, output in alternatives[:-1]:
+
+            if not isinstance(expression, Concatenation):
+                return None
+
+            items = [ Tower.binding(item) for item in expression.expressions ]
+
+            if len(items) == 3 and generator.terminal(items[1][1]):
+
+                (left, a), (op, operator), (right, b) = items
+                associativity = (Tower.reference(a), Tower.reference(b))
+
+                if associativity not in ((base, name), (name, base)):
+                    return None
+
+                binaries.append((left, operator, op, right, associativity == (base, name), output))
+
+            elif len(items) == 2 and generator.terminal(items[0][1]) and (
+                Tower.reference(items[1][1]) == name
+            ):
+                (op, operator), (operand, _) = items
+                prefixes.append((operator, op, operand, output))
+
+            else:
+                return None
+
+        return base, binaries, prefixes
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- METHOD :: Find the Precedence Towers of a Grammar --------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def detect(generator: 'Generator') -> dict[str, tuple['Tower', int]]:
+
+        levels = {
+            name: level for name in generator.rules
+            if (level := Tower.level(name, generator)) is not None
+        }
+
+        lower  = { level[0] for level in levels.values() }
+        towers = {}
+
+        for top in levels:
+
+            if top in lower:
+                continue
+
+            chain, name = [], top
+
+            while name in levels and name not in towers and name not in chain:
+                chain.append(name)
+                name = levels[name][0]
+
+            binaries = [ levels[n][1] for n in chain ]
+            prefixes = [ levels[n][2] for n in chain ]
+
+            if Tower.overlapping([ b[1] for level in binaries for b in level ]) or (
+                Tower.overlapping([ p[0] for level in prefixes for p in level ])
+            ):
+                continue
+
+            tower = Tower(chain, name, binaries, prefixes)
+
+            for index, level in enumerate(chain):
+                towers[level] = (tower, index)
+
+        return towers
\ No newline at end of file
@@ -0,0 +1,51 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PARSING :: Abstract Base Visitor Class -----------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+import re
+
+R = TypeVar('R')
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------- FUNCTION :: Name of the Visitor Method for a Kind ------------------------
+# --------------------------------------------------------------------------------------------------
+def method(kind: str) -> str:
+    return f"visit_{re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', kind).lower()}"
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ CLASS :: Abstract Base Visitor Class ------------------------------
+# --------------------------------------------------------------------------------------------------
+class Visitor(Generic[R]):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Visitor()"
+
+    def __str__(self)  -> str:
+        return f"Visitor()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Generic --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_generic(self, node: Any) -> R:    # node kinds come from the grammar, 'visit_<kind>' overrides
+        ...
\ No newline at end of file
@@ -26,10 +26,12 @@ class Lexer(object):
     end    : int
     line   : int
     column : int
+    span   : tuple[int, int, int, int]
 
     codec  : Codec
 
     token     : Optional[Token]
+    following : Optional[Token]
     tokenizer : Iterator[Token]
 
 
@@ -46,10 +48,12 @@ class Lexer(object):
         self.end    = 0
         self.line   = 1
         self.column = 1
+        self.span   = (0, 0, 1, 1)
 
         self.codec  = Codec(origin)
 
-        self.token = None
+        self.token     = None
+        self.following = None
         self.tokenizer = self.tokenize()
 
         self.next()
@@ -73,6 +77,20 @@ class Lexer(object):
         return self.codec.next()
 
 
+    # ------------------------------------------------------------------------------------------
+    # -------------------- UTILITY :: Move Line and Column Past the Literal --------------------
+    # ------------------------------------------------------------------------------------------
+    def locate(self) -> None:
+
+        for codepoint in self.literal:
+
+            if codepoint == ord('\n'):
+                self.line, self.column = self.line + 1, 1
+
+            elif codepoint != ord('\r'):
+                self.column += 1
+
+
     # ------------------------------------------------------------------------------------------
     # ------------------- UTILITY :: Advance Start to End and Return Literal -------------------
     # ------------------------------------------------------------------------------------------
@@ -80,6 +98,9 @@ class Lexer(object):
 
         literal = bytes(self.literal).decode(encoding='utf-8')
 
+        self.span = self.start, self.end, self.line, self.column
+        self.locate()
+
         self.start   = self.end
         self.literal = []
 
@@ -91,6 +112,8 @@ class Lexer(object):
     # ------------------------------------------------------------------------------------------
     def ignore(self) -> Iterator[Token]:
 
+        self.locate()
+
         self.start   = self.end
         self.literal = []
 
@@ -138,8 +161,8 @@ class Lexer(object):
     # ------------------------------------------------------------------------------------------
     def string(self, quote: str) -> Iterator[Token]:
 
-        while (character := self.observe()) and character != ord(quote):
-            self.advance()
+        while (character := self.observe()) and character not in (ord(quote), ord('\r'), ord('\n')):
+            self.advance()    # a string ends with its line, so an unclosed one costs a single definition
 
         if self.observe() == ord(quote):
             self.advance()
@@ -155,7 +178,7 @@ class Lexer(object):
     # ------------------------------------------------------------------------------------------
     def comment(self) -> None:
 
-        while (codepoint := self.observe()) not in (ord('\r'), ord('\n')):
+        while (codepoint := self.observe()) and codepoint not in (ord('\r'), ord('\n')):
             self.advance()
 
         yield from self.ignore()
@@ -168,9 +191,11 @@ class Lexer(object):
 
         if close:
 
-            if self.parentheses.pop() != ord(open):
+            if self.parentheses[-1] != ord(open):
                 raise SyntaxError(f"mismatched parenthetical: '{close}'")
 
+            self.parentheses.pop()
+
         else:
             self.parentheses.append(ord(open))
 
@@ -181,7 +206,7 @@ class Lexer(object):
     # ---------------------- TOKENIZER :: Raise Erroneous Character Error ----------------------
     # ------------------------------------------------------------------------------------------
     def erroneous(self) -> NoReturn:
-        raise SyntaxError(f"erroneous character '{self.source[self.start]}'")
+        raise SyntaxError(f"erroneous character '{chr(self.literal[-1])}'")
 
 
     # ------------------------------------------------------------------------------------------
@@ -204,6 +229,8 @@ class Lexer(object):
         (ord('+'), ) : lambda self : self.operator(Tokentype.PLUS),
         (ord(','), ) : lambda self : self.operator(Tokentype.COMMA),
         (ord('='), ) : lambda self : self.operator(Tokentype.ASSIGN),
+        (ord('!'), ) : lambda self : self.operator(Tokentype.BANG),
+        (ord('~'), ) : lambda self : self.operator(Tokentype.TILDE),
 
         (ord('#'), ) : lambda self : self.comment(),
 
@@ -211,8 +238,6 @@ class Lexer(object):
         (ord('"'), ) : lambda self : self.string('"'),
 
         (ord('&'), ) : lambda self : self.erroneous(),
-        (ord('!'), ) : lambda self : self.erroneous(),
-        (ord('!'), ) : lambda self : self.erroneous(),
         (ord('@'), ) : lambda self : self.erroneous(),
         (ord('$'), ) : lambda self : self.erroneous(),
         (ord('%'), ) : lambda self : self.erroneous(),
@@ -319,7 +344,8 @@ class Lexer(object):
                 self.advance()
                 yield from tokenizer(self); continue
 
-            raise SyntaxError(f"unrecognized character '{single_prefix}'")
+            self.advance()
+            raise SyntaxError(f"unrecognized character '{chr(single_prefix[0])}'")
 
         yield from self.operator(Tokentype.EOF)
 
@@ -331,21 +357,50 @@ class Lexer(object):
         return self.token
 
 
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- UTILITY :: Observe the Token after the Next -----------------------
+    # ------------------------------------------------------------------------------------------
+    def lookahead(self) -> None | Token:
+
+        if self.following is None:    # read early, and handed out by the next call to next
+            self.following = self.scan()
+
+        return self.following
+
+
     # ------------------------------------------------------------------------------------------
     # ----------------------------- UTILITY :: Consume Next Token ------------------------------
     # ------------------------------------------------------------------------------------------
     def next(self) -> None | Token:
 
+        prev_token = self.token
+
+        if self.following is not None:
+            self.token, self.following = self.following, None
+
+        else:
+            self.token = self.scan()
+
+        return prev_token
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------- UTILITY :: Scan a Token from Source ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def scan(self) -> None | Token:
+
         try:
-            next_token = next(self.tokenizer)
+            return next(self.tokenizer)
 
         except StopIteration:
-            next_token = None
+            return None
 
-        prev_token = self.token
-        self.token = next_token
+        except SyntaxError as error:
 
-        return prev_token
+            self.consume()
+            self.tokenizer = self.tokenize()    # carry on past the offending characters
+
+            return Token(Tokentype.ERROR, str(error), *self.context)
 
 
     # ------------------------------------------------------------------------------------------
@@ -353,4 +408,4 @@ class Lexer(object):
     # ------------------------------------------------------------------------------------------
     @property
     def context(self) -> tuple[int, int, int, int, str]:
-        return self.start, self.end, self.line, self.column, self.origin
\ No newline at end of file
+        return *self.span, self.origin
\ No newline at end of file
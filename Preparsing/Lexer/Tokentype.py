@@ -29,13 +29,16 @@ class Tokentype(IntFlag):
     STAR           = auto()
     PLUS_PLUS      = auto()
     STAR_STAR      = auto()
+    BANG           = auto()
+    TILDE          = auto()
 
     ASSIGNMENT     = auto()
     ALTERNATION    = auto()
     QUANTIFICATION = auto()
     CONCATENATION  = auto()
 
-    EOL = auto()
-    EOF = auto()
+    EOL   = auto()
+    EOF   = auto()
+    ERROR = auto()    # a lexical fault, whose literal is the message
 
 
@@ -16,6 +16,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Alternation(Expression):
 
+    __slots__ = ('expressions',)
+    _fields   = ('expressions',)
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
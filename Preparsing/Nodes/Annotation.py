@@ -17,6 +17,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Annotation(Expression):
 
+    __slots__ = ('expression',)
+    _fields   = ('expression',)
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -17,6 +17,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Assignment(Expression):
 
+    __slots__ = ('identifier', 'expression')
+    _fields   = ('identifier', 'expression')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
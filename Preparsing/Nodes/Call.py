@@ -20,6 +20,9 @@ R = TypeVar('R')
 
 class Call(Expression):
 
+    __slots__ = ('identifier', 'parameters')
+    _fields   = ('identifier', 'parameters')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -16,6 +16,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Concatenation(Expression):
 
+    __slots__ = ('expressions',)
+    _fields   = ('expressions',)
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
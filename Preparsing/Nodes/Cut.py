@@ -0,0 +1,59 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ PRE-PARSING :: Cut Node -------------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Visitors.Visitor import Visitor
+from .. Lexer.Token      import Token
+from .  Expression       import Expression
+
+from typing import TypeVar
+R = TypeVar('R')
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------------- CLASS :: Cut Node ----------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Cut(Expression):
+
+    __slots__ = ('token',)
+    _fields   = ('token',)
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    token : Token
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ CONSTRUCTION :: Construction ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, token: Token) -> None:
+        self.token  =  token
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Cut('{self.token.literal}')"
+
+    def __str__(self) -> str:
+        return f"Cut('{self.token.literal}')"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITATION :: Accept Visitor ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def accept(self, visitor: Visitor[R]) -> R:
+        return visitor.visit_cut(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ PROPERTIES :: Bounds of Node ------------------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def start(self) -> Token:
+        return self.token
+
+    @property
+    def end(self) -> Token:
+        return self.token
\ No newline at end of file
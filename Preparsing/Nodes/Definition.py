@@ -18,11 +18,15 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Definition(Node):
 
+    __slots__ = ('signature', 'productions', 'fingerprint')
+    _fields   = ('signature', 'productions')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
     signature   : Error | Signature
     productions : Error | Sequence
+    fingerprint : str | None
 
 
     # ------------------------------------------------------------------------------------------
@@ -32,6 +36,7 @@ class Definition(Node):
 
         self.signature   = signature
         self.productions = productions
+        self.fingerprint = None    # stamped by the Fingerprinter, over the body and the rules it references
 
 
     # ------------------------------------------------------------------------------------------
@@ -14,41 +14,48 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Error(Node):
 
+    __slots__ = ('token', 'message')
+    _fields   = ('token', 'message')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
+    token   : Token
+    message : str
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ CONSTRUCTION :: Construction ------------------------------
     # ------------------------------------------------------------------------------------------
-    def __init__(self) -> None:
-        ...
+    def __init__(self, token: Token, message: str) -> None:
+
+        self.token   = token
+        self.message = message
 
 
     # ------------------------------------------------------------------------------------------
     # --------------------------- STRINGIFICATION :: Stringification ---------------------------
     # ------------------------------------------------------------------------------------------
     def __repr__(self) -> str:
-        ...
+        return f"Error({repr(self.message)}, {self.token.line}, {self.token.column})"
 
     def __str__(self) -> str:
-        ...
+        return f"{self.token.origin}:{self.token.line}:{self.token.column}: {self.message}"
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ VISITATION :: Accept Visitor ------------------------------
     # ------------------------------------------------------------------------------------------
     def accept(self, visitor: Visitor[R]) -> R:
-        return visit.visit_error(self)
+        return visitor.visit_error(self)
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ PROPERTIES :: Bounds of Node ------------------------------
     # ------------------------------------------------------------------------------------------
     @property
     def start(self) -> Token:
-        ...
+        return self.token
 
     @property
     def end(self) -> Token:
-        ...
\ No newline at end of file
+        return self.token
\ No newline at end of file
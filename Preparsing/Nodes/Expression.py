@@ -14,6 +14,8 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Expression(Node):
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
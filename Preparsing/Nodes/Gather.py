@@ -0,0 +1,71 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- PRE-PARSING :: Separated-Repetition Node ----------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Visitors.Visitor import Visitor
+from .. Lexer.Token      import Token
+
+from .  Expression  import Expression
+from .  Error       import Error
+
+from typing import TypeVar
+R = TypeVar('R')
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Separated-Repetition Node -------------------------------
+# --------------------------------------------------------------------------------------------------
+class Gather(Expression):
+
+    __slots__ = ('expression', 'separator')
+    _fields   = ('expression', 'separator')
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    expression : Error | Expression
+    separator  : Error | Expression
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ CONSTRUCTION :: Construction ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, expression: Error | Expression, separator: Error | Expression) -> None:
+
+        self.expression = expression
+        self.separator  = separator
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def stringify(self) -> str:
+
+        expression = self.expression.__class__.__name__
+        separator  = self.separator.__class__.__name__
+
+        return f"Gather('{expression}', '{separator}')"
+
+    def __repr__(self) -> str:
+        return self.stringify()
+
+    def __str__(self) -> str:
+        return self.stringify()
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITATION :: Accept Visitor ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def accept(self, visitor: Visitor[R]) -> R:
+        return visitor.visit_gather(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ PROPERTIES :: Bounds of Node ------------------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def start(self) -> Token:
+        return self.expression.start
+
+    @property
+    def end(self) -> Token:
+        return self.separator.end
\ No newline at end of file
@@ -14,6 +14,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Identifier(Literal):
 
+    __slots__ = ('token',)
+    _fields   = ('token',)
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -14,6 +14,8 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Literal(Expression):
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
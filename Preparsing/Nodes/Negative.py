@@ -0,0 +1,61 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PRE-PARSING :: Negative-Lookahead Node -----------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Visitors.Visitor import Visitor
+from .. Lexer.Token      import Token
+
+from .  Expression  import Expression
+from .  Error       import Error
+
+from typing import TypeVar
+R = TypeVar('R')
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Negative-Lookahead Node --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Negative(Expression):
+
+    __slots__ = ('expression',)
+    _fields   = ('expression',)
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    expression : Error | Expression
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ CONSTRUCTION :: Construction ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, expression: Error | Expression) -> None:
+        self.expression = expression
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Negative('{self.expression.__class__.__name__}')"
+
+    def __str__(self) -> str:
+        return f"Negative('{self.expression.__class__.__name__}')"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITATION :: Accept Visitor ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def accept(self, visitor: Visitor[R]) -> R:
+        return visitor.visit_negative(self)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ PROPERTIES :: Bounds of Node ------------------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def start(self) -> Token:
+        return self.expression.start
+
+    @property
+    def end(self) -> Token:
+        return self.expression.end
\ No newline at end of file
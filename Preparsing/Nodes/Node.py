@@ -4,6 +4,8 @@
 from .. Visitors.Visitor  import Visitor
 from .. Lexer.Token       import Token
 
+from typing import Any
+from typing import Iterator
 from typing import TypeVar
 R = TypeVar('R')
 
@@ -13,6 +15,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Node(object):
 
+    __slots__ = ()
+    _fields   : tuple[str, ...] = ()    # the attributes holding its parts, in the order they are written
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -51,4 +56,30 @@ class Node(object):
 
     @property
     def end(self) -> Token:
-        ...
\ No newline at end of file
+        ...
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ TRAVERSAL :: Child Nodes, Field by Field ------------------------
+    # ------------------------------------------------------------------------------------------
+    def children(self) -> Iterator['Node']:
+
+        for field in self._fields:
+
+            if isinstance(value := getattr(self, field), Node):
+                yield value
+
+            elif isinstance(value, tuple):    # the variadic parts of alternations, concatenations and sequences
+                yield from value
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- SERIALIZATION :: State as Slot Values, in Order ---------------------
+    # ------------------------------------------------------------------------------------------
+    def __getstate__(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, slot) for slot in self.__slots__)    # no names, unlike the default
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
\ No newline at end of file
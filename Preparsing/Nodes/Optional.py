@@ -16,6 +16,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Optional(Expression):
 
+    __slots__ = ('expression', 'output')
+    _fields   = ('expression', 'output')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
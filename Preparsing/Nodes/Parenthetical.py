@@ -16,6 +16,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Parenthetical(Expression):
 
+    __slots__ = ('expression', 'output')
+    _fields   = ('expression', 'output')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
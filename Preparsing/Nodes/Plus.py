@@ -16,6 +16,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Plus(Expression):
 
+    __slots__ = ('expression',)
+    _fields   = ('expression',)
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -17,10 +17,12 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Production(Expression):
 
+    __slots__ = ('expression', 'output')
+    _fields   = ('expression', 'output')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
-    lookahead  : Error | Expression | None
     expression : Error | Expression
     output     : Error | Expression | None
 
@@ -14,20 +14,23 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Pseudo(Node):
 
+    __slots__ = ('name', 'elements')
+    _fields   = ('name', 'elements')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
-    children : tuple[Node, ...]
     name     : str
+    elements : tuple[Node, ...]
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ CONSTRUCTION :: Construction ------------------------------
     # ------------------------------------------------------------------------------------------
-    def __init__(self, name: str, *children: Node) -> None:
+    def __init__(self, name: str, *elements: Node) -> None:
 
         self.name     = name
-        self.children = children
+        self.elements = elements
 
 
     # ------------------------------------------------------------------------------------------
@@ -4,9 +4,10 @@
 from .. Visitors.Visitor import Visitor
 from .. Lexer.Token      import Token
 
-from .  Sequence import Sequence
-from .  Node     import Node
-from .  Error    import Error
+from .  Definition import Definition
+from .  Sequence   import Sequence
+from .  Node       import Node
+from .  Error      import Error
 
 from typing import TypeVar
 R = TypeVar('R')
@@ -17,6 +18,9 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Root(Node):
 
+    __slots__ = ('origin', 'definitions')
+    _fields   = ('origin', 'definitions')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
@@ -50,6 +54,29 @@ class Root(Node):
         return visitor.visit_root(self)
 
 
+    # ------------------------------------------------------------------------------------------
+    # --------------- METHOD :: Definitions by Name, Refusing a Grammar in Error ---------------
+    # ------------------------------------------------------------------------------------------
+    def rules(self) -> dict[str, Definition]:
+
+        if errors := self.errors:    # an Error stands where each failed definition would have been
+            raise SyntaxError('\n'.join([f"'{self.origin}' has {len(errors)} error(s):", *map(str, errors)]))
+
+        return { d.signature.identifier.token.literal: d for d in self.definitions.elements }
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- PROPERTIES :: Definitions that Failed to Parse ---------------------
+    # ------------------------------------------------------------------------------------------
+    @property
+    def errors(self) -> list[Error]:
+
+        if isinstance(self.definitions, Error):
+            return [self.definitions]
+
+        return [d for d in self.definitions.elements if isinstance(d, Error)]
+
+
     # ------------------------------------------------------------------------------------------
     # ------------------------------ PROPERTIES :: Bounds of Node ------------------------------
     # ------------------------------------------------------------------------------------------
@@ -18,17 +18,21 @@ R = TypeVar('R')
 # --------------------------------------------------------------------------------------------------
 class Signature(Node):
 
+    __slots__ = ('identifier', 'annotation')
+    _fields   = ('identifier', 'annotation')
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
     identifier : Error | Identifier
-    annotation : Error | Annotation
+    annotation : Error | Annotation | None
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ CONSTRUCTION :: Construction ------------------------------
     # ------------------------------------------------------------------------------------------
-    def __init__(self, identifier: Error | Identifier, annotation: Error | Annotation) -> None:
+    def __init__(self,
+              identifier: Error | Identifier, annotation: None | Error | Annotation = None) -> None:
 
         self.identifier = identifier
         self.annotation = annotation
@@ -60,4 +64,4 @@ class Signature(Node):
 
     @property
     def end(self) -> Token:
-        return self.annotation.end
\ No newline at end of file
+        return self.annotation.end if self.annotation else self.identifier.end
\ No newline at end of file
@@ -0,0 +1,57 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Slotted Grammar Nodes ---------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Node          import Node
+from .. Concatenation import Concatenation
+
+from ... Parser.Parser    import Parser
+from ... Visitors.Printer import Printer
+
+import pickle
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ FUNCTION :: Every Node of a Tree, Reached through children() ------------------
+# --------------------------------------------------------------------------------------------------
+def nodes(root: Node) -> list[Node]:
+
+    found, pending = [], [ root ]
+
+    while pending:
+        found.append(node := pending.pop())
+        pending.extend(node.children())
+
+    return found
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------- TEST :: Nodes are Slotted, and their Children Follow their Fields ----------------
+# --------------------------------------------------------------------------------------------------
+def test_children(shipped):
+
+    for origin in shipped:
+
+        every = nodes(Parser(origin).parse())
+
+        assert not any(hasattr(node, '__dict__') for node in every)
+        assert sum(isinstance(node, Concatenation) for node in every) > 0
+
+        for node in every:
+
+            fields = [ getattr(node, field) for field in node._fields ]
+            expected = [ n for v in fields for n in (v if isinstance(v, tuple) else (v,)) if isinstance(n, Node) ]
+
+            assert list(node.children()) == expected
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------- TEST :: A Tree Pickles by Slot Values, and Reads Back the Same -----------------
+# --------------------------------------------------------------------------------------------------
+def test_pickled(shipped, grammar):
+
+    for root in (*(Parser(origin).parse() for origin in shipped), grammar("a :=\n    | b=[ 'x' ] { A(b) }\n")):
+
+        copy = pickle.loads(data := pickle.dumps(root, pickle.HIGHEST_PROTOCOL))
+
+        assert Printer.format(copy) == Printer.format(root)
+        assert b'expressions' not in data and root.__getstate__() == (root.origin, root.definitions)
\ No newline at end of file
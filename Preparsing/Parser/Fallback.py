@@ -5,6 +5,10 @@ from .. Lexer.Tokentype import Tokentype
 from .. Lexer.Token     import Token
 from .. Lexer.Lexer     import Lexer
 
+from .. Nodes.Error     import Error
+
+from typing import NoReturn
+
 
 # --------------------------------------------------------------------------------------------------
 # ------------------------------- CLASS :: Parser Exception Handler --------------------------------
@@ -14,10 +18,69 @@ class Fallback(object):
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
+    errors : list[Error]
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
     # ------------------------------------------------------------------------------------------
     def __init__(self) -> None:
-        ...
+        self.errors = []
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Fallback(errors={len(self.errors)})"
+
+    def __str__(self)  -> str:
+        return '\n'.join(str(error) for error in self.errors)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ PANIC :: Abandon the Current Definition -------------------------
+    # ------------------------------------------------------------------------------------------
+    def panic(self, token: Token, expectation: str) -> NoReturn:
+
+        if token.type & Tokentype.ERROR:
+            raise SyntaxError(token.literal)
+
+        if token.type & Tokentype.EOL:
+            raise SyntaxError(f"expected {expectation}, found end of line")
+
+        if token.type & Tokentype.EOF:
+            raise SyntaxError(f"expected {expectation}, found end of file")
+
+        raise SyntaxError(f"expected {expectation}, found {repr(token.literal)}")
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- RECOVERY :: Record an Error at a Token -------------------------
+    # ------------------------------------------------------------------------------------------
+    def record(self, token: Token, message: str) -> Error:
+
+        self.errors.append(error := Error(token, message))
+        return error
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- RECOVERY :: Skip to the Next Line Starting with a Definition's Name -----------
+    # ------------------------------------------------------------------------------------------
+    def synchronize(self, lexer: Lexer) -> None:
+
+        skipped = None    # the first token skipped is the offending one, which is already recorded
+
+        while (token := lexer.peek()) and not token.type & Tokentype.EOF:
+
+            if skipped and skipped.type & Tokentype.EOL:
+
+                if token.type & Tokentype.IDENTIFIER and token.column == 1:
+                    break
+
+            if skipped and token.type & Tokentype.ERROR:
+                self.record(token, token.literal)
+
+            skipped = lexer.next()
+
+        lexer.parentheses = ['|']    # brackets left open by the abandoned definition
\ No newline at end of file
@@ -10,11 +10,14 @@ from .. Nodes.Annotation    import Annotation
 from .. Nodes.Assignment    import Assignment
 from .. Nodes.Call          import Call
 from .. Nodes.Concatenation import Concatenation
+from .. Nodes.Cut           import Cut
 from .. Nodes.Definition    import Definition
 from .. Nodes.Error         import Error
 from .. Nodes.Expression    import Expression
+from .. Nodes.Gather        import Gather
 from .. Nodes.Identifier    import Identifier
 from .. Nodes.Literal       import Literal
+from .. Nodes.Negative      import Negative
 from .. Nodes.Node          import Node
 from .. Nodes.Number        import Number
 from .. Nodes.Optional      import Optional
@@ -32,11 +35,16 @@ from .. Nodes.String        import String
 from .. Visitors.Printer    import Printer
 from  . Fallback            import Fallback
 
+from typing import Any
+from typing import Generator
+from typing import Iterator
 from typing import TypeVar
 from typing import Type
 
 R = TypeVar('R', bound=Node)
 
+Steps = Generator[Any, Any, R]    # a method that yields each nested method it calls, for the driver to run
+
 
 # --------------------------------------------------------------------------------------------------
 # ---------------------------------------- CLASS :: Parser -----------------------------------------
@@ -88,6 +96,17 @@ class Parser(object):
         return
 
 
+    # ------------------------------------------------------------------------------------------
+    # ------------------ HELPER :: Consume the Next Token, or Panic if Absent ------------------
+    # ------------------------------------------------------------------------------------------
+    def expect(self, tokentype: Tokentype, expectation: str) -> Token:
+
+        if token := self.consume(tokentype):
+            return token
+
+        self.fallback.panic(self.observe(), expectation)
+
+
     # ------------------------------------------------------------------------------------------
     # ---------------------------------- HELPER :: Lookaheads ----------------------------------
     # ------------------------------------------------------------------------------------------
@@ -97,24 +116,60 @@ class Parser(object):
     def negative_lookahead(self, tokentype: Tokentype) -> Token | None:
         return not self.positive_lookahead(tokentype)
 
+    def following_lookahead(self, tokentype: Tokentype) -> Token | None:
+        return (token := self.lexer.lookahead()) and token.type & tokentype
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------ HELPER :: Run a Parsing Method on an Explicit Stack, so Nesting has no Limit ------
+    # ------------------------------------------------------------------------------------------
+    def drive(self, method: Steps[R]) -> R:
+
+        stack, generator, value = [], method, None
+
+        while True:
+
+            try:
+                request = generator.send(value)
+
+            except StopIteration as stop:
+
+                if not stack:
+                    return stop.value
+
+                generator, value = stack.pop(), stop.value
+                continue
+
+            stack.append(generator)
+            generator, value = request, None
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- HELPER :: Panic Unless a Production Ends Here ----------------------
+    # ------------------------------------------------------------------------------------------
+    def terminal(self) -> None:
+
+        if not self.positive_lookahead(Tokentype.EOL | Tokentype.EOF):
+            self.fallback.panic(self.observe(), "end of line")
+
 
     # ------------------------------------------------------------------------------------------
     # ----------------------------- PARSER :: Parse an Identifier ------------------------------
     # ------------------------------------------------------------------------------------------
     def identifier(self) -> Error | Identifier:
-        return Identifier(self.consume(Tokentype.IDENTIFIER))
+        return Identifier(self.expect(Tokentype.IDENTIFIER, "an identifier"))
 
 
     # ------------------------------------------------------------------------------------------
     # -------------------------- PARSER :: Parse an Atomic Annotation --------------------------
     # ------------------------------------------------------------------------------------------
-    def atom_annotation(self) -> Error | Expression:
+    def atom_annotation(self) -> Steps[Error | Expression]:
 
         if self.positive_lookahead(Tokentype.L_PAREN):
 
             self.consume(Tokentype.L_PAREN)
-            annotation = self.mult_annotation()
-            self.consume(Tokentype.R_PAREN)
+            annotation = yield self.mult_annotation()
+            self.expect(Tokentype.R_PAREN, "')'")
 
             return Parenthetical(annotation)
 
@@ -124,25 +179,25 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # --------------------- PARSER :: Parse an Alternation of Annotations ----------------------
     # ------------------------------------------------------------------------------------------
-    def star_annotation(self) -> Error | Expression:
+    def star_annotation(self) -> Steps[Error | Expression]:
 
         if self.consume(Tokentype.STAR):
-            return Star(self.atom_annotation())
+            return Star((yield self.atom_annotation()))
 
-        return self.atom_annotation()
+        return (yield self.atom_annotation())
 
 
     # ------------------------------------------------------------------------------------------
     # --------------------- PARSER :: Parse an Alternation of Annotations ----------------------
     # ------------------------------------------------------------------------------------------
-    def pipe_annotation(self) -> Error | Expression:
+    def pipe_annotation(self) -> Steps[Error | Expression]:
 
-        annotations = [ annotation := self.star_annotation() ]
+        annotations = [ annotation := (yield self.star_annotation()) ]
 
         if self.positive_lookahead(Tokentype.PIPE):
 
             while self.consume(Tokentype.PIPE):
-                annotations.append(self.star_annotation())
+                annotations.append((yield self.star_annotation()))
 
             return Alternation(annotations)
 
@@ -152,14 +207,14 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ----------------------- PARSER :: Parse a Sequence of Annotations ------------------------
     # ------------------------------------------------------------------------------------------
-    def mult_annotation(self) -> Error | Expression:
+    def mult_annotation(self) -> Steps[Error | Expression]:
 
-        annotations = [ annotation := self.pipe_annotation() ]
+        annotations = [ annotation := (yield self.pipe_annotation()) ]
 
         if self.positive_lookahead(Tokentype.COMMA):
 
             while self.consume(Tokentype.COMMA):
-                annotations.append(self.pipe_annotation())
+                annotations.append((yield self.pipe_annotation()))
 
             return Sequence(*annotations)
 
@@ -169,11 +224,11 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ----------------------------- PARSER :: Parse an Annotation ------------------------------
     # ------------------------------------------------------------------------------------------
-    def annotation(self) -> Error | Annotation:
+    def annotation(self) -> Steps[Error | Annotation]:
 
         self.consume(Tokentype.L_BRACK)
-        annotation = Annotation(self.mult_annotation())
-        self.consume(Tokentype.R_BRACK)
+        annotation = Annotation((yield self.mult_annotation()))
+        self.expect(Tokentype.R_BRACK, "']'")
 
         return annotation
 
@@ -181,15 +236,15 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # -------------------------- PARSER :: Parse an Atomic Parameter ---------------------------
     # ------------------------------------------------------------------------------------------
-    def atom_parameter(self) -> Error | Expression:
+    def atom_parameter(self) -> Steps[Error | Expression]:
 
         identifier = self.identifier()
 
         if self.positive_lookahead(Tokentype.L_PAREN):
 
             self.consume(Tokentype.L_PAREN)
-            parameters = self.mult_parameter()
-            self.consume(Tokentype.R_PAREN)
+            parameters = yield self.mult_parameter()
+            self.expect(Tokentype.R_PAREN, "')'")
 
             return Call(identifier, parameters)
 
@@ -199,25 +254,25 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # -------------------------- PARSER :: Parse a Starred Parameter ---------------------------
     # ------------------------------------------------------------------------------------------
-    def star_parameter(self) -> Error | Expression:
+    def star_parameter(self) -> Steps[Error | Expression]:
 
         if self.consume(Tokentype.STAR):
-            return Star(self.atom_parameter())
+            return Star((yield self.atom_parameter()))
 
-        return self.atom_parameter()
+        return (yield self.atom_parameter())
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------ PARSER :: Parse a Sequence of Parameters ------------------------
     # ------------------------------------------------------------------------------------------
-    def mult_parameter(self) -> Error | Expression:
+    def mult_parameter(self) -> Steps[Error | Expression]:
 
-        parameters = [ parameter := self.star_parameter() ]
+        parameters = [ parameter := (yield self.star_parameter()) ]
 
         if self.positive_lookahead(Tokentype.COMMA):
 
             while self.consume(Tokentype.COMMA):
-                parameters.append(self.star_parameter())
+                parameters.append((yield self.star_parameter()))
 
             return Sequence(*parameters)
 
@@ -227,15 +282,15 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ---------------------------- PARSER :: Parse an Atomic Output ----------------------------
     # ------------------------------------------------------------------------------------------
-    def atom_output(self) -> Error | Expression:
+    def atom_output(self) -> Steps[Error | Expression]:
 
         identifier = self.identifier()
 
         if self.positive_lookahead(Tokentype.L_PAREN):
 
             self.consume(Tokentype.L_PAREN)
-            parameters = self.mult_parameter()
-            self.consume(Tokentype.R_PAREN)
+            parameters = yield self.mult_parameter()
+            self.expect(Tokentype.R_PAREN, "')'")
 
             return Call(identifier, parameters)
 
@@ -245,14 +300,14 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ------------------------- PARSER :: Parse a Sequence of Outputs --------------------------
     # ------------------------------------------------------------------------------------------
-    def mult_output(self) -> Error | Expression:
+    def mult_output(self) -> Steps[Error | Expression]:
 
-        outputs = [ output := self.atom_output() ]
+        outputs = [ output := (yield self.atom_output()) ]
 
         if self.positive_lookahead(Tokentype.COMMA):
 
             while self.consume(Tokentype.COMMA):
-                outputs.append(self.atom_output())
+                outputs.append((yield self.atom_output()))
 
             return Sequence(*outputs)
 
@@ -262,13 +317,13 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ------------------------------- PARSER :: Parse an Output --------------------------------
     # ------------------------------------------------------------------------------------------
-    def output(self) -> Error | Output:
+    def output(self) -> Steps[Error | Output]:
 
         if self.positive_lookahead(Tokentype.L_BRACE):
 
             self.consume(Tokentype.L_BRACE)
-            output = self.mult_output()
-            self.consume(Tokentype.R_BRACE)
+            output = yield self.mult_output()
+            self.expect(Tokentype.R_BRACE, "'}'")
 
             return Output(output)
 
@@ -276,10 +331,10 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ------------------------ PARSER :: Parse an Outfoxed Grammar File ------------------------
     # ------------------------------------------------------------------------------------------
-    def signature(self) -> Error | Signature:
+    def signature(self) -> Steps[Error | Signature]:
 
         identifier = self.identifier()
-        annotation = self.annotation()
+        annotation = (yield self.annotation()) if self.positive_lookahead(Tokentype.L_BRACK) else None
 
         return Signature(identifier, annotation)
 
@@ -298,29 +353,31 @@ class Parser(object):
         if token := self.consume(Tokentype.STRING):
             return String(token)
 
+        self.fallback.panic(self.observe(), "an expression")
+
 
     # ------------------------------------------------------------------------------------------
     # ----------------------- PARSER :: Parse a Parenthetical Expression -----------------------
     # ------------------------------------------------------------------------------------------
-    def parenthetical(self) -> Error | Expression:
+    def parenthetical(self) -> Steps[Error | Expression]:
 
         if self.positive_lookahead(Tokentype.L_PAREN):
 
             self.consume(Tokentype.L_PAREN)
-            expression = self.expression()
-            output     = self.output()
-            self.consume(Tokentype.R_PAREN)
+            expression = yield self.expression()
+            output     = yield self.output()
+            self.expect(Tokentype.R_PAREN, "')'")
 
-            return Parenthetical(expression)
+            return Parenthetical(expression, output)
 
         if self.positive_lookahead(Tokentype.L_BRACK):
 
             self.consume(Tokentype.L_BRACK)
-            expression = self.expression()
-            output     = self.output()
-            self.consume(Tokentype.R_BRACK)
+            expression = yield self.expression()
+            output     = yield self.output()
+            self.expect(Tokentype.R_BRACK, "']'")
 
-            return Optional(expression)
+            return Optional(expression, output)
 
         return self.atomic()
 
@@ -328,26 +385,26 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ------------------------ PARSER :: Parse an Assignment Expression ------------------------
     # ------------------------------------------------------------------------------------------
-    def assignment(self) -> Error | Expression:
+    def assignment(self) -> Steps[Error | Expression]:
 
         if self.positive_lookahead(Tokentype.IDENTIFIER):
 
             identifier = self.identifier()
 
             if self.consume(Tokentype.ASSIGN):
-                return Assignment(identifier, self.parenthetical())
+                return Assignment(identifier, (yield self.parenthetical()))
 
             return identifier
 
-        return self.parenthetical()
+        return (yield self.parenthetical())
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------ PARSER :: Parse a Repetition Expression -------------------------
     # ------------------------------------------------------------------------------------------
-    def repetition(self) -> Error | Expression:
+    def repetition(self) -> Steps[Error | Expression]:
 
-        expression = self.assignment()
+        expression = yield self.assignment()
 
         if self.consume(Tokentype.STAR):
             return Star(expression)
@@ -355,26 +412,45 @@ class Parser(object):
         if self.consume(Tokentype.PLUS):
             return Plus(expression)
 
+        if self.consume(Tokentype.STAR_STAR):
+            return Gather(expression, (yield self.assignment()))
+
         return expression
 
 
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ PARSER :: Parse a Lookahead -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def lookahead(self) -> Steps[Error | Expression]:
+
+        if self.consume(Tokentype.BANG):
+            return Negative((yield self.repetition()))
+
+        if token := self.consume(Tokentype.TILDE):
+            return Cut(token)
+
+        return (yield self.repetition())
+
+
     # ------------------------------------------------------------------------------------------
     # ----------------------- PARSER :: Parse a Concatenation Expression -----------------------
     # ------------------------------------------------------------------------------------------
-    def concatenation(self) -> Error | Expression:
+    def concatenation(self) -> Steps[Error | Expression]:
 
-        expressions = [ expression := self.repetition() ]
+        expressions = [ expression := (yield self.lookahead()) ]
 
         headtype  = Tokentype.IDENTIFIER
         headtype |= Tokentype.STRING
         headtype |= Tokentype.NUMBER
         headtype |= Tokentype.L_PAREN
         headtype |= Tokentype.L_BRACK
+        headtype |= Tokentype.BANG
+        headtype |= Tokentype.TILDE
 
         if self.positive_lookahead(headtype):
 
             while self.positive_lookahead(headtype):
-                expressions.append(self.repetition())
+                expressions.append((yield self.lookahead()))
 
             return Concatenation(tuple(expressions))
 
@@ -384,14 +460,14 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # --------------------- PARSER :: Parse an Alternation of Expressions ----------------------
     # ------------------------------------------------------------------------------------------
-    def alternation(self) -> Error | Expression:
+    def alternation(self) -> Steps[Error | Expression]:
 
-        expressions = [ expression := self.concatenation() ]
+        expressions = [ expression := (yield self.concatenation()) ]
 
         if self.positive_lookahead(Tokentype.PIPE):
 
             while self.consume(Tokentype.PIPE):
-                expressions.append(self.concatenation())
+                expressions.append((yield self.concatenation()))
 
             return Alternation(tuple(expressions))
 
@@ -401,52 +477,64 @@ class Parser(object):
     # ------------------------------------------------------------------------------------------
     # ----------------------------- PARSER :: Parse an Expression ------------------------------
     # ------------------------------------------------------------------------------------------
-    def expression(self) -> Error | Expression:
-        return self.alternation()
+    def expression(self) -> Steps[Error | Expression]:
+        return (yield self.alternation())
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ PARSER :: Parse a Production ------------------------------
     # ------------------------------------------------------------------------------------------
-    def production(self) -> Error | Production:
-        return Production(self.expression(), self.output())
+    def production(self) -> Steps[Error | Production]:
+        return Production((yield self.expression()), (yield self.output()))
 
 
     # ------------------------------------------------------------------------------------------
     # ----------------------- PARSER :: Parse a Sequence of Productions ------------------------
     # ------------------------------------------------------------------------------------------
-    def productions(self) -> Error | Sequence:
+    def productions(self) -> Steps[Error | Sequence]:
 
         if self.positive_lookahead(Tokentype.EOL):
 
             productions : list[ Error | Production ] = []
 
-            while self.consume(Tokentype.EOL) and self.consume(Tokentype.PIPE):
-                productions.append(self.production())
+            while self.positive_lookahead(Tokentype.EOL) and self.following_lookahead(Tokentype.PIPE):
+
+                self.advance()
+                self.advance()
+
+                productions.append((yield self.production()))
+                self.terminal()
+
+            if not productions:    # left at the end of line, so recovery resumes on the line after it
+                self.fallback.panic(self.lexer.lookahead(), "a production starting with '|'")
 
             return Sequence(*productions)
 
-        return Sequence(self.production())
+        production = yield self.production()
+        self.terminal()
+
+        return Sequence(production)
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------ PARSER :: Parse a Definition ------------------------------
     # ------------------------------------------------------------------------------------------
-    def definition(self) -> Error | Definition:
+    def definition(self) -> Steps[Error | Definition]:
 
-        signature = self.signature()
-        walrus = self.consume(Tokentype.WALRUS)
-        productions = self.productions()
+        if (token := self.observe()).column != 1:
+            self.fallback.panic(token, "a definition at the start of a line")
+
+        signature = yield self.signature()
+        self.expect(Tokentype.WALRUS, "':='")
+        productions = yield self.productions()
 
         return Definition(signature, productions)
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------ PARSER :: Parse an Outfoxed Grammar File ------------------------
+    # --------------- PARSER :: Yield each Definition as Soon as it is Complete ----------------
     # ------------------------------------------------------------------------------------------
-    def parse(self) -> Error | Root:
-
-        definitions : list[Error | Definition, ...] = []
+    def iter_definitions(self) -> Iterator[Error | Definition]:
 
         while True:
 
@@ -456,6 +544,19 @@ class Parser(object):
             if self.consume(Tokentype.EOF):
                 break
 
-            definitions.append(self.definition())
+            try:
+                definition = self.drive(self.definition())
+
+            except SyntaxError as error:    # record it, then resume at the next definition
+
+                definition = self.fallback.record(self.observe(), error.msg)
+                self.fallback.synchronize(self.lexer)
 
-        return Root(self.origin, Sequence(*definitions))
+            yield definition
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------ PARSER :: Parse an Outfoxed Grammar File ------------------------
+    # ------------------------------------------------------------------------------------------
+    def parse(self) -> Error | Root:
+        return Root(self.origin, Sequence(*self.iter_definitions()))
\ No newline at end of file
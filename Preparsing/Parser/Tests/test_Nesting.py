@@ -0,0 +1,21 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- TESTS :: Deeply Nested Grammar Expressions ---------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Nodes.Parenthetical import Parenthetical
+
+DEPTH = 5000
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------ TEST :: The Preparser Nests as Deep as Memory Allows, not the Call Stack ------------
+# --------------------------------------------------------------------------------------------------
+def test_nested(grammar):
+
+    root = grammar("a :=\n    | " + "( " * DEPTH + "'x'" + " )" * DEPTH + "\n")
+    node, depth = root.definitions.elements[0].productions.elements[0].expression, 0
+
+    while isinstance(node, Parenthetical):
+        node, depth = node.expression, depth + 1
+
+    assert not root.errors
+    assert (depth, node.token.literal) == (DEPTH, "'x'")
\ No newline at end of file
@@ -0,0 +1,63 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ TESTS :: Recovery from Syntax Errors ------------------------------
+# --------------------------------------------------------------------------------------------------
+from .... Parsing.Parser.Generator        import Generator
+from .... Optimization.Passes.Passthrough import Passthrough
+from .... Reduction.Reducer               import Reducer
+
+import pytest
+
+BROKEN = "a :=\n    | b 'x'\n" + "b := 'y' )\n" + "c :=\n    | 'z'\n"
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- TEST :: A Grammar with Errors is Refused, not Half-Built --------------------
+# --------------------------------------------------------------------------------------------------
+def test_refused(grammar, tokentype):
+
+    root = grammar(BROKEN)
+
+    assert [ e.token.line for e in root.errors ] == [ 3 ]
+
+    for build in (lambda: Generator(root, tokentype), lambda: Passthrough().run(root), lambda: Reducer().run(root)):
+
+        with pytest.raises(SyntaxError, match="has 1 error"):
+            build()
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: A Definition with no Productions is an Error, not Empty -----------------
+# --------------------------------------------------------------------------------------------------
+def test_no_productions(grammar):
+
+    root = grammar("a :=\n" + "b :=\n    | 'x'\n    | 'y'\n" + "c :=\n")
+
+    assert [ (e.token.line, e.message) for e in root.errors ] == [
+        (1, "expected a production starting with '|', found 'b'"),
+        (5, "expected a production starting with '|', found end of file"),
+    ]
+    assert [ len(d.productions.elements) for d in root.definitions.elements[1:-1] ] == [ 2 ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------ TEST :: Every Broken Definition is Reported, and Every Other One is Kept ------------
+# --------------------------------------------------------------------------------------------------
+def test_multiple_errors(grammar):
+
+    text = (
+        "a :=\n    | 'x\n"
+        "b :=\n    | 'y' )\n"
+        "c :=\n    | \"z\n"
+        "d :=\n    | 'w' ! e\n"
+        "e :=\n    | 'v' & 'u'\n"
+        "f :=\n    | 't'\n"
+    )
+    root = grammar(text)
+
+    assert [ (e.token.line, e.message) for e in root.errors ] == [
+        (2,  "unterminated string literal"),
+        (4,  "mismatched parenthetical: ')'"),
+        (6,  "unterminated string literal"),
+        (10, "erroneous character '&'"),
+    ]
+    assert [ d.signature.identifier.token.literal for d in root.definitions.elements if d not in root.errors ] == [ 'd', 'f' ]
\ No newline at end of file
@@ -0,0 +1,36 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- TESTS :: Streamed Grammar Definitions ------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Parser import Parser
+
+from ... Nodes.Definition import Definition
+from ... Nodes.Error      import Error
+
+COUNT = 1000
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------- TEST :: Each Definition Arrives before the Rest of the File is Read ---------------
+# --------------------------------------------------------------------------------------------------
+def test_streamed(tmp_path):
+
+    (path := tmp_path / 'grammar.pgram').write_text("".join(f"r :=\n    | 'x'\n" for _ in range(COUNT)))
+
+    parser = Parser(str(path))
+    definitions = parser.iter_definitions()
+
+    assert isinstance(next(definitions), Definition) and parser.lexer.line < 5
+    assert sum(1 for _ in definitions) == COUNT - 1
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------- TEST :: Errors Take their Definition's Place, in the Same Order as parse() -----------
+# --------------------------------------------------------------------------------------------------
+def test_ordered(grammar, tmp_path):
+
+    text = "a :=\n    | 'x'\n" + "b := |\n" + "c :=\n    | 'y'\n"
+    root = grammar(text)
+
+    streamed = [ type(d) for d in Parser(str(tmp_path / 'grammar.pgram')).iter_definitions() ]
+
+    assert streamed == [ type(d) for d in root.definitions.elements ] == [ Definition, Error, Definition ]
\ No newline at end of file
@@ -0,0 +1,354 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- PRE-PARSING :: Structural Fingerprinter -----------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .. Nodes.Alternation   import Alternation
+    from .. Nodes.Annotation    import Annotation
+    from .. Nodes.Assignment    import Assignment
+    from .. Nodes.Call          import Call
+    from .. Nodes.Concatenation import Concatenation
+    from .. Nodes.Cut           import Cut
+    from .. Nodes.Definition    import Definition
+    from .. Nodes.Error         import Error
+    from .. Nodes.Gather        import Gather
+    from .. Nodes.Identifier    import Identifier
+    from .. Nodes.Negative      import Negative
+    from .. Nodes.Node          import Node
+    from .. Nodes.Number        import Number
+    from .. Nodes.Optional      import Optional
+    from .. Nodes.Output        import Output
+    from .. Nodes.Parenthetical import Parenthetical
+    from .. Nodes.Plus          import Plus
+    from .. Nodes.Production    import Production
+    from .. Nodes.Pseudo        import Pseudo
+    from .. Nodes.Root          import Root
+    from .. Nodes.Sequence      import Sequence
+    from .. Nodes.Signature     import Signature
+    from .. Nodes.Star          import Star
+    from .. Nodes.String        import String
+
+from . Visitor import Visitor
+
+import hashlib
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Structural Fingerprinter --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Fingerprinter(Visitor[bytes]):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    names : set[str]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+        self.names = set()
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Fingerprinter({len(self.names)} names)"
+
+    def __str__(self)  -> str:
+        return f"Fingerprinter({len(self.names)} names)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Digest of a Node's Kind and its Parts, in Order ----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def digest(node: 'Node', *parts: 'bytes | str | None') -> bytes:
+
+        hasher = hashlib.sha256(node.__class__.__name__.encode())
+
+        for part in parts:    # child digests have a fixed length, so only literals need a length prefix
+
+            if part is None:
+                hasher.update(b'-')
+
+            elif isinstance(part, str):
+                hasher.update(f"{len(part)}:{part}".encode())
+
+            else:
+                hasher.update(part)
+
+        return hasher.digest()
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: 'Alternation') -> bytes:
+        return self.digest(node, *(child.accept(self) for child in node.expressions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Annotation -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_annotation(self, node: 'Annotation') -> bytes:
+        return self.digest(node, node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Assignment -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_assignment(self, node: 'Assignment') -> bytes:
+        return self.digest(node, node.identifier.accept(self), node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Call ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_call(self, node: 'Call') -> bytes:
+        return self.digest(node, node.identifier.accept(self), node.parameters.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_concatenation(self, node: 'Concatenation') -> bytes:
+        return self.digest(node, *(child.accept(self) for child in node.expressions))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------------- VISITOR :: Visit Cut ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_cut(self, node: 'Cut') -> bytes:
+        return self.digest(node, node.token.literal)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Definition -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_definition(self, node: 'Definition') -> bytes:
+        return self.digest(node, node.signature.accept(self), node.productions.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Error ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_error(self, node: 'Error') -> bytes:
+        return self.digest(node, node.message)
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Gather ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_gather(self, node: 'Gather') -> bytes:
+        return self.digest(node, node.expression.accept(self), node.separator.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Expression -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_generic(self, node: 'Node') -> bytes:
+        return self.digest(node)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_identifier(self, node: 'Identifier') -> bytes:
+
+        self.names.add(node.token.literal)
+        return self.digest(node, node.token.literal)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Negative --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_negative(self, node: 'Negative') -> bytes:
+        return self.digest(node, node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Number ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_number(self, node: 'Number') -> bytes:
+        return self.digest(node, node.token.literal)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_optional(self, node: 'Optional') -> bytes:
+        return self.digest(node, node.expression.accept(self), node.output and node.output.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Output ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_output(self, node: 'Output') -> bytes:
+        return self.digest(node, node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_parenthetical(self, node: 'Parenthetical') -> bytes:
+        return self.digest(node, node.expression.accept(self), node.output and node.output.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_plus(self, node: 'Plus') -> bytes:
+        return self.digest(node, node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_production(self, node: 'Production') -> bytes:
+        return self.digest(node, node.expression.accept(self), node.output and node.output.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Pseudo ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_pseudo(self, node: 'Pseudo') -> bytes:
+        return self.digest(node, node.name, *(child.accept(self) for child in node.elements))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Root ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_root(self, node: 'Root') -> bytes:
+        return self.digest(node, node.definitions.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Sequence --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_sequence(self, node: 'Sequence') -> bytes:
+        return self.digest(node, *(element.accept(self) for element in node.elements))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Signature -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_signature(self, node: 'Signature') -> bytes:
+        return self.digest(node, node.identifier.accept(self), node.annotation and node.annotation.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_star(self, node: 'Star') -> bytes:
+        return self.digest(node, node.expression.accept(self))
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit String ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_string(self, node: 'String') -> bytes:
+        return self.digest(node, node.token.literal)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----- STATIC :: Digest of each Body, and Stamp each Definition's Merkle Fingerprint ------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def fingerprint(root: 'Root') -> tuple[dict[str, str], dict[str, str]]:
+
+        local, graph, definitions = {}, {}, {}
+
+        for definition in root.definitions.elements:
+
+            if not hasattr(definition, 'signature'):    # an Error left where a definition failed
+                continue
+
+            fingerprinter = Fingerprinter()
+            name = definition.signature.identifier.token.literal
+
+            local[name], definitions[name] = definition.accept(fingerprinter), definition
+            graph[name] = fingerprinter.names
+
+        for name in graph:    # names that are not rules are tokens, bindings or constructors
+            graph[name] = sorted(graph[name] & local.keys() - { name })
+
+        fingerprints = {}
+
+        for component in Fingerprinter.components(graph):    # each after every component it references
+
+            hasher = hashlib.sha256()
+
+            for name in sorted(component):
+
+                hasher.update(local[name])
+
+                for reference in graph[name]:
+                    hasher.update(fingerprints.get(reference, '').encode())    # none within the cycle
+
+            shared = hasher.digest()
+
+            for name in component:
+                fingerprints[name] = hashlib.sha256(shared + local[name]).hexdigest()
+
+        for name, definition in definitions.items():
+            definition.fingerprint = fingerprints[name]
+
+        return { name: digest.hex() for name, digest in local.items() }, fingerprints
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- STATIC :: Strongly Connected Components, References First ----------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def components(graph: dict[str, list[str]]) -> list[list[str]]:
+
+        index, low, stack, stacked, components = {}, {}, [], set(), []
+
+        for start in graph:    # Tarjan's algorithm, on an explicit stack since rules can nest deeply
+
+            if start in index:
+                continue
+
+            index[start] = low[start] = len(index)
+            stack.append(start); stacked.add(start)
+            work = [ (start, iter(graph[start])) ]
+
+            while work:
+
+                name, successors = work[-1]
+
+                for successor in successors:
+
+                    if successor not in index:
+
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor); stacked.add(successor)
+                        work.append((successor, iter(graph[successor])))
+
+                        break
+
+                    if successor in stacked:
+                        low[name] = min(low[name], index[successor])
+
+                else:
+
+                    work.pop()
+
+                    if work:
+                        low[work[-1][0]] = min(low[work[-1][0]], low[name])
+
+                    if low[name] == index[name]:
+
+                        component = []
+
+                        while (member := stack.pop()) != name:
+                            stacked.discard(member); component.append(member)
+
+                        stacked.discard(name); component.append(name)
+                        components.append(component)
+
+        return components
\ No newline at end of file
@@ -0,0 +1,122 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PRE-PARSING :: Fused Tree-Walker Class -----------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+
+from . Walker import Entry
+from . Walker import Hook
+from . Walker import Walker
+
+Hooks = tuple[tuple[int, Walker, Hook | None], ...]
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Fused Tree-Walker Class --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Fused(Walker):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    walkers  : tuple[Walker, ...]
+    hooks    : dict[type, tuple[Hooks, Hooks]]
+    muted    : list[Any]    # per walker, the node whose subtree it declined, until that node is left
+    silenced : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, *walkers: Walker) -> None:
+
+        super().__init__()
+
+        self.walkers  = walkers
+        self.hooks    = {}
+        self.muted    = [ None ] * len(walkers)
+        self.silenced = 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Fused({', '.join(repr(walker) for walker in self.walkers)})"
+
+    def __str__(self)  -> str:
+        return f"Fused({', '.join(str(walker) for walker in self.walkers)})"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------- HELPER :: Hooks of Every Walker for a Node Class, Cached Too --------------
+    # ------------------------------------------------------------------------------------------
+    def entry(self, cls: type) -> Entry:
+
+        enters, leaves = [], []
+
+        for index, walker in enumerate(self.walkers):
+
+            enter, leave, _ = walker.table.get(cls) or walker.entry(cls)
+
+            enters.append((index, walker, enter))
+
+            if leave is not Walker.nothing:
+                leaves.append((index, walker, leave))
+
+        self.hooks[cls] = (tuple(enters), tuple(leaves))
+
+        return super().entry(cls)    # routed to the generic hooks below, with the fields to descend
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- HOOK :: Enter a Node for Every Walker --------------------------
+    # ------------------------------------------------------------------------------------------
+    def enter_generic(self, node: Any) -> bool:
+
+        muted, depth, declined, descend = self.muted, self.depth, [], False
+
+        for index, walker, enter in self.hooks[node.__class__][0]:
+
+            if muted[index] is not None:
+                continue
+
+            if enter is not None:
+
+                walker.depth = depth    # as if it walked alone
+
+                if enter(node) is False:
+                    declined.append(index)
+                    continue
+
+            descend = True
+
+        if not descend:    # no walker wants what is below, so it is not walked at all
+            return False
+
+        if declined:
+
+            self.silenced += len(declined)
+
+            for index in declined:
+                muted[index] = node
+
+        return True
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------- HOOK :: Leave a Node for Every Walker --------------------------
+    # ------------------------------------------------------------------------------------------
+    def leave_generic(self, node: Any) -> None:
+
+        muted, depth = self.muted, self.depth
+
+        for index, walker, leave in self.hooks[node.__class__][1]:
+            if muted[index] is None:
+                walker.depth = depth
+                leave(node)
+
+        if self.silenced:    # those that declined this node resume after it
+            for index, declined in enumerate(muted):
+                if declined is node:
+                    muted[index]   = None
+                    self.silenced -= 1
\ No newline at end of file
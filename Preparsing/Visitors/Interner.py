@@ -0,0 +1,62 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- PRE-PARSING :: Structural-Key Interner -----------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .. Nodes.Node import Node
+
+from . Fingerprinter import Fingerprinter
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------------- CLASS :: Structural-Key Interner --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Interner(Fingerprinter):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    keys : dict[int, tuple['Node', bytes]]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+
+        super().__init__()
+
+        self.keys = {}
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Interner({len(self.keys)} nodes)"
+
+    def __str__(self)  -> str:
+        return f"Interner({len(self.keys)} nodes)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- HELPER :: Digest of a Node, Kept as its Structural Key -----------------
+    # ------------------------------------------------------------------------------------------
+    def digest(self, node: 'Node', *parts: 'bytes | str | None') -> bytes:
+
+        digest = Fingerprinter.digest(node, *parts)
+        self.keys[id(node)] = (node, digest)    # holding the node keeps its id from being reused
+
+        return digest
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------- INTERNING :: Structural Key of a Node, Cached ----------------------
+    # ------------------------------------------------------------------------------------------
+    def key(self, node: 'Node') -> bytes:
+
+        if (entry := self.keys.get(id(node))) is not None:
+            return entry[1]
+
+        return node.accept(self)    # keys every node below it on the way, so nested lookups are free
\ No newline at end of file
@@ -1,52 +1,47 @@
 # --------------------------------------------------------------------------------------------------
-# -------------------------- PRE-PARSING :: Pretty-Printer Visitor Class ---------------------------
+# --------------------- PRE-PARSING :: Pretty-Printer Walker and Visitor Class ---------------------
 # --------------------------------------------------------------------------------------------------
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .. Nodes.Alternation   import Alternation
-    from .. Nodes.Annotation    import Annotation
-    from .. Nodes.Assignment    import Assignment
-    from .. Nodes.Call          import Call
-    from .. Nodes.Concatenation import Concatenation
-    from .. Nodes.Definition    import Definition
-    from .. Nodes.Error         import Error
-    from .. Nodes.Expression    import Expression
-    from .. Nodes.Identifier    import Identifier
-    from .. Nodes.Literal       import Literal
-    from .. Nodes.Node          import Node
-    from .. Nodes.Number        import Number
-    from .. Nodes.Optional      import Optional
-    from .. Nodes.Output        import Output
-    from .. Nodes.Parenthetical import Parenthetical
-    from .. Nodes.Plus          import Plus
-    from .. Nodes.Production    import Production
-    from .. Nodes.Pseudo        import Pseudo
-    from .. Nodes.Root          import Root
-    from .. Nodes.Sequence      import Sequence
-    from .. Nodes.Signature     import Signature
-    from .. Nodes.Star          import Star
-    from .. Nodes.String        import String
+    from .. Nodes.Cut        import Cut
+    from .. Nodes.Error      import Error
+    from .. Nodes.Identifier import Identifier
+    from .. Nodes.Node       import Node
+    from .. Nodes.Number     import Number
+    from .. Nodes.Sequence   import Sequence
+    from .. Nodes.String     import String
 
 from . Visitor import Visitor
+from . Walker  import Walker
+
+import io
+import sys
 
 
 # --------------------------------------------------------------------------------------------------
-# ----------------------------- CLASS :: Pretty-Printer Visitor Class ------------------------------
+# ------------------------ CLASS :: Pretty-Printer Walker and Visitor Class ------------------------
 # --------------------------------------------------------------------------------------------------
-class Printer(Visitor[str]):
+class Printer(Walker, Visitor[str]):
 
     # ------------------------------------------------------------------------------------------
     # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
     # ------------------------------------------------------------------------------------------
+    stream      : io.TextIOBase
     indentation : int
+    margins     : list[str]
 
 
     # ------------------------------------------------------------------------------------------
     # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
     # ------------------------------------------------------------------------------------------
-    def __init__(self, indentation: int = 0) -> None:
+    def __init__(self, indentation: int = 0, stream: io.TextIOBase | None = None) -> None:
+
+        super().__init__()
+
+        self.stream      = sys.stdout if stream is None else stream
         self.indentation = indentation
+        self.margins     = []
 
 
     # ------------------------------------------------------------------------------------------
@@ -60,273 +55,108 @@ class Printer(Visitor[str]):
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------------ HELPER :: Get Head and Tail -------------------------------
-    # ------------------------------------------------------------------------------------------
-    def affixes(self, node: 'Node') -> tuple[str, str]:
-
-        head = f"{'    ' * self.indentation}{node.__class__.__name__}("
-        tail = f"{'    ' * self.indentation})"
-
-        return head, tail
-
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_alternation(self, node: 'Alternation') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-        body = '\n'.join(child.accept(subprinter) for child in node.expressions)
-
-        head, tail = self.affixes(node)
-
-        return f"{head}\n{body}\n{tail}"
-
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Annotation -------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_annotation(self, node: 'Annotation') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        body = node.expression.accept(subprinter)
-
-        return f"{head}\n{body}\n{tail}"
-
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Assignment -------------------------------
+    # ---------------------- HELPER :: Write a Line at the Current Depth -----------------------
     # ------------------------------------------------------------------------------------------
-    def visit_assignment(self, node: 'Assignment') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        identifier = node.identifier.accept(subprinter)
-        expression = node.expression.accept(subprinter)
-
-        return f"{head}\n{identifier}\n{expression}\n{tail}"
-
-
-    # ------------------------------------------------------------------------------------------
-    # --------------------------------- VISITOR :: Visit Call ----------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_call(self, node: 'Call') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        identifier = node.identifier.accept(subprinter)
-        parameters = node.parameters.accept(subprinter)
-
-        return f"{head}\n{identifier}\n{parameters}\n{tail}"
-
-
-    # ------------------------------------------------------------------------------------------
-    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_concatenation(self, node: 'Concatenation') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-        body = '\n'.join(child.accept(subprinter) for child in node.expressions)
-
-        head, tail = self.affixes(node)
-
-        return f"{head}\n{body}\n{tail}"
-
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Definition -------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_definition(self, node: 'Definition') -> str:
-
-        head, tail  = self.affixes(node)
+    def line(self, text: str) -> None:
 
-        subprinter  = Printer(self.indentation + 1)
-        signature   = node.signature.accept(subprinter)
-        productions = node.productions.accept(subprinter)
+        if (depth := self.indentation + self.depth) >= len(margins := self.margins):
+            margins += [ '    ' * width for width in range(len(margins), depth + 1) ]
 
-        return f"{head}\n{signature}\n{productions}\n{tail}"
+        self.stream.write(f"{margins[depth]}{text}\n")
 
 
     # ------------------------------------------------------------------------------------------
-    # --------------------------------- VISITOR :: Visit Error ---------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_error(self, node: 'Error') -> str:
-        ...
-
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Expression -------------------------------
+    # ------------------------ VISITOR :: Pretty-Print any Node Visited ------------------------
     # ------------------------------------------------------------------------------------------
     def visit_generic(self, node: 'Node') -> str:
-        ...
-    
-
-    # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Identifier -------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_identifier(self, node: 'Identifier') -> str:
-        return f"{'    ' * self.indentation}Identifier('{node.token.literal}')"
-
-
-    # ------------------------------------------------------------------------------------------
-    # -------------------------------- VISITOR :: Visit Number ---------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_number(self, node: 'Number') -> str:
-        return f"{'    ' * self.indentation}Number('{node.token.literal}')"
+        return Printer.format(node, self.indentation)    # so node.accept(Printer()) reads as it always did
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------------- VISITOR :: Visit Optional --------------------------------
+    # ------------------------------ HOOK :: Open any Inner Node -------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_optional(self, node: 'Optional') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        expression = node.expression.accept(subprinter)
-
-        if node.output and (output := node.output.accept(subprinter)):
-            return f"{head}\n{expression}\n{output}\n{tail}"
-
-        return f"{head}\n{expression}\n{tail}"
+    def enter_generic(self, node: 'Node') -> None:
+        self.line(f"{node.__class__.__name__}(")
 
 
     # ------------------------------------------------------------------------------------------
-    # -------------------------------- VISITOR :: Visit Output ---------------------------------
+    # ------------------------------ HOOK :: Close any Inner Node ------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_output(self, node: 'Output') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        body = node.expression.accept(subprinter)
-
-        return f"{head}\n{body}\n{tail}"
+    def leave_generic(self, node: 'Node') -> None:
+        self.line(")")
 
 
     # ------------------------------------------------------------------------------------------
-    # ----------------------------- VISITOR :: Visit Parenthetical -----------------------------
+    # ----------------------------------- HOOK :: Enter Cut ------------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_parenthetical(self, node: 'Parenthetical') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        expression = node.expression.accept(subprinter)
+    def enter_cut(self, node: 'Cut') -> bool:
 
-        if node.output and (output := node.output.accept(subprinter)):
-            return f"{head}\n{expression}\n{output}\n{tail}"
-
-        return f"{head}\n{expression}\n{tail}"
+        self.line(f"Cut('{node.token.literal}')")
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # --------------------------------- VISITOR :: Visit Plus ----------------------------------
+    # ---------------------------------- HOOK :: Enter Error -----------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_plus(self, node: 'Plus') -> str:
-
-        subprinter = Printer(self.indentation + 1)
+    def enter_error(self, node: 'Error') -> bool:
 
-        head, tail = self.affixes(node)
-        body = node.expression.accept(subprinter)
-
-        return f"{head}\n{body}\n{tail}"
+        self.line(repr(node))
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------------ VISITOR :: Visit Production -------------------------------
+    # -------------------------------- HOOK :: Enter Identifier --------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_production(self, node: 'Production') -> str:
-
-        subprinter  = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        expression = node.expression.accept(subprinter)
+    def enter_identifier(self, node: 'Identifier') -> bool:
 
-        if node.output and (output := node.output.accept(subprinter)):
-            return f"{head}\n{expression}\n{output}\n{tail}"
-
-        return f"{head}\n{expression}\n{tail}"
+        self.line(f"Identifier('{node.token.literal}')")
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # -------------------------------- VISITOR :: Visit Pseudo ---------------------------------
+    # ---------------------------------- HOOK :: Enter Number ----------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_pseudo(self, node: 'Pseudo') -> str:
-        ...
+    def enter_number(self, node: 'Number') -> bool:
 
-
-    # ------------------------------------------------------------------------------------------
-    # --------------------------------- VISITOR :: Visit Root ----------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_root(self, node: 'Root') -> str:
-
-        subprinter  = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        body = node.definitions.accept(subprinter)
-
-        return f"{head}\n{body}\n{tail}"
+        self.line(f"Number('{node.token.literal}')")
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------------- VISITOR :: Visit Sequence --------------------------------
+    # --------------------------------- HOOK :: Enter Sequence ---------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_sequence(self, node: 'Sequence') -> str:
+    def enter_sequence(self, node: 'Sequence') -> bool:
 
         if node.elements:
+            self.line("Sequence(")
+            return True
 
-            subprinter = Printer(self.indentation + 1)
-            body = '\n'.join(element.accept(subprinter) for element in node.elements)
-
-            head, tail = self.affixes(node)
-
-            return f"{head}\n{body}\n{tail}"
-
-        return f"{'    ' * self.indentation}Sequence()"
+        self.line("Sequence()")
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # ------------------------------- VISITOR :: Visit Sequence --------------------------------
+    # ---------------------------------- HOOK :: Enter String ----------------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_signature(self, node: 'Signature') -> str:
-
-        subprinter  = Printer(self.indentation + 1)
+    def enter_string(self, node: 'String') -> bool:
 
-        head, tail = self.affixes(node)
-        identifier = node.identifier.accept(subprinter)
-        annotation = node.annotation.accept(subprinter)
-
-        return f"{head}\n{identifier}\n{annotation}\n{tail}"
+        self.line(f"String('{node.token.literal}')")
+        return False
 
 
     # ------------------------------------------------------------------------------------------
-    # --------------------------------- VISITOR :: Visit Star ----------------------------------
+    # -------------------------- STATIC :: Pretty-Print into a String --------------------------
     # ------------------------------------------------------------------------------------------
-    def visit_star(self, node: 'Star') -> str:
-
-        subprinter = Printer(self.indentation + 1)
-
-        head, tail = self.affixes(node)
-        body = node.expression.accept(subprinter)
-
-        return f"{head}\n{body}\n{tail}"
-
+    @staticmethod
+    def format(root: 'Node', indentation: int = 0) -> str:
 
-    # ------------------------------------------------------------------------------------------
-    # -------------------------------- VISITOR :: Visit String ---------------------------------
-    # ------------------------------------------------------------------------------------------
-    def visit_string(self, node: 'String') -> str:
-        return f"{'    ' * self.indentation}String('{node.token.literal}')"
+        Printer(indentation, stream := io.StringIO()).walk(root)
+        return stream.getvalue()[:-1]
 
 
     # ------------------------------------------------------------------------------------------
     # ----------------------------- STATIC :: Pretty-Print an AST ------------------------------
     # ------------------------------------------------------------------------------------------
     @staticmethod
-    def print(root: 'Node') -> str:
-        print(root.accept(Printer(indentation=0)))
\ No newline at end of file
+    def print(root: 'Node') -> None:
+        Printer().walk(root)
\ No newline at end of file
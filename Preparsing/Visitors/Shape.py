@@ -0,0 +1,80 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ PRE-PARSING :: Grammar-Shape Helpers ------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Nodes.Alternation   import Alternation
+from .. Nodes.Concatenation import Concatenation
+from .. Nodes.Definition    import Definition
+from .. Nodes.Expression    import Expression
+from .. Nodes.Identifier    import Identifier
+from .. Nodes.Number        import Number
+from .. Nodes.Output        import Output
+from .. Nodes.Production    import Production
+from .. Nodes.Sequence      import Sequence
+from .. Nodes.String        import String
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Grammar-Shape Helpers ---------------------------------
+# --------------------------------------------------------------------------------------------------
+class Shape(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    rules : dict[str, Definition]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- HELPER :: Name of a Definition -----------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def name(definition: Definition) -> str:
+        return definition.signature.identifier.token.literal
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Whether an Expression Matches Exactly One Token ----------------
+    # ------------------------------------------------------------------------------------------
+    def terminal(self, node: Expression) -> bool:
+
+        if isinstance(node, Identifier):
+            return node.token.literal not in self.rules
+
+        if isinstance(node, (String, Number)):
+            return True
+
+        if isinstance(node, Alternation):
+            return all(self.terminal(e) for e in node.expressions)
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------- HELPER :: Flatten Productions into (Expression, Output) Alternatives ----------
+    # ------------------------------------------------------------------------------------------
+    def alternatives(self,
+        expression: Expression, output: Output | None = None
+    ) -> list[tuple[Expression, Output | None]]:
+
+        if isinstance(expression, Sequence):
+            return [ a for p in expression.elements for a in self.alternatives(p) ]
+
+        if isinstance(expression, Production):
+            return self.alternatives(expression.expression, expression.output)
+
+        if isinstance(expression, Alternation) and not self.terminal(expression):
+            return [ a for e in expression.expressions for a in self.alternatives(e, output) ]
+
+        return [ (expression, output) ]
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- HELPER :: Items of an Alternative ----------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def items(expression: Expression) -> list[Expression]:
+
+        if isinstance(expression, Concatenation):
+            return list(expression.expressions)
+
+        return [ expression ]
\ No newline at end of file
@@ -0,0 +1,37 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------ TESTS :: Structural Fingerprints of Definitions -------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Fingerprinter import Fingerprinter
+
+GRAMMAR = (
+    "sum :=\n    | a=term '+' b=sum { Add(a, b) }\n    | term\n"
+    "term :=\n    | a=NUMBER { Num(a) }\n    | '(' a=sum ')' { a }\n"
+    "top :=\n    | a=sum { a }\n"
+    "word :=\n    | IDENTIFIER\n"
+)
+
+
+# --------------------------------------------------------------------------------------------------
+# ---- TEST :: An Edit Changes its Rule's Digest, and the Fingerprint of Every Rule Reaching it ----
+# --------------------------------------------------------------------------------------------------
+def test_propagated(grammar):
+
+    local, merkle = Fingerprinter.fingerprint(grammar(GRAMMAR))
+    edited, fingerprints = Fingerprinter.fingerprint(grammar(GRAMMAR.replace("'('", "'['")))
+
+    assert [ n for n in local if local[n] != edited[n] ] == [ 'term' ]
+    assert sorted(n for n in merkle if merkle[n] != fingerprints[n]) == [ 'sum', 'term', 'top' ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ------- TEST :: Layout Leaves the Fingerprints Alone, and each Definition Carries its Own --------
+# --------------------------------------------------------------------------------------------------
+def test_structural(grammar):
+
+    root = grammar(GRAMMAR)
+    same = grammar(GRAMMAR.replace("    | term\n", "    |   term\n"))
+
+    local, merkle = Fingerprinter.fingerprint(root)
+
+    assert Fingerprinter.fingerprint(same) == (local, merkle)
+    assert { d.signature.identifier.token.literal: d.fingerprint for d in root.definitions.elements } == merkle
\ No newline at end of file
@@ -0,0 +1,69 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------- TESTS :: Fused Walkers -------------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Fused   import Fused
+from .. Printer import Printer
+from .. Walker  import Walker
+
+from ... Parser.Parser import Parser
+from ... Nodes.Node    import Node
+
+import io
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- CLASS :: Walker Recording Depths, Declining Productions ---------------------
+# --------------------------------------------------------------------------------------------------
+class Recorder(Walker):
+
+    visits : list[tuple[int, str]]
+
+    def __init__(self) -> None:
+
+        super().__init__()
+        self.visits = []
+
+    def enter_generic(self, node: Node) -> None:
+        self.visits.append((self.depth, node.__class__.__name__))
+
+    def leave_generic(self, node: Node) -> None:
+        self.visits.append((self.depth, '/'))
+
+    def enter_production(self, node: Node) -> bool:
+
+        self.visits.append((self.depth, 'Production'))
+        return False
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------- TEST :: Each Fused Walker Sees what it Would Walking Alone -------------------
+# --------------------------------------------------------------------------------------------------
+def test_separate(shipped):
+
+    for origin in shipped:
+
+        root = Parser(origin).parse()
+
+        Printer(0, alone := io.StringIO()).walk(root)
+        (recorder := Recorder()).walk(root)
+
+        printer, fused = Printer(0, io.StringIO()), Recorder()
+        Fused(printer, fused).walk(root)
+
+        assert printer.stream.getvalue() == alone.getvalue()
+        assert fused.visits == recorder.visits
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ TEST :: A Subtree Every Walker Declines is not Walked at all ------------------
+# --------------------------------------------------------------------------------------------------
+def test_declined(grammar):
+
+    root = grammar("a :=\n    | 'x' 'y'\n    | 'z'\n")
+
+    first, second = Recorder(), Recorder()
+    (fused := Fused(first, second)).walk(root)
+
+    assert first.visits == second.visits
+    assert [ v for v in first.visits if v[1] == 'Production' ] == [ (4, 'Production') ] * 2
+    assert not any(cls.__name__ == 'String' for cls in fused.hooks)
\ No newline at end of file
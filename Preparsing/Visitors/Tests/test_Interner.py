@@ -0,0 +1,41 @@
+# --------------------------------------------------------------------------------------------------
+# ----------------------------- TESTS :: Hash-Consing Structural Keys ------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Interner import Interner
+
+GRAMMAR = (
+    "s :=\n"
+    "    | a=NUMBER b=('+' c=NUMBER { c })* { a }\n"
+    "    | a=IDENTIFIER b=('+' c=NUMBER { c })* { a }\n"
+    "    | a=STRING b=('-' c=NUMBER { c })* { a }\n"
+)
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ TEST :: Equal Subexpressions Share a Key Wherever they Occur ------------------
+# --------------------------------------------------------------------------------------------------
+def test_shared(grammar):
+
+    productions = grammar(GRAMMAR).definitions.elements[0].productions.elements
+    loops = [ p.expression.expressions[1] for p in productions ]
+
+    interner = Interner()
+    first, second, third = (interner.key(loop) for loop in loops)
+
+    assert first == second != third
+    assert interner.key(productions[0].expression) != interner.key(productions[1].expression)
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------- TEST :: Keying a Node Keys Everything below it, Once ----------------------
+# --------------------------------------------------------------------------------------------------
+def test_cached(grammar):
+
+    loop = grammar(GRAMMAR).definitions.elements[0].productions.elements[0].expression.expressions[1]
+
+    interner = Interner()
+    key = interner.key(loop)
+    keyed = len(interner.keys)
+
+    assert interner.key(loop.expression) and interner.key(loop) == key
+    assert len(interner.keys) == keyed > 1
\ No newline at end of file
@@ -0,0 +1,93 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- TESTS :: Pretty-Printer Class ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Printer import Printer
+from .. Walker  import Walker
+
+from ... Parser.Parser  import Parser
+from ... Nodes.Node     import Node
+from ... Nodes.String   import String
+
+import io
+
+GRAMMAR = "s :=\n    | a=NUMBER ~ b=[IDENTIFIER] { Pair(a, b) }\n    | 'x'\n"
+
+DEPTH = 5000
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ CLASS :: Walker Recording its Visits, Handling Strings Whole ------------------
+# --------------------------------------------------------------------------------------------------
+class Recorder(Walker):
+
+    visits : list[tuple[str, str]]
+
+    def __init__(self) -> None:
+
+        super().__init__()
+        self.visits = []
+
+    def enter_generic(self, node: Node) -> None:
+        self.visits.append(('enter', node.__class__.__name__))
+
+    def leave_generic(self, node: Node) -> None:
+        self.visits.append(('leave', node.__class__.__name__))
+
+    def enter_string(self, node: String) -> bool:
+
+        self.visits.append(('whole', node.token.literal))
+        return False
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------- FUNCTION :: Visits the Walker Makes, Found by Recursion ---------------------
+# --------------------------------------------------------------------------------------------------
+def visits(node: Node) -> list[tuple[str, str]]:
+
+    if isinstance(node, String):
+        return [ ('whole', node.token.literal) ]
+
+    inner = [ visit for child in node.children() for visit in visits(child) ]
+    return [ ('enter', node.__class__.__name__), *inner, ('leave', node.__class__.__name__) ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------- TEST :: Accepting a Printer Formats the Node, as it Always Did -----------------
+# --------------------------------------------------------------------------------------------------
+def test_accept(grammar):
+
+    root = grammar(GRAMMAR)
+    definition = root.definitions.elements[0]
+
+    assert root.accept(Printer()) == Printer.format(root)
+    assert definition.accept(Printer(1)) == Printer.format(definition, 1)
+
+    assert Printer.format(definition, 1).split('\n')[0] == "    Definition("
+    assert Printer.format(definition).split('\n')[-1] == ")"
+
+    Printer(2, stream := io.StringIO()).walk(definition)
+    assert stream.getvalue() == Printer.format(definition, 2) + '\n'
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------- TEST :: The Walker Enters and Leaves in the Order Recursion Would ----------------
+# --------------------------------------------------------------------------------------------------
+def test_walked(shipped):
+
+    for origin in shipped:
+
+        root = Parser(origin).parse()
+        (recorder := Recorder()).walk(root)
+
+        assert recorder.visits == visits(root) and recorder.depth == 0
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- TEST :: Nesting too Deep to Recurse Prints, Indented all the Way ----------------
+# --------------------------------------------------------------------------------------------------
+def test_nested(grammar):
+
+    lines = Printer.format(grammar("a :=\n    | " + "( " * DEPTH + "'x'" + " )" * DEPTH + "\n")).split('\n')
+
+    assert len(lines) == 2 * DEPTH + 14
+    assert lines[DEPTH + 8] == '    ' * (DEPTH + 5) + "String(''x'')"
\ No newline at end of file
@@ -0,0 +1,59 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- TESTS :: Copy-on-Write Tree Transformer -----------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Fingerprinter import Fingerprinter
+from .. Printer       import Printer
+from .. Transformer   import Transformer
+
+from ... Nodes.Identifier import Identifier
+from ... Nodes.String     import String
+
+GRAMMAR = "a :=\n    | 'x' b\n    | 'y'\n" + "b :=\n    | 'z'\n" + "c :=\n    | b 'x'\n"
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ CLASS :: Transformer Replacing One String with an Identifier ------------------
+# --------------------------------------------------------------------------------------------------
+class Replacer(Transformer):
+
+    literal : str
+
+    def __init__(self, literal: str) -> None:
+
+        super().__init__()
+        self.literal = literal
+
+    def visit_string(self, node: String) -> Identifier | String:
+        return Identifier(node.token) if node.token.literal == self.literal else node
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------- TEST :: Only the Path to a Change is Copied, and the Rest is Shared ---------------
+# --------------------------------------------------------------------------------------------------
+def test_copied(grammar):
+
+    root = grammar(GRAMMAR)
+    printed = Printer.format(root)
+
+    Fingerprinter.fingerprint(root)
+    a, b, c = root.definitions.elements
+
+    result = root.accept(Replacer("'y'"))
+    first, second, third = result.definitions.elements
+
+    assert result is not root and Printer.format(root) == printed
+    assert second is b and third is c
+    assert first.productions.elements[0] is a.productions.elements[0]
+    assert isinstance(first.productions.elements[1].expression, Identifier)
+    assert first.fingerprint is None and a.fingerprint is not None
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------- TEST :: A Transformation Changing Nothing Returns the Tree Itself ----------------
+# --------------------------------------------------------------------------------------------------
+def test_unchanged(grammar):
+
+    root = grammar(GRAMMAR)
+
+    assert root.accept(Replacer("'w'")) is root
+    assert root.accept(Transformer()) is root
\ No newline at end of file
@@ -0,0 +1,87 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------- PRE-PARSING :: Copy-on-Write Tree-Transformer Class -----------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+
+from . Visitor import Visitor
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------- CLASS :: Copy-on-Write Tree-Transformer Class --------------------------
+# --------------------------------------------------------------------------------------------------
+class Transformer(Visitor[Any]):
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}()"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- HELPER :: Transform a Field's Value, Sharing ----------------------
+    # ------------------------------------------------------------------------------------------
+    def transform(self, value: Any) -> Any:
+
+        if value.__class__ is tuple or value.__class__ is list:
+
+            replaced = None
+
+            for index, element in enumerate(value):
+
+                if hasattr(element.__class__, 'accept') and (replacement := element.accept(self)) is not element:
+
+                    if replaced is None:    # copied only once something in it differs
+                        replaced = list(value)
+
+                    replaced[index] = replacement
+
+            return value if replaced is None else value.__class__(replaced)
+
+        if hasattr(value.__class__, 'accept'):    # not tokens, nor a lazy body, which it would force
+            return value.accept(self)
+
+        return value
+
+
+    # ------------------------------------------------------------------------------------------
+    # ---------------------- HELPER :: Copy of a Node with Fields Changed ----------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def update(node: Any, changes: dict[str, Any]) -> Any:
+
+        cls    = node.__class__
+        clone  = cls.__new__(cls)
+        fields = getattr(cls, '_fields', None) or getattr(cls, '__match_args__', ())    # grammar or generated
+
+        for slot in cls.__slots__:
+
+            if slot in changes:
+                setattr(clone, slot, changes[slot])
+
+            else:    # any slot not a field is derived, like a definition's fingerprint, and now stale
+                setattr(clone, slot, getattr(node, slot) if slot in fields else None)
+
+        return clone
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Generic --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_generic(self, node: Any) -> Any:
+
+        cls, changes = node.__class__, None
+
+        for field in getattr(cls, '_fields', None) or getattr(cls, '__match_args__', ()):
+
+            if (replacement := self.transform(value := getattr(node, field))) is not value:
+
+                if changes is None:
+                    changes = {}
+
+                changes[field] = replacement
+
+        return node if changes is None else self.update(node, changes)    # untouched, so shared whole
\ No newline at end of file
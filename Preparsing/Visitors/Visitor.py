@@ -11,11 +11,14 @@ if TYPE_CHECKING:
     from .. Nodes.Assignment    import Assignment
     from .. Nodes.Call          import Call
     from .. Nodes.Concatenation import Concatenation
+    from .. Nodes.Cut           import Cut
     from .. Nodes.Definition    import Definition
     from .. Nodes.Error         import Error
     from .. Nodes.Expression    import Expression
+    from .. Nodes.Gather        import Gather
     from .. Nodes.Identifier    import Identifier
     from .. Nodes.Literal       import Literal
+    from .. Nodes.Negative      import Negative
     from .. Nodes.Node          import Node
     from .. Nodes.Number        import Number
     from .. Nodes.Optional      import Optional
@@ -95,6 +98,13 @@ class Visitor(Generic[R]):
         return self.visit_generic(node)
 
 
+    # ------------------------------------------------------------------------------------------
+    # ---------------------------------- VISITOR :: Visit Cut ----------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_cut(self, node: 'Cut') -> R:
+        return self.visit_generic(node)
+
+
     # ------------------------------------------------------------------------------------------
     # ------------------------------ VISITOR :: Visit Definition -------------------------------
     # ------------------------------------------------------------------------------------------
@@ -116,6 +126,13 @@ class Visitor(Generic[R]):
         return self.visit_generic(node)
 
 
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- VISITOR :: Visit Gather ---------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_gather(self, node: 'Gather') -> R:
+        return self.visit_generic(node)
+
+
     # ------------------------------------------------------------------------------------------
     # ------------------------------ VISITOR :: Visit Expression -------------------------------
     # ------------------------------------------------------------------------------------------
@@ -137,6 +154,13 @@ class Visitor(Generic[R]):
         return self.visit_generic(node)
 
 
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- VISITOR :: Visit Negative --------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_negative(self, node: 'Negative') -> R:
+        return self.visit_generic(node)
+
+
     # ------------------------------------------------------------------------------------------
     # -------------------------------- VISITOR :: Visit Number ---------------------------------
     # ------------------------------------------------------------------------------------------
@@ -0,0 +1,125 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------- PRE-PARSING :: Iterative Tree-Walker Class ---------------------------
+# --------------------------------------------------------------------------------------------------
+from typing import Any
+from typing import Callable
+
+import re
+
+Hook  = Callable[[Any], bool | None]
+Entry = tuple[Hook | None, Hook, tuple[str, ...]]
+
+SKIP, NODE, MANY = 0, 1, 2    # how a field's value is descended into, by its class
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ CLASS :: Iterative Tree-Walker Class ------------------------------
+# --------------------------------------------------------------------------------------------------
+class Walker(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    table  : dict[type, Entry]
+    shapes : dict[type, int]
+    depth  : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self) -> None:
+
+        self.table  = {}
+        self.shapes = {}
+        self.depth  = 0
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.table)} kinds)"
+
+    def __str__(self)  -> str:
+        return f"{self.__class__.__name__}({len(self.table)} kinds)"
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ HELPER :: Hook Doing Nothing ------------------------------
+    # ------------------------------------------------------------------------------------------
+    @staticmethod
+    def nothing(node: Any) -> None:
+        pass
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------- HELPER :: Hooks and Fields of a Node Class, Cached -------------------
+    # ------------------------------------------------------------------------------------------
+    def entry(self, cls: type) -> Entry:
+
+        kind   = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '_', cls.__name__).lower()    # as the visitors name it
+        fields = getattr(cls, '_fields', None) or getattr(cls, '__match_args__', ())    # grammar or generated
+
+        self.table[cls] = entry = (
+            getattr(self, f"enter_{kind}", None) or getattr(self, 'enter_generic', None),
+            getattr(self, f"leave_{kind}", None) or getattr(self, 'leave_generic', Walker.nothing),
+            tuple(reversed(fields)),    # pushed last to first, so they pop in order
+        )
+
+        return entry
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: How the Values of a Class are Descended, Cached ----------------
+    # ------------------------------------------------------------------------------------------
+    def shape(self, cls: type) -> int:
+
+        if cls is tuple or cls is list:
+            shape = MANY
+
+        else:    # not tokens, nor a lazy body, which it would force
+            shape = NODE if hasattr(cls, 'accept') else SKIP
+
+        self.shapes[cls] = shape
+        return shape
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------- TRAVERSAL :: Walk a Tree, Calling the Hooks in Pre- and Post-Order -----------
+    # ------------------------------------------------------------------------------------------
+    def walk(self, root: Any) -> None:
+
+        table, shapes, stack = self.table, self.shapes, [ root ]
+        push,  pop           = stack.append, stack.pop
+
+        while stack:
+
+            if (node := pop()).__class__ is tuple:    # the second visit, once everything below it is done
+
+                self.depth -= 1
+                node[0](node[1])
+
+                continue
+
+            enter, leave, fields = table.get(node.__class__) or self.entry(node.__class__)
+
+            if enter is not None and enter(node) is False:    # handled whole, so neither descended nor left
+                continue
+
+            self.depth += 1
+            push((leave, node))
+
+            for field in fields:
+
+                if (shape := shapes.get((value := getattr(node, field)).__class__)) is None:
+                    shape = self.shape(value.__class__)
+
+                if shape == NODE:
+                    push(value)
+
+                elif shape == MANY:
+
+                    for element in reversed(value):
+                        if (shapes.get(element.__class__) or self.shape(element.__class__)) == NODE:
+                            push(element)
\ No newline at end of file
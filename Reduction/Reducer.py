@@ -0,0 +1,241 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------- REDUCTION :: Grammar Reducer ----------------------------------
+# --------------------------------------------------------------------------------------------------
+from .. Optimization.Passes.Pass      import Pass
+from .. Parsing.Parser.Generator      import Generator
+
+from .. Preparsing.Nodes.Alternation   import Alternation
+from .. Preparsing.Nodes.Assignment    import Assignment
+from .. Preparsing.Nodes.Concatenation import Concatenation
+from .. Preparsing.Nodes.Definition    import Definition
+from .. Preparsing.Nodes.Expression    import Expression
+from .. Preparsing.Nodes.Gather        import Gather
+from .. Preparsing.Nodes.Identifier    import Identifier
+from .. Preparsing.Nodes.Negative      import Negative
+from .. Preparsing.Nodes.Node          import Node
+from .. Preparsing.Nodes.Optional      import Optional
+from .. Preparsing.Nodes.Parenthetical import Parenthetical
+from .. Preparsing.Nodes.Plus          import Plus
+from .. Preparsing.Nodes.Production    import Production
+from .. Preparsing.Nodes.Root          import Root
+from .. Preparsing.Nodes.Sequence      import Sequence
+from .. Preparsing.Nodes.Star          import Star
+
+from  . Report import Report
+
+from enum import IntFlag
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ CLASS :: Grammar Reducer ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Reducer(Pass):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    start      : str
+    productive : set[str]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, start: str = '') -> None:
+
+        super().__init__()
+
+        self.start      = start
+        self.productive = set()
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Reducer('{self.start}')"
+
+    def __str__(self)  -> str:
+        return f"Reducer('{self.start}')"
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------- METHOD :: Reduce a Grammar to the Rules Reachable from its Start Symbol ---------
+    # ------------------------------------------------------------------------------------------
+    def run(self, root: Root) -> Root:
+
+        self.rules = root.rules()
+        start      = self.start or next(iter(self.rules), '')
+
+        if start not in self.rules:
+            raise NameError(f"undefined start symbol '{start}'")
+
+        self.productive = set()
+
+        while len(self.productive) < len(self.rules):
+
+            productive = {
+                name for name, definition in self.rules.items()
+                if self.derives(definition.productions)
+            }
+
+            if productive == self.productive:
+                break
+
+            self.productive = productive
+
+        if start not in self.productive:
+            raise SyntaxError(f"start symbol '{start}' derives no string of terminals")
+
+        pruned = { name: self.rules[name].accept(self) for name in self.rules }
+        order  = [ start, *(name for name in pruned if name != start) ]
+        kept   = self.reachable(start, pruned)
+
+        return Root(root.origin, Sequence(*(pruned[name] for name in order if name in kept)))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------- METHOD :: Reduce a Grammar and Report what was Removed -----------------
+    # ------------------------------------------------------------------------------------------
+    def report(self, root: Root, tokentype: type[IntFlag]) -> tuple[Root, Report]:
+
+        reduced = self.run(root)
+        names   = { self.name(d) for d in reduced.definitions.elements }
+
+        before  = len(Generator(root, tokentype).generate().encode())
+        after   = len(Generator(reduced, tokentype).generate().encode())
+
+        removed = [ name for name in self.rules if name not in names ]
+        start   = self.name(reduced.definitions.elements[0])
+
+        return reduced, Report(root.origin, start, removed, before, after)
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------ HELPER :: Whether an Expression can Derive a String of Terminals ------------
+    # ------------------------------------------------------------------------------------------
+    def derives(self, node: Expression) -> bool:
+
+        match node:
+
+            case Identifier():
+                return node.token.literal not in self.rules or node.token.literal in self.productive
+
+            case Sequence():
+                return any(self.derives(e) for e in node.elements)
+
+            case Alternation():
+                return any(self.derives(e) for e in node.expressions)
+
+            case Concatenation():
+                return all(self.derives(e) for e in node.expressions)
+
+            case Star() | Optional() | Negative():
+                return True
+
+            case Plus() | Gather() | Parenthetical() | Production() | Assignment():
+                return self.derives(node.expression)
+
+        return True
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------- HELPER :: Names of the Rules Reachable from a Start Symbol ---------------
+    # ------------------------------------------------------------------------------------------
+    def reachable(self, start: str, rules: dict[str, Definition]) -> set[str]:
+
+        reached, pending = set(), [ start ]
+
+        while pending:
+
+            if (name := pending.pop()) in reached:
+                continue
+
+            reached.add(name)
+            pending.extend(self.referenced(rules[name].productions) - reached)
+
+        return reached
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------- HELPER :: Rules Referenced by an Expression, Ignoring Outputs --------------
+    # ------------------------------------------------------------------------------------------
+    def referenced(self, node: Expression) -> set[str]:
+
+        match node:
+
+            case Identifier():
+                return { node.token.literal } & self.rules.keys()
+
+            case Sequence():
+                return set().union(*map(self.referenced, node.elements))
+
+            case Alternation() | Concatenation():
+                return set().union(*map(self.referenced, node.expressions))
+
+            case Gather():
+                return self.referenced(node.expression) | self.referenced(node.separator)
+
+            case Star() | Plus() | Optional() | Negative() | Parenthetical() | Production() | Assignment():
+                return self.referenced(node.expression)
+
+        return set()
+
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------- HELPER :: Whether an Expression Binds any Names ---------------------
+    # ------------------------------------------------------------------------------------------
+    def binds(self, node: Expression) -> bool:
+
+        match node:
+
+            case Assignment():
+                return True
+
+            case Alternation() | Concatenation():
+                return any(map(self.binds, node.expressions))
+
+            case Star() | Plus() | Gather() | Optional() | Parenthetical():
+                return self.binds(node.expression)
+
+        return False
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Alternation ------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_alternation(self, node: Alternation) -> Node:
+
+        if self.terminal(node):
+            return node
+
+        expressions = [ e.accept(self) for e in node.expressions if self.derives(e) ]
+        return Alternation(tuple(expressions)) if len(expressions) > 1 else expressions[0]
+
+
+    # ------------------------------------------------------------------------------------------
+    # ----------------------------- VISITOR :: Visit Concatenation -----------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_concatenation(self, node: Concatenation) -> Node:
+
+        return Concatenation(tuple(
+            e.accept(self) for e in node.expressions
+            if not isinstance(e, (Star, Optional)) or self.derives(e.expression) or self.binds(e)
+        ))
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------ VISITOR :: Visit Definition -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def visit_definition(self, node: Definition) -> Node:
+
+        if self.name(node) not in self.productive:
+            return node
+
+        productions = [
+            Production(expression.accept(self), output)
+            for expression, output in self.alternatives(node.productions)
+            if self.derives(expression)
+        ]
+
+        return Definition(node.signature, Sequence(*productions))
\ No newline at end of file
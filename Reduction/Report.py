@@ -0,0 +1,44 @@
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- REDUCTION :: Reduction Report ----------------------------------
+# --------------------------------------------------------------------------------------------------
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------------------- CLASS :: Reduction Report ------------------------------------
+# --------------------------------------------------------------------------------------------------
+class Report(object):
+
+    # ------------------------------------------------------------------------------------------
+    # -------------------------------- ATTRIBUTES :: Attributes --------------------------------
+    # ------------------------------------------------------------------------------------------
+    origin  : str
+    start   : str
+    removed : list[str]
+    before  : int
+    after   : int
+
+
+    # ------------------------------------------------------------------------------------------
+    # ------------------------------- CONSTRUCTOR :: Constructor -------------------------------
+    # ------------------------------------------------------------------------------------------
+    def __init__(self, origin: str, start: str, removed: list[str], before: int, after: int) -> None:
+
+        self.origin  = origin
+        self.start   = start
+        self.removed = removed
+        self.before  = before
+        self.after   = after
+
+
+    # ------------------------------------------------------------------------------------------
+    # --------------------------- STRINGIFICATION :: Stringification ---------------------------
+    # ------------------------------------------------------------------------------------------
+    def __repr__(self) -> str:
+        return f"Report('{self.origin}', '{self.start}', {len(self.removed)}, {self.before - self.after})"
+
+    def __str__(self)  -> str:
+        return (
+            f"{self.origin} from '{self.start}': "
+            f"removed {len(self.removed)} rules ({', '.join(self.removed) or 'none'}), "
+            f"{self.before - self.after} of {self.before} bytes"
+        )
\ No newline at end of file
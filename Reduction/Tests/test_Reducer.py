@@ -0,0 +1,50 @@
+# --------------------------------------------------------------------------------------------------
+# ---------------------------------------- TESTS :: Reducer ----------------------------------------
+# --------------------------------------------------------------------------------------------------
+from ... Parsing.Parser.Generator import Generator
+from ..  Reducer                  import Reducer
+
+import pytest
+
+GRAMMAR = (
+    "s :=\n    | a=item b=loop { Two(a, b) }\n    | a=item { One(a) }\n"
+    "item :=\n    | a=NUMBER { a }\n"
+    "loop :=\n    | 'x' a=loop { a }\n"
+    "orphan :=\n    | IDENTIFIER\n"
+)
+
+NAMESPACE = { 'One': lambda a: ('one', a.literal), 'Two': lambda a, b: ('two', a.literal, b) }
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------- TEST :: Unproductive and Unreachable Rules are Removed, and no More ---------------
+# --------------------------------------------------------------------------------------------------
+def test_reduced(grammar, tokens, tokentype):
+
+    reduced = Reducer().run(root := grammar(GRAMMAR))
+
+    assert list(reduced.rules()) == [ 's', 'item' ]
+    assert len(reduced.rules()['s'].productions.elements) == 1
+
+    original = Generator(root, tokentype).load(NAMESPACE)
+    parser   = Generator(reduced, tokentype).load(NAMESPACE)
+
+    for source in ('3', '3 x', 'x'):
+        assert parser(tokens(source)).parse() == original(tokens(source)).parse()
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------- TEST :: Another Start Symbol Specializes the Grammar to it -------------------
+# --------------------------------------------------------------------------------------------------
+def test_specialized(grammar, tokens, tokentype):
+
+    reduced = Reducer('item').run(grammar(GRAMMAR))
+
+    assert list(reduced.rules()) == [ 'item' ]
+    assert Generator(reduced, tokentype).load()(tokens('7')).parse().literal == '7'
+
+    with pytest.raises(NameError):
+        Reducer('nowhere').run(grammar(GRAMMAR))
+
+    with pytest.raises(SyntaxError):
+        Reducer('loop').run(grammar(GRAMMAR))
\ No newline at end of file
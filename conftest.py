@@ -0,0 +1,114 @@
+# --------------------------------------------------------------------------------------------------
+# ------------------------------------ TESTS :: Shared Fixtures ------------------------------------
+# --------------------------------------------------------------------------------------------------
+from . Preparsing.Parser.Parser import Parser as Preparser
+from . Preparsing.Nodes.Root    import Root
+
+from enum   import IntFlag
+from enum   import auto
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+import os
+import pytest
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------- CLASS :: Tokentype of Test Inputs --------------------------------
+# --------------------------------------------------------------------------------------------------
+class Kind(IntFlag):
+
+    IDENTIFIER = auto()
+    NUMBER     = auto()
+    STRING     = auto()
+    OPERATOR   = auto()
+    INDENT     = auto()
+    DEDENT     = auto()
+    EOF        = auto()
+
+
+# --------------------------------------------------------------------------------------------------
+# --------------------------------- CLASS :: Token of Test Inputs ----------------------------------
+# --------------------------------------------------------------------------------------------------
+class Word(NamedTuple):
+
+    type    : Kind
+    literal : str
+
+
+# --------------------------------------------------------------------------------------------------
+# -------------------------- FUNCTION :: Kind of a Whitespace-Split Word ---------------------------
+# --------------------------------------------------------------------------------------------------
+def kind(word: str) -> Kind:
+
+    if word in ('{', '}'):    # stand-ins for the lexer's indentation tokens
+        return Kind.INDENT if word == '{' else Kind.DEDENT
+
+    if word.isdigit():
+        return Kind.NUMBER
+
+    if word.isidentifier():
+        return Kind.IDENTIFIER
+
+    return Kind.STRING if word[0] in '"\'' else Kind.OPERATOR
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------------------ FIXTURE :: Tokentype of Test Inputs -------------------------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def tokentype() -> type[Kind]:
+    return Kind
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------- FIXTURE :: Tokens of a Whitespace-Separated Input ------------------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def tokens() -> Callable[[str], list[Any]]:
+    return lambda source: [ *(Word(kind(word), word) for word in source.split()), Word(Kind.EOF, '') ]
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------------------- FIXTURE :: Parsed Grammar from its Text -----------------------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def grammar(tmp_path: Any) -> Callable[[str], Root]:
+
+    def parse(text: str, name: str = 'grammar.pgram') -> Root:
+
+        (path := tmp_path / name).write_text(text)
+        return Preparser(str(path)).parse()
+
+    return parse
+
+
+# --------------------------------------------------------------------------------------------------
+# ----------------------- FIXTURE :: Grammar Files Shipped with the Package ------------------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def shipped() -> list[str]:
+
+    directory = os.path.join(os.path.dirname(__file__), 'Grammars')
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.pgram'))
+
+
+# --------------------------------------------------------------------------------------------------
+# ---------------- FIXTURE :: Arithmetic Grammar with a Two-Level Precedence Tower -----------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def arithmetic() -> str:
+    return (
+        "expr :=\n    | a=term op='+' b=expr { Bin(a, op, b) }\n    | term\n"
+        "term :=\n    | a=term op='*' b=atom { Bin(a, op, b) }\n    | atom\n"
+        "atom :=\n    | a=NUMBER { Num(a) }\n    | '(' a=expr ')' { a }\n"
+    )
+
+
+# --------------------------------------------------------------------------------------------------
+# ------------------ FIXTURE :: Constructors of the Arithmetic Grammar's Outputs -------------------
+# --------------------------------------------------------------------------------------------------
+@pytest.fixture
+def constructors() -> dict[str, Callable[..., Any]]:
+    return { 'Bin': lambda a, op, b: (a, op.literal, b), 'Num': lambda a: int(a.literal) }
\ No newline at end of file